@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Bridge API Load Benchmark
+
+Drives the plan, risk-score and curve-eval endpoints with randomized
+model payloads at several concurrency levels and reports throughput and
+p50/p95/p99 latency. Two transports are measured:
+
+- ``asgi``: requests go through httpx's in-process ASGI transport, so the
+  numbers cover routing, validation, the bridge client and serialization
+  without sockets
+- ``uvicorn``: the app is started as a separate uvicorn process and driven
+  over a real HTTP connection pool
+
+Load is closed-loop: ``concurrency`` workers each send their next request
+as soon as the previous one finishes. Payloads are drawn fresh for every
+request so the result cache does not turn the run into a cache benchmark.
+
+Usage:
+    python benchmarks/bench_api.py
+    python benchmarks/bench_api.py --transports asgi --concurrency 1,32 --requests 5000
+    python benchmarks/bench_api.py --url http://localhost:8010 --output api.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ROOT = Path(__file__).parent.parent
+ENDPOINTS = ("plan", "risk-score", "curve-eval")
+
+
+def make_plan(rng: random.Random) -> dict:
+    return {
+        "user_preferences": {
+            "desired_size": rng.randrange(10**6, 10**11),
+            "slippage_tolerance": rng.randrange(10, 500),
+            "risk_appetite": rng.randrange(0, 256),
+            "preferred_hold_time": rng.randrange(60, 86_400),
+        },
+        "user_history": {
+            "recent_pnl": rng.randrange(-10**9, 10**9),
+            "win_rate": rng.randrange(0, 10_001),
+            "avg_hold_time": rng.randrange(60, 86_400),
+            "total_trades": rng.randrange(0, 5_000),
+        },
+        "curve_state": {
+            "current_price": rng.randrange(1, 10**8),
+            "liquidity_depth": rng.randrange(10**6, 10**12),
+            "volatility": rng.randrange(0, 1_000),
+            "recent_volume": rng.randrange(0, 10**12),
+        },
+    }
+
+
+def make_risk(rng: random.Random) -> dict:
+    return {
+        "portfolio_context": {
+            "total_capital": rng.randrange(10**6, 10**11),
+            "current_exposure": rng.randrange(0, 10**11),
+            "diversification_score": rng.randrange(0, 256),
+            "leverage_ratio": rng.randrange(10_000, 50_000),
+        },
+        "performance_history": {
+            "total_pnl": rng.randrange(-10**9, 10**9),
+            "sharpe_ratio": rng.randrange(-200, 300),
+            "max_drawdown": rng.randrange(0, 10_000),
+            "consistency_score": rng.randrange(0, 256),
+        },
+        "market_conditions": {
+            "curve_volatility": rng.randrange(0, 1_000),
+            "liquidity_risk": rng.randrange(0, 256),
+            "market_sentiment": rng.randrange(-128, 128),
+        },
+    }
+
+
+def make_curve(rng: random.Random) -> dict:
+    max_size = rng.randrange(10**6, 10**10)
+    return {
+        "sizing_preferences": {
+            "target_size": rng.randrange(max_size // 10, max_size + 1),
+            "min_size": max_size // 10,
+            "max_size": max_size,
+            "capital_allocation_pct": rng.randrange(0, 101),
+        },
+        "user_constraints": {
+            "max_slippage_bps": rng.randrange(10, 500),
+            "time_constraint_sec": rng.randrange(0, 3_600),
+            "priority_level": rng.randrange(0, 256),
+        },
+        "curve_metrics": {
+            "current_price": rng.randrange(1, 10**8),
+            "price_change_24h": rng.randrange(-5_000, 5_000),
+            "liquidity_depth": rng.randrange(10**6, 10**12),
+            "buy_pressure": rng.randrange(0, 256),
+            "sell_pressure": rng.randrange(0, 256),
+        },
+    }
+
+
+PAYLOADS = {"plan": make_plan, "risk-score": make_risk, "curve-eval": make_curve}
+
+
+async def run_load(client: httpx.AsyncClient, endpoint: str, requests: int, concurrency: int, seed: int) -> dict:
+    """Send ``requests`` requests from ``concurrency`` closed-loop workers"""
+    rng = random.Random(seed)
+    payloads = [PAYLOADS[endpoint](rng) for _ in range(requests)]
+    path = f"/api/v1/arcium/{endpoint}"
+    latencies = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < requests:
+            payload = payloads[next_index]
+            next_index += 1
+            start = time.perf_counter()
+            try:
+                response = await client.post(path, json=payload)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(max(latencies) * 1000, 3),
+    }
+
+
+async def bench_client(client: httpx.AsyncClient, transport: str, args) -> list:
+    results = []
+    for endpoint in args.endpoints.split(","):
+        # Warm up lazy imports, caches and the connection pool
+        await run_load(client, endpoint, args.warmup, 4, seed=args.seed - 1)
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            result = await run_load(client, endpoint, args.requests, concurrency, args.seed)
+            result["transport"] = transport
+            results.append(result)
+            print(
+                f"{transport:>8} {endpoint:>10} c={concurrency:<4} "
+                f"{result['throughput_rps']:>9,.1f} req/s  "
+                f"p50 {result['p50_ms']:7.2f} ms  p95 {result['p95_ms']:7.2f} ms  "
+                f"p99 {result['p99_ms']:7.2f} ms  errors {result['errors']}"
+            )
+    return results
+
+
+async def bench_asgi(args) -> list:
+    from src.api.server import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await bench_client(client, "asgi", args)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(port: int) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.api.server:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=ROOT,
+        # The app logs every request to stdout; keep it out of the report
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("uvicorn did not become healthy within 30s")
+
+
+async def bench_http(url: str, transport: str, args) -> list:
+    limits = httpx.Limits(max_connections=max(int(c) for c in args.concurrency.split(",")))
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        return await bench_client(client, transport, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the bridge API")
+    parser.add_argument("--transports", type=str, default="asgi,uvicorn", help="Comma-separated: asgi, uvicorn")
+    parser.add_argument("--url", type=str, help="Benchmark an already-running server instead of starting one")
+    parser.add_argument("--endpoints", type=str, default=",".join(ENDPOINTS))
+    parser.add_argument("--concurrency", type=str, default="1,16,64", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint and concurrency level")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = []
+    if args.url:
+        results += asyncio.run(bench_http(args.url, "http", args))
+    else:
+        transports = args.transports.split(",")
+        if "asgi" in transports:
+            results += asyncio.run(bench_asgi(args))
+        if "uvicorn" in transports:
+            port = free_port()
+            process = start_uvicorn(port)
+            try:
+                results += asyncio.run(bench_http(f"http://127.0.0.1:{port}", "uvicorn", args))
+            finally:
+                process.terminate()
+                process.wait(timeout=10)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Confidential Payload Encoding Benchmark
+
+Compares the fixed-width binary codec (src/bridge/codec.py) with the JSON
+encoding it replaced, for each request type:
+
+- size: plaintext bytes, bytes on the wire once sealed (AES-GCM tag
+  included), and the base64 form ``ConfidentialPayload`` would carry
+- speed: encode (model -> bytes) and decode (bytes -> model) per item
+
+Usage:
+    python benchmarks/bench_codec.py
+    python benchmarks/bench_codec.py --items 50000 --output codec.json
+"""
+
+import argparse
+import base64
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge import codec
+from src.bridge.models import CurveEvalRequest, PlanRequest, RiskScoreRequest
+from benchmarks.bench_api import make_curve, make_plan, make_risk
+
+GCM_TAG_BYTES = 16
+MODELS = {
+    "plan": (PlanRequest, make_plan),
+    "risk-score": (RiskScoreRequest, make_risk),
+    "curve-eval": (CurveEvalRequest, make_curve),
+}
+
+
+def json_encode(request) -> bytes:
+    return json.dumps(request.model_dump(), separators=(",", ":")).encode()
+
+
+def per_item_us(fn, items: list) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def bench_kind(model_cls, make, items: int, rng: random.Random) -> dict:
+    requests = [model_cls(**make(rng)) for _ in range(items)]
+    json_blobs = [json_encode(r) for r in requests]
+    binary_blobs = [codec.encode(r) for r in requests]
+
+    def sizes(blobs: list) -> dict:
+        plaintext = sum(len(b) for b in blobs) / len(blobs)
+        sealed = plaintext + GCM_TAG_BYTES
+        return {
+            "plaintext_bytes": round(plaintext, 1),
+            "sealed_bytes": round(sealed, 1),
+            "sealed_base64_bytes": round(sum(len(base64.b64encode(b + bytes(GCM_TAG_BYTES))) for b in blobs) / len(blobs), 1),
+        }
+
+    return {
+        "json": {
+            **sizes(json_blobs),
+            "encode_us": round(per_item_us(json_encode, requests), 3),
+            "decode_us": round(per_item_us(model_cls.model_validate_json, json_blobs), 3),
+        },
+        "binary": {
+            **sizes(binary_blobs),
+            "encode_us": round(per_item_us(codec.encode, requests), 3),
+            "decode_us": round(per_item_us(lambda b: codec.decode(b, model_cls), binary_blobs), 3),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare binary and JSON payload encodings")
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = {}
+    for kind, (model_cls, make) in MODELS.items():
+        result = results[kind] = bench_kind(model_cls, make, args.items, rng)
+        for name in ("json", "binary"):
+            r = result[name]
+            print(
+                f"{kind:>10} {name:>6}  {r['plaintext_bytes']:6.1f} B plaintext  "
+                f"{r['sealed_base64_bytes']:6.1f} B sealed+base64  "
+                f"encode {r['encode_us']:6.2f} us  decode {r['decode_us']:6.2f} us"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Input Encryption Benchmark
+
+Measures payloads encrypted per second per core for the client-side
+encryption layer:
+
+- ``derive_each``: X25519 + HKDF derivation for every payload (the cost
+  the shared-secret cache avoids)
+- ``cached``: one payload at a time with the cached cipher
+- ``pooled``: one payload at a time under a fresh ephemeral key taken
+  from a pre-filled ``EphemeralKeyPool`` (the request-path cost; key
+  generation happens beforehand)
+- ``batch``: ``encrypt_batch`` on a single worker thread, so the figure is
+  per core, together with the worst event-loop stall observed meanwhile
+
+Usage:
+    python benchmarks/bench_encryption.py
+    python benchmarks/bench_encryption.py --payloads 100000 --payload-bytes 512 --output encryption.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge.encryption import InputEncryptor, associated_data, derive_cipher, public_key_bytes
+from src.bridge.key_pool import EphemeralKeyPool
+
+DERIVE_SAMPLE = 5_000
+
+
+def bench_derive_each(cluster_public: bytes, payload: bytes, count: int) -> float:
+    private_key = X25519PrivateKey.generate()
+    aad = associated_data("input", "plan")
+    start = time.perf_counter()
+    for _ in range(count):
+        derive_cipher(private_key, cluster_public).encrypt(os.urandom(12), payload, aad)
+    return count / (time.perf_counter() - start)
+
+
+def bench_cached(cluster_public: bytes, payload: bytes, count: int) -> float:
+    encryptor = InputEncryptor()
+    aad = associated_data("input", "plan")
+    start = time.perf_counter()
+    for _ in range(count):
+        encryptor.encrypt(cluster_public, payload, aad)
+    return count / (time.perf_counter() - start)
+
+
+async def bench_pooled(cluster_public: bytes, payload: bytes, count: int) -> float:
+    pool = EphemeralKeyPool(cluster_public, low_water=0, high_water=count)
+    pool.start()
+    await pool._refill
+    encryptor = InputEncryptor(key_pool=pool)
+    aad = associated_data("input", "plan")
+    start = time.perf_counter()
+    for _ in range(count):
+        encryptor.encrypt(cluster_public, payload, aad)
+    elapsed = time.perf_counter() - start
+    await pool.close()
+    return count / elapsed
+
+
+async def bench_batch(cluster_public: bytes, payload: bytes, count: int, batch_size: int, chunk_size: int) -> dict:
+    executor = ThreadPoolExecutor(max_workers=1)
+    encryptor = InputEncryptor(chunk_size=chunk_size, executor=executor)
+    aad = associated_data("input", "plan")
+    payloads = [payload] * batch_size
+    max_lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal max_lag
+        interval = 0.001
+        while running:
+            before = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_lag = max(max_lag, time.perf_counter() - before - interval)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    for _ in range(count // batch_size):
+        await encryptor.encrypt_batch(cluster_public, payloads, aad)
+    elapsed = time.perf_counter() - start
+    running = False
+    await tick
+    executor.shutdown()
+    return {
+        "payloads_per_sec": round((count // batch_size) * batch_size / elapsed),
+        "max_loop_stall_ms": round(max_lag * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark client-side input encryption")
+    parser.add_argument("--payloads", type=int, default=50_000)
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Plaintext size (a JSON-encoded plan is ~300 bytes)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    cluster_public = public_key_bytes(X25519PrivateKey.generate())
+    payload = os.urandom(args.payload_bytes)
+
+    results = {
+        "payload_bytes": args.payload_bytes,
+        "derive_each_per_sec": round(bench_derive_each(cluster_public, payload, min(args.payloads, DERIVE_SAMPLE))),
+        "cached_per_sec": round(bench_cached(cluster_public, payload, args.payloads)),
+        "pooled_per_sec": round(asyncio.run(bench_pooled(cluster_public, payload, min(args.payloads, DERIVE_SAMPLE)))),
+        "batch": asyncio.run(bench_batch(cluster_public, payload, args.payloads, args.batch_size, args.chunk_size)),
+    }
+
+    print(f"Derive per payload:        {results['derive_each_per_sec']:>9,} payloads/s")
+    print(f"Cached shared secret:      {results['cached_per_sec']:>9,} payloads/s")
+    print(f"Pooled ephemeral key:      {results['pooled_per_sec']:>9,} payloads/s")
+    print(
+        f"Batch on one worker:       {results['batch']['payloads_per_sec']:>9,} payloads/s per core "
+        f"(max event loop stall {results['batch']['max_loop_stall_ms']} ms)"
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
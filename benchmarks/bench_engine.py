@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Vectorized Engine Benchmark
+
+Measures throughput (rows/second) of the NumPy engine for all three
+simulated computations at 1k, 100k and 10M rows, with the scalar path
+as a baseline on the smaller sizes.
+
+Usage:
+    python benchmarks/bench_engine.py
+    python benchmarks/bench_engine.py --rows 1000,100000 --output engine.json
+
+Note: 10M rows needs roughly 2 GB of memory for the curve evaluation columns.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge import engine
+from src.bridge.arcium_client import ArciumBridgeClient
+
+SCALAR_MAX_ROWS = 100_000
+
+
+def make_plan_inputs(rng: np.random.Generator, rows: int) -> engine.PlanInputs:
+    return engine.PlanInputs(
+        desired_size=rng.integers(0, 10**11, rows),
+        risk_appetite=rng.integers(0, 256, rows),
+        recent_pnl=rng.integers(-10**9, 10**9, rows),
+        win_rate=rng.integers(0, 10001, rows),
+        volatility=rng.integers(0, 1000, rows),
+    )
+
+
+def make_risk_inputs(rng: np.random.Generator, rows: int) -> engine.RiskInputs:
+    return engine.RiskInputs(
+        total_capital=rng.integers(0, 10**11, rows),
+        current_exposure=rng.integers(0, 10**11, rows),
+        total_pnl=rng.integers(-10**9, 10**9, rows),
+        sharpe_ratio=rng.integers(-200, 300, rows),
+        curve_volatility=rng.integers(0, 1000, rows),
+    )
+
+
+def make_curve_inputs(rng: np.random.Generator, rows: int) -> engine.CurveInputs:
+    max_size = rng.integers(1, 10**10, rows)
+    return engine.CurveInputs(
+        target_size=rng.integers(0, 10**10, rows),
+        min_size=max_size // 10,
+        max_size=max_size,
+        time_constraint_sec=rng.integers(0, 3600, rows),
+        priority_level=rng.integers(0, 256, rows),
+        current_price=rng.integers(1, 10**9, rows),
+        price_change_24h=rng.integers(-5000, 5000, rows),
+        liquidity_depth=rng.integers(0, 4 * 10**10, rows),
+        buy_pressure=rng.integers(0, 1000, rows),
+        sell_pressure=rng.integers(0, 1000, rows),
+    )
+
+
+def scalar_plan(client: ArciumBridgeClient, inputs: engine.PlanInputs):
+    from src.bridge.models import UserPreferences, UserHistory, CurveState
+
+    rows = zip(*(column.tolist() for column in inputs))
+    triples = [
+        (
+            UserPreferences(desired_size=ds, slippage_tolerance=0, risk_appetite=ra, preferred_hold_time=0),
+            UserHistory(recent_pnl=pnl, win_rate=wr, avg_hold_time=0, total_trades=0),
+            CurveState(current_price=0, liquidity_depth=0, volatility=vol, recent_volume=0),
+        )
+        for ds, ra, pnl, wr, vol in rows
+    ]
+    start = time.perf_counter()
+    for prefs, hist, curve in triples:
+        client._simulate_plan(prefs, hist, curve)
+    return time.perf_counter() - start
+
+
+def scalar_risk(client: ArciumBridgeClient, inputs: engine.RiskInputs):
+    from src.bridge.models import PortfolioContext, PerformanceHistory, MarketConditions
+
+    rows = zip(*(column.tolist() for column in inputs))
+    triples = [
+        (
+            PortfolioContext(total_capital=cap, current_exposure=exp, diversification_score=0, leverage_ratio=0),
+            PerformanceHistory(total_pnl=pnl, sharpe_ratio=sharpe, max_drawdown=0, consistency_score=0),
+            MarketConditions(curve_volatility=vol, liquidity_risk=0, market_sentiment=0),
+        )
+        for cap, exp, pnl, sharpe, vol in rows
+    ]
+    start = time.perf_counter()
+    for portfolio, performance, market in triples:
+        client._simulate_risk_score(portfolio, performance, market)
+    return time.perf_counter() - start
+
+
+def scalar_curve(client: ArciumBridgeClient, inputs: engine.CurveInputs):
+    from src.bridge.models import SizingPreferences, UserConstraints, CurveMetrics
+
+    rows = zip(*(column.tolist() for column in inputs))
+    triples = [
+        (
+            SizingPreferences(target_size=target, min_size=low, max_size=high, capital_allocation_pct=0),
+            UserConstraints(max_slippage_bps=0, time_constraint_sec=time_sec, priority_level=priority),
+            CurveMetrics(
+                current_price=price,
+                price_change_24h=change,
+                liquidity_depth=depth,
+                buy_pressure=buy,
+                sell_pressure=sell,
+            ),
+        )
+        for target, low, high, time_sec, priority, price, change, depth, buy, sell in rows
+    ]
+    start = time.perf_counter()
+    for sizing, constraints, metrics in triples:
+        client._simulate_curve_evaluation(sizing, constraints, metrics)
+    return time.perf_counter() - start
+
+
+CASES = [
+    ("plan", make_plan_inputs, engine.compute_plans, scalar_plan),
+    ("risk-score", make_risk_inputs, engine.compute_risk_scores, scalar_risk),
+    ("curve-eval", make_curve_inputs, engine.compute_curve_evaluations, scalar_curve),
+]
+
+
+def time_best(func, repeats: int) -> float:
+    """Best-of-N wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the vectorized simulation engine")
+    parser.add_argument("--rows", default="1000,100000,10000000", help="Comma-separated row counts")
+    parser.add_argument("--repeats", type=int, default=3, help="Best-of-N repeats per measurement")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    client = ArciumBridgeClient()
+    results = []
+
+    print(f"{'computation':<12} {'rows':>10} {'engine rows/s':>16} {'scalar rows/s':>16}")
+    for rows in [int(r) for r in args.rows.split(",")]:
+        for name, make_inputs, compute, scalar_compute in CASES:
+            inputs = make_inputs(rng, rows)
+            elapsed = time_best(lambda: compute(inputs), args.repeats)
+            result = {"computation": name, "rows": rows, "engine_rows_per_sec": rows / elapsed}
+
+            if rows <= SCALAR_MAX_ROWS:
+                result["scalar_rows_per_sec"] = rows / scalar_compute(client, inputs)
+
+            scalar = result.get("scalar_rows_per_sec")
+            scalar_text = f"{scalar:>16,.0f}" if scalar else f"{'-':>16}"
+            print(f"{name:<12} {rows:>10,} {result['engine_rows_per_sec']:>16,.0f} {scalar_text}")
+            results.append(result)
+            del inputs
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"benchmark": "engine", "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
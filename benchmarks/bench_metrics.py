@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Stage Metrics Overhead Benchmark
+
+Measures the cost of per-stage latency recording: a single histogram
+observation, a Stage context manager, and the full per-request sequence
+(request timing context, validation, submission and serialization stages)
+that the middleware and bridge client perform on every call.
+
+Usage:
+    python benchmarks/bench_metrics.py
+    python benchmarks/bench_metrics.py --iterations 500000 --output metrics.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import metrics
+from src.utils.metrics import (
+    STAGE_SECONDS,
+    RequestTiming,
+    Stage,
+    current_request,
+    mark_handler_end,
+    mark_handler_start,
+    observe_stage,
+)
+
+# Target from the request: instrumentation must stay under a few microseconds per request
+BUDGET_US = 5.0
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    fn(iterations)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def loop_baseline(iterations: int):
+    for _ in range(iterations):
+        pass
+
+
+def loop_observe(iterations: int):
+    observe = STAGE_SECONDS.observe
+    labels = ("risk-score", "submission", metrics.OK)
+    for _ in range(iterations):
+        observe(0.001, labels)
+
+
+def loop_stage(iterations: int):
+    for _ in range(iterations):
+        with Stage("risk-score", "submission"):
+            pass
+
+
+def loop_request(iterations: int):
+    """Everything instrumentation adds to one request"""
+    for _ in range(iterations):
+        timing = RequestTiming(time.perf_counter_ns())
+        token = current_request.set(timing)
+        mark_handler_start("risk-score")
+        with Stage("risk-score", "submission"):
+            pass
+        mark_handler_end()
+        observe_stage(timing.computation_type, "serialization", timing.handler_end_ns)
+        current_request.reset(token)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark stage metrics overhead")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    baseline = per_call_us(loop_baseline, args.iterations)
+    results = {
+        "iterations": args.iterations,
+        "observe_us": round(per_call_us(loop_observe, args.iterations) - baseline, 3),
+        "stage_us": round(per_call_us(loop_stage, args.iterations) - baseline, 3),
+        "request_us": round(per_call_us(loop_request, args.iterations) - baseline, 3),
+        "budget_us": BUDGET_US,
+    }
+    results["within_budget"] = results["request_us"] < BUDGET_US
+
+    print(f"Histogram observe:          {results['observe_us']:6.3f} us")
+    print(f"Stage context manager:      {results['stage_us']:6.3f} us")
+    print(f"Per-request instrumentation: {results['request_us']:5.3f} us (budget {BUDGET_US} us)")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    sys.exit(0 if results["within_budget"] else 1)
+
+
+if __name__ == "__main__":
+    main()
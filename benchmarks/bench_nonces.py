@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Nonce Replay Store Benchmark
+
+Measures insert and lookup rates (fresh nonces and replays) and resident
+memory for the time-bucketed nonce store at 1M and 10M nonces per window,
+with and without the Bloom pre-filter. Nonces arrive at a steady rate
+across one retention window, so every time bucket is filled.
+
+Usage:
+    python benchmarks/bench_nonces.py
+    python benchmarks/bench_nonces.py --nonces 1000000 --output nonces.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge.nonces import NonceStore
+
+RETENTION_SEC = 330.0
+LOOKUP_SAMPLE = 1_000_000
+
+
+class SteppedClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def rss_bytes() -> int:
+    """Current resident set size (falls back to peak RSS off Linux)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def bench(count: int, bloom_bits_per_nonce: int) -> dict:
+    gc.collect()
+    rss_before = rss_bytes()
+    clock = SteppedClock()
+    store = NonceStore(
+        retention_sec=RETENTION_SEC,
+        max_nonces=count,
+        bloom_bits_per_nonce=bloom_bits_per_nonce,
+        clock=clock,
+    )
+    per_bucket = store.bucket_capacity
+
+    start = time.perf_counter()
+    for i in range(count):
+        clock.now = (i // per_bucket) * store.bucket_sec
+        store.add(f"nonce-{i:012d}")
+    insert_sec = time.perf_counter() - start
+
+    sample = min(count, LOOKUP_SAMPLE)
+    start = time.perf_counter()
+    for i in range(sample):
+        f"nonce-{i:012d}" in store
+    replay_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(sample):
+        f"fresh-{i:012d}" in store
+    fresh_sec = time.perf_counter() - start
+
+    result = {
+        "nonces": count,
+        "bloom_bits_per_nonce": bloom_bits_per_nonce,
+        "inserts_per_sec": round(count / insert_sec),
+        "replay_lookups_per_sec": round(sample / replay_sec),
+        "fresh_lookups_per_sec": round(sample / fresh_sec),
+        "budget_bytes": store.memory_bytes,
+        "rss_delta_bytes": rss_bytes() - rss_before,
+        "bytes_per_nonce": round(store.memory_bytes / count, 1),
+    }
+    del store
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the nonce replay store")
+    parser.add_argument("--nonces", type=str, default="1000000,10000000", help="Comma-separated window sizes")
+    parser.add_argument("--bloom", type=str, default="0,10", help="Comma-separated Bloom bits per nonce")
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = []
+    for count in (int(n) for n in args.nonces.split(",")):
+        for bloom in (int(b) for b in args.bloom.split(",")):
+            result = bench(count, bloom)
+            results.append(result)
+            print(
+                f"{count:>11,} nonces, bloom={bloom:>2}: "
+                f"insert {result['inserts_per_sec']:>9,}/s, "
+                f"replay lookup {result['replay_lookups_per_sec']:>9,}/s, "
+                f"fresh lookup {result['fresh_lookups_per_sec']:>9,}/s, "
+                f"budget {result['budget_bytes'] / 2**20:7.1f} MiB, "
+                f"RSS +{result['rss_delta_bytes'] / 2**20:7.1f} MiB"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Priority Scheduling Benchmark
+
+Interactive latency under a saturating bulk load. The bridge client runs
+in-process on the fake MXE backend with an admission limit on curve-eval:
+
+- bulk: ``--bulk-workers`` closed-loop callers in the bulk class keep the
+  admission queue full (a backtest)
+- interactive: open-loop Poisson arrivals at ``--interactive-rate`` per
+  second (users waiting on a result)
+
+Two modes are compared:
+
+- ``fifo``: interactive requests are sent as bulk, so they wait in arrival
+  order behind the backlog (the behaviour without traffic classes)
+- ``wfq``: interactive requests declare their class and are scheduled by
+  weighted fair queuing
+
+Usage:
+    python benchmarks/bench_priority.py
+    python benchmarks/bench_priority.py --duration 20 --concurrency 8 --output priority.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge.admission import BULK, INTERACTIVE, current_traffic_class
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.models import CurveEvalRequest
+from src.config.settings import Settings
+from benchmarks.bench_api import make_curve
+
+
+def make_client(args) -> ArciumBridgeClient:
+    return ArciumBridgeClient(Settings(
+        arcium_backend="fake",
+        cache_enabled=False,
+        fake_mxe_submit_latency_ms=0,
+        fake_mxe_compute_latency_ms=args.compute_ms,
+        fake_mxe_latency_sigma=0.3,
+        fake_mxe_seed=args.seed,
+        admission_concurrency_curve_eval=args.concurrency,
+        admission_queue_curve_eval=100_000,
+        admission_queue_timeout_sec=600,
+        log_info_sample_rate=0.0,
+    ))
+
+
+async def curve_eval(client: ArciumBridgeClient, request: CurveEvalRequest, traffic_class: str) -> float:
+    current_traffic_class.set(traffic_class)
+    start = time.perf_counter()
+    await client.get_curve_evaluation(request.sizing_preferences, request.user_constraints, request.curve_metrics)
+    return time.perf_counter() - start
+
+
+def percentiles_ms(latencies: list) -> dict:
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    return {"p50_ms": round(float(p50), 2), "p95_ms": round(float(p95), 2), "p99_ms": round(float(p99), 2)}
+
+
+async def run_mode(mode: str, args) -> dict:
+    client = make_client(args)
+    await client.start()
+    rng = random.Random(args.seed)
+    requests = [CurveEvalRequest(**make_curve(rng)) for _ in range(512)]
+    interactive_class = INTERACTIVE if mode == "wfq" else BULK
+    deadline = time.perf_counter() + args.duration
+    bulk_done = 0
+    interactive = []
+
+    async def bulk_worker(worker: int):
+        nonlocal bulk_done
+        i = worker
+        while time.perf_counter() < deadline:
+            await curve_eval(client, requests[i % len(requests)], BULK)
+            bulk_done += 1
+            i += args.bulk_workers
+
+    async def interactive_arrivals():
+        tasks = []
+        i = 0
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(rng.expovariate(args.interactive_rate))
+            tasks.append(asyncio.ensure_future(curve_eval(client, requests[i % len(requests)], interactive_class)))
+            i += 1
+        interactive.extend(await asyncio.gather(*tasks))
+
+    start = time.perf_counter()
+    await asyncio.gather(interactive_arrivals(), *(bulk_worker(w) for w in range(args.bulk_workers)))
+    elapsed = time.perf_counter() - start
+    stats = client.stats()["admission"]["curve-eval"]
+    await client.close()
+    return {
+        "mode": mode,
+        "interactive": {"requests": len(interactive), **percentiles_ms(interactive)},
+        "bulk_throughput_rps": round(bulk_done / elapsed, 1),
+        "aged": stats["aged"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interactive latency under bulk load, FIFO vs weighted fair queuing")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode")
+    parser.add_argument("--concurrency", type=int, default=8, help="Admission limit for curve-eval")
+    parser.add_argument("--compute-ms", type=float, default=20.0, help="Median fake MXE computation time")
+    parser.add_argument("--bulk-workers", type=int, default=64)
+    parser.add_argument("--interactive-rate", type=float, default=20.0, help="Interactive arrivals per second")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = []
+    for mode in ("fifo", "wfq"):
+        result = asyncio.run(run_mode(mode, args))
+        results.append(result)
+        r = result["interactive"]
+        print(
+            f"{mode:>5}  interactive p50 {r['p50_ms']:8.2f} ms  p95 {r['p95_ms']:8.2f} ms  "
+            f"p99 {r['p99_ms']:8.2f} ms  ({r['requests']} requests)  "
+            f"bulk {result['bulk_throughput_rps']:7.1f} req/s"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
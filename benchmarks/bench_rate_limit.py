@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Per-Client Rate Limiter Benchmark
+
+Decision cost and memory of the token bucket rate limiter
+(src/bridge/rate_limit.py) as the number of client ids grows:
+
+- ``take_us``: one charge for a random known client (refill + decision)
+- ``churn_us``: one charge for a new client id when the table is full
+  (insert + LRU eviction)
+- ``memory_bytes``: traced allocations for a full client table
+
+Usage:
+    python benchmarks/bench_rate_limit.py
+    python benchmarks/bench_rate_limit.py --clients 1000,100000 --output rate_limit.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge.errors import RateLimited
+from src.bridge.rate_limit import COST, REQUESTS, RateLimiter
+
+
+def make_limiter(clients: int) -> RateLimiter:
+    return RateLimiter(request_rate=1e9, request_burst=1e9, cost_rate=1e9, cost_burst=1e9, max_clients=clients)
+
+
+def per_call_us(limiter: RateLimiter, client_ids: list, bucket: str) -> float:
+    start = time.perf_counter()
+    for client_id in client_ids:
+        try:
+            limiter.take(client_id, bucket, 1)
+        except RateLimited:
+            pass
+    return (time.perf_counter() - start) / len(client_ids) * 1e6
+
+
+def bench_clients(clients: int, operations: int, rng: random.Random) -> dict:
+    ids = [f"evalys-component-{i}" for i in range(clients)]
+
+    tracemalloc.start()
+    limiter = make_limiter(clients)
+    for client_id in ids:
+        limiter.take(client_id, REQUESTS, 1)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    known = [rng.choice(ids) for _ in range(operations)]
+    new = [f"new-component-{i}" for i in range(operations)]
+    return {
+        "clients": clients,
+        "take_us": round(per_call_us(limiter, known, REQUESTS), 3),
+        "cost_take_us": round(per_call_us(limiter, known, COST), 3),
+        "churn_us": round(per_call_us(limiter, new, REQUESTS), 3),
+        "memory_bytes": memory,
+        "bytes_per_client": round(memory / clients, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-client rate limit decisions")
+    parser.add_argument("--clients", type=str, default="100,1000,10000,100000", help="Comma-separated client counts")
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = []
+    for clients in (int(c) for c in args.clients.split(",")):
+        result = bench_clients(clients, args.operations, rng)
+        results.append(result)
+        print(
+            f"{clients:>7} clients  take {result['take_us']:5.2f} us  "
+            f"new client {result['churn_us']:5.2f} us  "
+            f"{result['memory_bytes'] / 1024:9.1f} KiB ({result['bytes_per_client']:.0f} B/client)"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
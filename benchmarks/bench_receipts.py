@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Receipt Verification Benchmark
+
+Measures receipts verified per second on a single core: cold verification
+(Ed25519 signature + SHA256 result hash), verified-cache hits for duplicate
+receipts, and the async batch path that runs checks in a worker thread.
+
+Usage:
+    python benchmarks/bench_receipts.py
+    python benchmarks/bench_receipts.py --receipts 20000 --output receipts.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from solders.keypair import Keypair
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.bridge.models import ProofReceiptV1, ReceiptResult
+from src.bridge.receipts import ReceiptVerifier, result_hash, signing_payload
+
+
+def make_receipts(key: Keypair, count: int, output_bytes: int) -> list:
+    now = datetime.now(timezone.utc)
+    receipts = []
+    for i in range(count):
+        encrypted_output = base64.b64encode(os.urandom(output_bytes)).decode()
+        receipt = ProofReceiptV1(
+            receipt_id=f"receipt-{i}",
+            computation_id=f"computation-{i}",
+            result_hash=result_hash(encrypted_output),
+            signature="",
+            timestamp=now,
+            status="completed",
+            result=ReceiptResult(encrypted_output=encrypted_output),
+        )
+        receipt.signature = str(key.sign_message(signing_payload(receipt)))
+        receipts.append(receipt)
+    return receipts
+
+
+def rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1)
+
+
+def bench_sync(key: Keypair, receipts: list) -> dict:
+    verifier = ReceiptVerifier(str(key.pubkey()), cache_size=len(receipts))
+
+    start = time.perf_counter()
+    assert all(verifier.verify(r) for r in receipts)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert all(verifier.verify(r) for r in receipts)
+    cached = time.perf_counter() - start
+
+    return {
+        "cold_per_sec": rate(len(receipts), cold),
+        "cached_per_sec": rate(len(receipts), cached),
+    }
+
+
+async def bench_async(key: Keypair, receipts: list, chunk_size: int) -> dict:
+    # One worker thread, so the figure is per core
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        verifier = ReceiptVerifier(
+            str(key.pubkey()),
+            cache_size=len(receipts),
+            chunk_size=chunk_size,
+            executor=executor,
+        )
+        start = time.perf_counter()
+        results = await verifier.verify_receipts(receipts)
+        elapsed = time.perf_counter() - start
+    assert all(results)
+    return {"batch_per_sec": rate(len(receipts), elapsed), "chunk_size": chunk_size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark receipt verification")
+    parser.add_argument("--receipts", type=int, default=10_000, help="Receipts per run")
+    parser.add_argument("--output-bytes", type=int, default=256, help="Encrypted output size per receipt")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Receipts per worker task")
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    key = Keypair()
+    receipts = make_receipts(key, args.receipts, args.output_bytes)
+
+    results = {
+        "receipts": args.receipts,
+        "output_bytes": args.output_bytes,
+        "sync": bench_sync(key, receipts),
+        "async": asyncio.run(bench_async(key, receipts, args.chunk_size)),
+    }
+
+    print(f"Receipts: {args.receipts} ({args.output_bytes}-byte outputs), single core")
+    print(f"  cold verify:   {results['sync']['cold_per_sec']:>12,.0f} receipts/s")
+    print(f"  cached verify: {results['sync']['cached_per_sec']:>12,.0f} receipts/s")
+    print(f"  async batch:   {results['async']['batch_per_sec']:>12,.0f} receipts/s")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Response Serialization Microbenchmark
+
+Per-response cost of turning a result model into an HTTP response, for
+StrategyPlan, RiskAssessment and ExecutionRecommendation:
+
+- ``response_model``: FastAPI's path for a route declaring
+  ``response_model=`` and returning the model (validate against the
+  response field, serialize, build the Response)
+- ``jsonable_encoder``: ``jsonable_encoder`` + ``JSONResponse``, the path
+  for routes without a response model and in older FastAPI releases
+- ``model_response``: ``ModelResponse`` (src/api/responses.py), which the
+  routes now return
+
+Usage:
+    python benchmarks/bench_serialization.py
+    python benchmarks/bench_serialization.py --iterations 200000 --output serialization.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.responses import ModelResponse
+from src.bridge.models import ExecutionRecommendation, RiskAssessment, StrategyPlan
+
+RESULTS = {
+    "StrategyPlan": StrategyPlan(
+        plan_id="mxe-simulated-123",
+        recommended_mode="stealth",
+        num_slices=5,
+        slice_size_base=200_000_000,
+        timing_window_sec=120,
+        risk_level=150,
+        max_notional=1_000_000_000,
+    ),
+    "RiskAssessment": RiskAssessment(
+        overall_risk_score=120,
+        portfolio_risk=100,
+        trade_risk=200,
+        recommendation="proceed",
+    ),
+    "ExecutionRecommendation": ExecutionRecommendation(
+        recommended_size=500_000_000,
+        entry_price_target=1_000_000,
+        execution_urgency=125,
+        optimal_timing=300,
+        confidence_score=200,
+    ),
+}
+
+
+async def per_response_us(make_response, iterations: int) -> float:
+    for _ in range(1000):
+        await make_response()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await make_response()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def bench_model(model, iterations: int) -> dict:
+    field = create_model_field(name="Response", type_=type(model), mode="serialization")
+
+    async def response_model():
+        body = await serialize_response(field=field, response_content=model, dump_json=True)
+        return Response(body, media_type="application/json")
+
+    async def encoder():
+        return JSONResponse(jsonable_encoder(model))
+
+    async def model_response():
+        return ModelResponse(model)
+
+    assert (await response_model()).body == (await model_response()).body
+    return {
+        "response_model_us": round(await per_response_us(response_model, iterations), 3),
+        "jsonable_encoder_us": round(await per_response_us(encoder, iterations), 3),
+        "model_response_us": round(await per_response_us(model_response, iterations), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-response serialization cost")
+    parser.add_argument("--iterations", type=int, default=50_000)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    for name, model in RESULTS.items():
+        result = results[name] = asyncio.run(bench_model(model, args.iterations))
+        print(
+            f"{name:>23}  response_model {result['response_model_us']:6.2f} us  "
+            f"jsonable_encoder {result['jsonable_encoder_us']:6.2f} us  "
+            f"ModelResponse {result['model_response_us']:6.2f} us"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Cold Start Benchmark
+
+Measures how long a fresh process takes to serve its first successful
+request, which bounds how fast new pods can take traffic during a burst.
+Each run starts a new interpreter so nothing is cached between runs.
+
+- ``in-process``: interpreter start, ``import src.api.server``, app
+  lifespan startup and the first POST /arcium/risk-score through the ASGI
+  transport. Reported per phase.
+- ``uvicorn``: from spawning ``uvicorn src.api.server:app`` until its first
+  200 OK from /health over a socket.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --output startup.json
+"""
+
+import argparse
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).parent.parent
+
+# Runs in a fresh interpreter; prints phase timings as JSON
+CHILD = """
+import time
+start = time.perf_counter()
+import asyncio, json, sys
+import httpx
+from src.api.server import app
+imported = time.perf_counter()
+
+async def first_request():
+    async with app.router.lifespan_context(app):
+        started = time.perf_counter()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.post("/api/v1/arcium/risk-score", json=json.loads(sys.argv[1]))
+        return started, response.status_code
+
+started, status = asyncio.run(first_request())
+done = time.perf_counter()
+print(json.dumps({
+    "status": status,
+    "import_sec": imported - start,
+    "lifespan_sec": started - imported,
+    "first_request_sec": done - started,
+    "modules": len(sys.modules),
+    "solana_loaded": "solana" in sys.modules,
+    "numpy_loaded": "numpy" in sys.modules,
+}))
+"""
+
+RISK_ITEM = {
+    "portfolio_context": {
+        "total_capital": 10_000_000_000,
+        "current_exposure": 3_000_000_000,
+        "diversification_score": 180,
+        "leverage_ratio": 10000,
+    },
+    "performance_history": {
+        "total_pnl": 2_000_000,
+        "sharpe_ratio": 120,
+        "max_drawdown": 2000,
+        "consistency_score": 200,
+    },
+    "market_conditions": {
+        "curve_volatility": 400,
+        "liquidity_risk": 100,
+        "market_sentiment": 50,
+    },
+}
+
+
+def run_in_process() -> dict:
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, json.dumps(RISK_ITEM)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = time.perf_counter() - start
+    # The app logs to stdout; the timings are the last line
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+    if result["status"] != 200:
+        raise RuntimeError(f"First request returned {result['status']}")
+    result["total_sec"] = total
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_uvicorn() -> dict:
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.api.server:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning",
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                    return {"total_sec": time.perf_counter() - start}
+            except httpx.HTTPError:
+                time.sleep(0.005)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def summarize(runs: list) -> dict:
+    summary = {}
+    for key in runs[0]:
+        if key.endswith("_sec"):
+            values = [run[key] for run in runs]
+            summary[key] = {
+                "median_ms": round(statistics.median(values) * 1000, 1),
+                "min_ms": round(min(values) * 1000, 1),
+                "max_ms": round(max(values) * 1000, 1),
+            }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start to first 200 OK")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", type=str, default="in-process,uvicorn", help="Comma-separated: in-process, uvicorn")
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = {"runs": args.runs}
+    modes = args.modes.split(",")
+    if "in-process" in modes:
+        runs = [run_in_process() for _ in range(args.runs)]
+        results["in_process"] = summarize(runs)
+        results["in_process"]["modules"] = runs[-1]["modules"]
+        results["in_process"]["solana_loaded"] = runs[-1]["solana_loaded"]
+        results["in_process"]["numpy_loaded"] = runs[-1]["numpy_loaded"]
+        for key in ("import_sec", "lifespan_sec", "first_request_sec", "total_sec"):
+            print(f"in-process {key[:-4]:<14} median {results['in_process'][key]['median_ms']:7.1f} ms")
+        print(f"in-process modules loaded: {runs[-1]['modules']} (solana: {runs[-1]['solana_loaded']}, numpy: {runs[-1]['numpy_loaded']})")
+    if "uvicorn" in modes:
+        results["uvicorn"] = summarize([run_uvicorn() for _ in range(args.runs)])
+        print(f"uvicorn    spawn to 200 OK median {results['uvicorn']['total_sec']['median_ms']:7.1f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Multi-Worker Throughput Benchmark
+
+Starts the production launcher (``start_server.py --production``) with 1,
+2, ... N worker processes and drives each over HTTP with the same
+closed-loop load as bench_api.py, reporting throughput and latency per
+worker count. With more than one worker, intent and cache lookups go
+through the shared state server, so its cost is included.
+
+Scaling needs free cores: on a machine with fewer CPUs than workers (plus
+the load generator), extra workers only add context switches.
+
+Usage:
+    python benchmarks/bench_workers.py
+    python benchmarks/bench_workers.py --workers 1,2,4,8 --concurrency 64 --output workers.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.bench_api import ENDPOINTS, ROOT, free_port, run_load
+
+
+def start_launcher(port: int, workers: int) -> subprocess.Popen:
+    env = {**os.environ, "API_HOST": "127.0.0.1", "API_PORT": str(port), "LOG_LEVEL": "WARNING"}
+    process = subprocess.Popen(
+        [sys.executable, "start_server.py", "--production", "--workers", str(workers)],
+        cwd=ROOT,
+        env=env,
+        # Workers log every request to stdout; keep it out of the report
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"launcher exited with code {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("launcher did not become healthy within 60s")
+
+
+async def bench_workers(url: str, workers: int, args) -> list:
+    results = []
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        for endpoint in args.endpoints.split(","):
+            # Warm up every worker's lazy imports and the connection pool
+            await run_load(client, endpoint, args.warmup, args.concurrency, seed=args.seed - 1)
+            result = await run_load(client, endpoint, args.requests, args.concurrency, args.seed)
+            result["workers"] = workers
+            results.append(result)
+            print(
+                f"workers={workers:<3} {endpoint:>10} c={args.concurrency:<4} "
+                f"{result['throughput_rps']:>9,.1f} req/s  "
+                f"p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms  "
+                f"errors {result['errors']}"
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure API throughput by worker count")
+    parser.add_argument("--workers", type=str, default=f"1,{max(2, os.cpu_count() or 1)}", help="Comma-separated worker counts")
+    parser.add_argument("--endpoints", type=str, default=",".join(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint and worker count")
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    print(f"CPUs: {os.cpu_count()}")
+    results = []
+    for workers in (int(w) for w in args.workers.split(",")):
+        port = free_port()
+        process = start_launcher(port, workers)
+        try:
+            results += asyncio.run(bench_workers(f"http://127.0.0.1:{port}", workers, args))
+        finally:
+            process.terminate()
+            process.wait(timeout=60)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "cpus": os.cpu_count(), "results": results}, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
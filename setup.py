@@ -24,6 +24,8 @@ setup(
         "solders>=0.18.0",
         "httpx>=0.25.0",
         "aiohttp>=3.9.0",
+        "numpy>=1.24.0",
+        "cryptography>=41.0.0",
     ],
     classifiers=[
         "Development Status :: 3 - Alpha",
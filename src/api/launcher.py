@@ -0,0 +1,61 @@
+"""Production launcher: several uvicorn workers sharing one result cache and nonce store
+
+A single worker spends one CPU on routing, validation, encryption and JSON.
+``run`` starts ``API_WORKERS`` worker processes (default: one per CPU)
+behind the same listening socket. With more than one worker it first
+starts a SharedStateServer (src/bridge/shared_state.py) in this process on
+a Unix socket in a private temporary directory and passes its path to the
+workers as SHARED_STATE_SOCKET, so replay protection and the result cache
+hold across workers.
+
+On SIGTERM uvicorn stops accepting connections, waits up to
+SHUTDOWN_GRACE_SEC for in-flight requests, and each worker then gives
+running jobs the same grace period (see ``lifespan`` in server.py).
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Optional
+from ..bridge.shared_state import SharedStateServer
+from ..config.settings import get_settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def worker_count(requested: Optional[int] = None) -> int:
+    """Workers to start: the argument, else API_WORKERS, else one per CPU"""
+    return requested or get_settings().api_workers or os.cpu_count() or 1
+
+
+def run(workers: Optional[int] = None):
+    """Serve the API with ``workers`` processes; blocks until shutdown"""
+    import uvicorn
+
+    settings = get_settings()
+    workers = worker_count(workers)
+    state_dir = None
+    state_server = None
+    if workers > 1:
+        state_dir = tempfile.mkdtemp(prefix="evalys-bridge-")
+        os.chmod(state_dir, 0o700)
+        path = os.path.join(state_dir, "state.sock")
+        state_server = SharedStateServer.from_settings(path, settings)
+        state_server.start_in_thread()
+        os.environ["SHARED_STATE_SOCKET"] = path
+        logger.info("Shared state server listening: workers=%d", workers)
+    try:
+        uvicorn.run(
+            "src.api.server:app",
+            host=settings.api_host,
+            port=settings.api_port,
+            workers=workers,
+            timeout_graceful_shutdown=int(settings.shutdown_grace_sec),
+        )
+    finally:
+        if state_server is not None:
+            state_server.stop_thread()
+            os.environ.pop("SHARED_STATE_SOCKET", None)
+        if state_dir is not None:
+            shutil.rmtree(state_dir, ignore_errors=True)
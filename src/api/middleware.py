@@ -0,0 +1,152 @@
+"""ASGI middleware for the bridge API"""
+
+import cProfile
+import io
+import pstats
+import secrets
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque
+from ..utils.logger import get_logger
+from ..utils.metrics import ERROR, RequestTiming, current_request, observe_stage
+
+logger = get_logger(__name__)
+
+PROFILE_HEADER = b"x-evalys-profile"
+PROFILE_ID_HEADER = b"x-evalys-profile-id"
+
+
+class StageTimingMiddleware:
+    """
+    Times the validation and serialization stages of each request
+
+    Validation runs from request arrival until the bridge client receives
+    the parsed request; serialization runs from the client returning its
+    result until the response starts. A request rejected by validation is
+    recorded with computation_type "unknown" and outcome "error".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(time.perf_counter_ns())
+        token = current_request.set(timing)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                if timing.handler_end_ns is not None:
+                    observe_stage(timing.computation_type, "serialization", timing.handler_end_ns)
+                elif timing.computation_type is None and message["status"] == 422:
+                    observe_stage("unknown", "validation", timing.start_ns, ERROR)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles single requests with cProfile on demand (debug only)
+
+    Only installed when PROFILING_ENABLED is set, so it costs nothing
+    otherwise. A request carrying ``X-Evalys-Profile: file`` is profiled and
+    its stats written to ``output_dir/<profile_id>.prof`` (load with
+    ``python -m pstats`` or snakeviz); the id is returned in the
+    ``X-Evalys-Profile-Id`` response header. ``X-Evalys-Profile: inline``
+    replaces the response body with a text report of the top functions by
+    cumulative time.
+
+    At most ``max_per_minute`` requests are profiled, one at a time;
+    requests over the limit run normally. cProfile sees every coroutine on
+    the event loop thread, so concurrent requests appear in the profile too.
+    """
+
+    def __init__(
+        self,
+        app,
+        output_dir: str = "profiles",
+        max_per_minute: int = 6,
+        top_n: int = 40,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.app = app
+        self.output_dir = Path(output_dir)
+        self.max_per_minute = max_per_minute
+        self.top_n = top_n
+        self.clock = clock
+        self._recent: Deque[float] = deque()
+        self._active = False
+
+    def _acquire(self) -> bool:
+        """Take a profiling slot if none is active and the rate limit allows"""
+        now = self.clock()
+        while self._recent and now - self._recent[0] >= 60.0:
+            self._recent.popleft()
+        if self._active or len(self._recent) >= self.max_per_minute:
+            return False
+        self._recent.append(now)
+        self._active = True
+        return True
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode = dict(scope["headers"]).get(PROFILE_HEADER, b"").decode().lower()
+        if mode not in ("file", "inline") or not self._acquire():
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = secrets.token_hex(8)
+        profiler = cProfile.Profile()
+        held = []
+
+        async def send_profiled(message):
+            if mode == "inline":
+                # Hold the real response; the report replaces it
+                held.append(message)
+                return
+            if message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [(PROFILE_ID_HEADER, profile_id.encode())]
+            await send(message)
+
+        try:
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_profiled)
+            finally:
+                profiler.disable()
+        finally:
+            self._active = False
+
+        path = scope["path"]
+        if mode == "file":
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(self.output_dir / f"{profile_id}.prof"))
+            logger.info("Profiled request: path=%s, profile_id=%s", path, profile_id)
+            return
+
+        report = io.StringIO()
+        status = next((m["status"] for m in held if m["type"] == "http.response.start"), 500)
+        report.write(f"Profile {profile_id} for {scope['method']} {path} (response status {status})\n")
+        pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(self.top_n)
+        body = report.getvalue().encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (PROFILE_ID_HEADER, profile_id.encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,36 @@
+"""Fast JSON responses for results the bridge built itself"""
+
+from typing import Mapping, Optional
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class ModelResponse(Response):
+    """
+    JSON response rendered straight from a Pydantic model
+
+    Returning a Response from a route bypasses FastAPI's response_model
+    handling, which validates the returned model against the declared type
+    again before serializing it. Route results are models the bridge has
+    just constructed or decoded (and validated) itself, so that second pass
+    is skipped and the model is written to JSON by pydantic-core directly.
+
+    Keep ``response_model=`` on the route: it still defines the OpenAPI
+    schema, which is unchanged. Pass ``status_code`` explicitly, since the
+    route decorator's is not applied to returned Responses.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        super().__init__(content, status_code, headers, self.media_type, background)
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
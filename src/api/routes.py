@@ -1,7 +1,13 @@
 """API routes for Arcium bridge service"""
 
-from fastapi import APIRouter, HTTPException
+import contextvars
+from typing import List, Literal, Optional, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from ..bridge.admission import BULK, INTERACTIVE, current_traffic_class
 from ..bridge.arcium_client import ArciumBridgeClient
+from ..bridge.rate_limit import ANONYMOUS, COST, REQUESTS, current_budget, current_client_id, current_source_address
+from ..bridge.errors import BridgeError
+from ..bridge.jobs import Job, JobTable, JobTableFull
 from ..bridge.models import (
     UserPreferences,
     UserHistory,
@@ -15,17 +21,83 @@ from ..bridge.models import (
     UserConstraints,
     CurveMetrics,
     ExecutionRecommendation,
+    PlanBatchRequest,
+    PlanBatchResponse,
+    PlanBatchItem,
+    RiskScoreBatchRequest,
+    RiskScoreBatchResponse,
+    RiskScoreBatchItem,
+    CurveEvalBatchRequest,
+    CurveEvalBatchResponse,
+    CurveEvalBatchItem,
+    BatchItemError,
+    PlanRequest,
+    RiskScoreRequest,
+    CurveEvalRequest,
+    JobInfo,
+    IntentEnvelopeV1,
+    IntentAck,
 )
-from ..utils.logger import get_logger
+from ..config.settings import get_settings
+from ..utils.logger import get_logger, logging_stats
+from ..utils.metrics import current_request
+from .responses import ModelResponse
 
 logger = get_logger(__name__)
 router = APIRouter()
 
-# Initialize bridge client
-bridge_client = ArciumBridgeClient()
+# Initialize bridge client (shares the process-wide settings with the app)
+bridge_client = ArciumBridgeClient(get_settings())
+job_table = JobTable(
+    max_jobs=bridge_client.settings.jobs_max_entries,
+    ttl_sec=bridge_client.settings.jobs_ttl_sec,
+)
+
+
+TrafficClass = Optional[Literal["interactive", "bulk"]]
+
+
+async def interactive_by_default(x_evalys_traffic_class: TrafficClass = Header(None)):
+    """Schedule the request in the traffic class it declares, interactive if none"""
+    current_traffic_class.set(x_evalys_traffic_class or INTERACTIVE)
+
+
+async def bulk_by_default(x_evalys_traffic_class: TrafficClass = Header(None)):
+    """Schedule the request in the traffic class it declares, bulk if none"""
+    current_traffic_class.set(x_evalys_traffic_class or BULK)
+
+
+async def charge_client(request: Request, x_evalys_client_id: Optional[str] = Header(None, min_length=1, max_length=128)):
+    """Identify the calling Evalys component and charge one request to its rate limit (and its address's)"""
+    current_client_id.set(x_evalys_client_id or ANONYMOUS)
+    current_source_address.set(request.client.host if request.client is not None else None)
+    await bridge_client.charge_request()
+
 
+def _budget_headers() -> dict:
+    """Calling client's remaining rate limit budget (none when rate limiting is off)"""
+    budget = current_budget.get()
+    if not budget:
+        return {}
+    headers = {}
+    if REQUESTS in budget:
+        headers["X-Evalys-RateLimit-Requests-Remaining"] = str(int(budget[REQUESTS]))
+    if COST in budget:
+        headers["X-Evalys-RateLimit-Cost-Remaining"] = str(int(budget[COST]))
+    return headers
 
-@router.post("/arcium/plan", response_model=StrategyPlan)
+
+def _queue_headers(computation_type: str) -> dict:
+    """Live admission queue depth and recent wait in this request's class, plus the caller's remaining budget"""
+    gate = bridge_client.admission.gate(computation_type)
+    return {
+        "X-Evalys-Queue-Depth": str(gate.queued),
+        "X-Evalys-Queue-Wait-Ms": str(round(gate.avg_wait_sec(current_traffic_class.get()) * 1000)),
+        **_budget_headers(),
+    }
+
+
+@router.post("/arcium/plan", response_model=StrategyPlan, dependencies=[Depends(charge_client), Depends(interactive_by_default)])
 async def get_confidential_plan(
     user_preferences: UserPreferences,
     user_history: UserHistory,
@@ -43,13 +115,15 @@ async def get_confidential_plan(
             user_history=user_history,
             curve_state=curve_state,
         )
-        return plan
+        return ModelResponse(plan, headers=_queue_headers("plan"))
+    except BridgeError:
+        raise
     except Exception as e:
-        logger.error(f"Error getting confidential plan: {e}")
+        logger.error("Error getting confidential plan: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/arcium/risk-score", response_model=RiskAssessment)
+@router.post("/arcium/risk-score", response_model=RiskAssessment, dependencies=[Depends(charge_client), Depends(interactive_by_default)])
 async def get_risk_score(
     portfolio_context: PortfolioContext,
     performance_history: PerformanceHistory,
@@ -67,13 +141,15 @@ async def get_risk_score(
             performance_history=performance_history,
             market_conditions=market_conditions,
         )
-        return assessment
+        return ModelResponse(assessment, headers=_queue_headers("risk-score"))
+    except BridgeError:
+        raise
     except Exception as e:
-        logger.error(f"Error getting risk score: {e}")
+        logger.error("Error getting risk score: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/arcium/curve-eval", response_model=ExecutionRecommendation)
+@router.post("/arcium/curve-eval", response_model=ExecutionRecommendation, dependencies=[Depends(charge_client), Depends(interactive_by_default)])
 async def get_curve_evaluation(
     sizing_preferences: SizingPreferences,
     user_constraints: UserConstraints,
@@ -91,12 +167,217 @@ async def get_curve_evaluation(
             user_constraints=user_constraints,
             curve_metrics=curve_metrics,
         )
-        return recommendation
+        return ModelResponse(recommendation, headers=_queue_headers("curve-eval"))
+    except BridgeError:
+        raise
+    except Exception as e:
+        logger.error("Error getting curve evaluation: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _item_error(error: Exception) -> BatchItemError:
+    """Describe a per-item failure, using the spec error code when there is one"""
+    if isinstance(error, BridgeError):
+        return BatchItemError(error=error.code, message=error.message)
+    return BatchItemError(error="computation_failed", message=str(error))
+
+
+def _batch_items(item_cls, results: List[Union[object, Exception]]) -> list:
+    """Wrap per-item results or errors into batch response items, preserving order"""
+    items = []
+    for index, result in enumerate(results):
+        if isinstance(result, Exception):
+            items.append(item_cls(index=index, error=_item_error(result)))
+        else:
+            items.append(item_cls(index=index, result=result))
+    return items
+
+
+@router.post("/arcium/plan:batch", response_model=PlanBatchResponse, dependencies=[Depends(charge_client), Depends(bulk_by_default)])
+async def get_confidential_plan_batch(batch: PlanBatchRequest):
+    """
+    Get confidential execution plans for many input triples at once
+    
+    Results are returned in request order; failures of single items are
+    reported per item, while a failure of the whole submission is returned
+    as one spec error response.
+    """
+    try:
+        results = await bridge_client.get_confidential_plan_batch(batch.items)
+        return ModelResponse(
+            PlanBatchResponse(results=_batch_items(PlanBatchItem, results)),
+            headers=_queue_headers("plan"),
+        )
+    except BridgeError:
+        raise
+    except Exception as e:
+        logger.error("Error getting confidential plan batch: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/arcium/risk-score:batch", response_model=RiskScoreBatchResponse, dependencies=[Depends(charge_client), Depends(bulk_by_default)])
+async def get_risk_score_batch(batch: RiskScoreBatchRequest):
+    """
+    Get confidential risk assessments for many input triples at once
+    
+    Results are returned in request order; failures of single items are
+    reported per item, while a failure of the whole submission is returned
+    as one spec error response.
+    """
+    try:
+        results = await bridge_client.get_risk_score_batch(batch.items)
+        return ModelResponse(
+            RiskScoreBatchResponse(results=_batch_items(RiskScoreBatchItem, results)),
+            headers=_queue_headers("risk-score"),
+        )
+    except BridgeError:
+        raise
+    except Exception as e:
+        logger.error("Error getting risk score batch: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/arcium/curve-eval:batch", response_model=CurveEvalBatchResponse, dependencies=[Depends(charge_client), Depends(bulk_by_default)])
+async def get_curve_evaluation_batch(batch: CurveEvalBatchRequest):
+    """
+    Get confidential curve evaluations for many input triples at once
+    
+    Results are returned in request order; failures of single items are
+    reported per item, while a failure of the whole submission is returned
+    as one spec error response.
+    """
+    try:
+        results = await bridge_client.get_curve_evaluation_batch(batch.items)
+        return ModelResponse(
+            CurveEvalBatchResponse(results=_batch_items(CurveEvalBatchItem, results)),
+            headers=_queue_headers("curve-eval"),
+        )
+    except BridgeError:
+        raise
     except Exception as e:
-        logger.error(f"Error getting curve evaluation: {e}")
+        logger.error("Error getting curve evaluation batch: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _job_info(job: Job) -> JobInfo:
+    """Build the API view of a job"""
+    error = None
+    if job.error is not None:
+        error = _item_error(job.error)
+    return JobInfo(
+        job_id=job.job_id,
+        computation_type=job.computation_type,
+        status=job.status,
+        created_at=job.created_at,
+        completed_at=job.completed_at,
+        result=job.result,
+        error=error,
+    )
+
+
+def _submit_job(computation_type: str, run) -> ModelResponse:
+    """Start a job (202 with its JobInfo), rejecting the submission if the job table is full"""
+    # The job keeps the caller's traffic class and client id, but not this request's
+    # timing: its response is sent long before the job runs, so it records MXE stages only
+    context = contextvars.copy_context()
+    context.run(current_request.set, None)
+    try:
+        job = context.run(job_table.submit, computation_type, run)
+    except JobTableFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pending jobs",
+            headers={"Retry-After": "1"},
+        )
+    return ModelResponse(_job_info(job), status_code=202, headers=_budget_headers())
+
+
+@router.post("/arcium/jobs/plan", response_model=JobInfo, status_code=202, dependencies=[Depends(charge_client), Depends(bulk_by_default)])
+async def submit_plan_job(request: PlanRequest):
+    """
+    Submit a confidential strategy plan job
+    
+    Returns immediately with a job id; fetch the result from GET /arcium/jobs/{job_id}.
+    """
+    return _submit_job(
+        "plan",
+        lambda: bridge_client.get_confidential_plan(
+            user_preferences=request.user_preferences,
+            user_history=request.user_history,
+            curve_state=request.curve_state,
+        ),
+    )
+
+
+@router.post("/arcium/jobs/risk-score", response_model=JobInfo, status_code=202, dependencies=[Depends(charge_client), Depends(bulk_by_default)])
+async def submit_risk_score_job(request: RiskScoreRequest):
+    """
+    Submit a confidential risk score job
+    
+    Returns immediately with a job id; fetch the result from GET /arcium/jobs/{job_id}.
+    """
+    return _submit_job(
+        "risk-score",
+        lambda: bridge_client.get_risk_score(
+            portfolio_context=request.portfolio_context,
+            performance_history=request.performance_history,
+            market_conditions=request.market_conditions,
+        ),
+    )
+
+
+@router.post("/arcium/jobs/curve-eval", response_model=JobInfo, status_code=202, dependencies=[Depends(charge_client), Depends(bulk_by_default)])
+async def submit_curve_eval_job(request: CurveEvalRequest):
+    """
+    Submit a confidential curve evaluation job
+    
+    Returns immediately with a job id; fetch the result from GET /arcium/jobs/{job_id}.
+    """
+    return _submit_job(
+        "curve-eval",
+        lambda: bridge_client.get_curve_evaluation(
+            sizing_preferences=request.sizing_preferences,
+            user_constraints=request.user_constraints,
+            curve_metrics=request.curve_metrics,
+        ),
+    )
+
+
+@router.get("/arcium/jobs/{job_id}", response_model=JobInfo)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0.0, ge=0.0, description="Seconds to wait for the job to finish (long-poll)"),
+):
+    """
+    Get the status or result of a computation job
+    
+    With wait > 0, holds the request until the job finishes or the wait
+    elapses (capped at JOBS_MAX_WAIT_SEC), instead of requiring busy polling.
+    """
+    job = job_table.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    await job.wait(min(wait, bridge_client.settings.jobs_max_wait_sec))
+    return ModelResponse(_job_info(job))
+
+
+@router.post("/arcium/intents", response_model=IntentAck, status_code=202, dependencies=[Depends(charge_client)])
+async def submit_intent(envelope: IntentEnvelopeV1):
+    """
+    Submit an encrypted intent envelope
+    
+    Each nonce is accepted once within the freshness window (INTENT_MAX_AGE_SEC);
+    stale envelopes get 400 invalid_intent and replays get 409 replayed_intent.
+    """
+    return ModelResponse(await bridge_client.submit_intent(envelope), status_code=202, headers=_budget_headers())
+
+
+@router.get("/arcium/stats")
+async def get_stats():
+    """Runtime metrics for the bridge client (RPC routing and breakers, admission, rate limits, batching, cache, job table and log queue)"""
+    return {**bridge_client.stats(), "jobs": job_table.stats(), "logging": logging_stats()}
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -1,18 +1,49 @@
 """FastAPI server for Arcium bridge service"""
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from ..config.settings import Settings
+from fastapi.responses import JSONResponse, PlainTextResponse
+from ..bridge.errors import BridgeError
+from ..bridge.models import BATCH_TOO_LARGE
+from ..config.settings import get_settings
 from ..utils.logger import get_logger
-from .routes import router
+from ..utils.metrics import REGISTRY
+from .middleware import ProfilingMiddleware, StageTimingMiddleware
+from .routes import router, bridge_client, job_table
 
 logger = get_logger(__name__)
-settings = Settings()
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared RPC pool on startup; on shutdown let running jobs finish, then drain it
+
+    The server stops accepting requests and waits for in-flight ones before
+    this shutdown runs. Background jobs get up to SHUTDOWN_GRACE_SEC to
+    complete their MXE computations.
+    """
+    logger.info("Starting Evalys Arcium Bridge Service on %s:%d", settings.api_host, settings.api_port)
+    await bridge_client.start()
+    yield
+    logger.info("Shutting down Evalys Arcium Bridge Service")
+    try:
+        await asyncio.wait_for(job_table.drain(), settings.shutdown_grace_sec)
+    except asyncio.TimeoutError:
+        logger.warning("Shutdown grace period elapsed with jobs still running: %d", job_table.stats()["running"])
+    await bridge_client.close()
+
 
 app = FastAPI(
     title="Evalys Arcium Bridge Service",
     description="Bridge service connecting Evalys to Arcium's encrypted supercomputer",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -24,6 +55,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(StageTimingMiddleware)
+
+if settings.profiling_enabled:
+    logger.warning("Request profiling enabled - do not use in production")
+    app.add_middleware(
+        ProfilingMiddleware,
+        output_dir=settings.profiling_dir,
+        max_per_minute=settings.profiling_max_per_minute,
+    )
+
+
+@app.exception_handler(BridgeError)
+async def bridge_error_handler(request: Request, exc: BridgeError):
+    """Return spec-defined error bodies (error, message, retry_after)"""
+    logger.error("Bridge error on %s: %s", request.url.path, exc.code)
+    headers = {"Retry-After": str(exc.retry_after)} if exc.retry_after is not None else None
+    return JSONResponse(status_code=exc.status_code, content=exc.to_response(), headers=headers)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_error_handler(request: Request, exc: RequestValidationError):
+    """Answer oversized batches with 413; other validation errors keep FastAPI's 422"""
+    for error in exc.errors():
+        if error["type"] == BATCH_TOO_LARGE:
+            return JSONResponse(status_code=413, content={"detail": error["msg"]})
+    return await request_validation_exception_handler(request, exc)
+
+
 # Include routes
 app.include_router(router, prefix="/api/v1")
 
@@ -34,21 +94,15 @@ async def root_health():
     return {"status": "healthy", "service": "evalys-arcium-bridge"}
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler"""
-    logger.info(f"Starting Evalys Arcium Bridge Service on {settings.api_host}:{settings.api_port}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event handler"""
-    logger.info("Shutting down Evalys Arcium Bridge Service")
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics (per-stage latency histograms)"""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
     import uvicorn
-    logger.info(f"Starting server on {settings.api_host}:{settings.api_port}")
+    logger.info("Starting server on %s:%d", settings.api_host, settings.api_port)
     uvicorn.run(
         app,
         host=settings.api_host,
@@ -14,6 +14,24 @@ from .models import (
     UserConstraints,
     CurveMetrics,
     ExecutionRecommendation,
+    PlanRequest,
+    RiskScoreRequest,
+    CurveEvalRequest,
+    PlanBatchRequest,
+    RiskScoreBatchRequest,
+    CurveEvalBatchRequest,
+    BatchItemError,
+    PlanBatchItem,
+    RiskScoreBatchItem,
+    CurveEvalBatchItem,
+    PlanBatchResponse,
+    RiskScoreBatchResponse,
+    CurveEvalBatchResponse,
+    JobInfo,
+    IntentEnvelopeV1,
+    IntentAck,
+    ReceiptResult,
+    ProofReceiptV1,
 )
 
 __all__ = [
@@ -30,5 +48,23 @@ __all__ = [
     "UserConstraints",
     "CurveMetrics",
     "ExecutionRecommendation",
+    "PlanRequest",
+    "RiskScoreRequest",
+    "CurveEvalRequest",
+    "PlanBatchRequest",
+    "RiskScoreBatchRequest",
+    "CurveEvalBatchRequest",
+    "BatchItemError",
+    "PlanBatchItem",
+    "RiskScoreBatchItem",
+    "CurveEvalBatchItem",
+    "PlanBatchResponse",
+    "RiskScoreBatchResponse",
+    "CurveEvalBatchResponse",
+    "JobInfo",
+    "IntentEnvelopeV1",
+    "IntentAck",
+    "ReceiptResult",
+    "ProofReceiptV1",
 ]
 
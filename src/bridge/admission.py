@@ -0,0 +1,241 @@
+"""
+Admission control: per-computation-type concurrency limits with bounded wait queues
+
+Waiting requests are scheduled by traffic class. ``interactive`` requests
+(a user is waiting) and ``bulk`` requests (backtests, batch jobs) queue
+separately, and freed slots are shared between the classes by weighted
+fair queuing, so interactive traffic does not wait behind a bulk backlog.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from .errors import Overloaded
+
+# Weight of the newest sample in the moving averages of wait and hold time
+EWMA_ALPHA = 0.1
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+TRAFFIC_CLASSES = (INTERACTIVE, BULK)
+
+# Traffic class of the request being handled; set by the API from X-Evalys-Traffic-Class
+current_traffic_class: ContextVar[str] = ContextVar("current_traffic_class", default=INTERACTIVE)
+
+
+class _Waiter:
+    __slots__ = ("future", "enqueued_at", "finish")
+
+    def __init__(self, future: asyncio.Future, enqueued_at: float, finish: float):
+        self.future = future
+        self.enqueued_at = enqueued_at
+        self.finish = finish
+
+
+class AdmissionGate:
+    """
+    Concurrency limit and weighted fair wait queues for one computation type
+
+    Up to ``max_concurrency`` computations run at once. Up to ``max_queue``
+    more per traffic class wait for a slot for at most
+    ``queue_timeout_sec``. A request arriving at a full queue, or waiting
+    too long, is rejected with Overloaded and a ``retry_after`` estimated
+    from the queue length and recent hold times, so callers back off
+    instead of piling up. A ``max_concurrency`` of 0 disables the gate.
+
+    A freed slot goes to the class whose oldest waiter has the smallest
+    virtual finish time: while both classes are backlogged, each gets
+    slots in proportion to its weight, and requests within a class are
+    served in arrival order. A waiter queued for ``aging_sec`` or longer is
+    served next whatever its class, so bulk traffic is never starved.
+
+    Acquiring a free slot does not yield to the event loop. A released slot
+    is handed straight to the chosen waiter.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout_sec: float,
+        weights: Optional[Dict[str, float]] = None,
+        aging_sec: float = math.inf,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_sec = queue_timeout_sec
+        self.weights = weights or {traffic_class: 1.0 for traffic_class in TRAFFIC_CLASSES}
+        self.aging_sec = aging_sec
+        self.clock = clock
+        self.active = 0
+        self._queues: Dict[str, Deque[_Waiter]] = {traffic_class: deque() for traffic_class in self.weights}
+        self._virtual_time = 0.0
+        self._last_finish = {traffic_class: 0.0 for traffic_class in self.weights}
+        self._admitted = {traffic_class: 0 for traffic_class in self.weights}
+        self._rejected = 0
+        self._timed_out = 0
+        self._aged = 0
+        self._wait_sec = {traffic_class: 0.0 for traffic_class in self.weights}
+        self._hold_sec = 0.0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def avg_wait_sec(self, traffic_class: str = INTERACTIVE) -> float:
+        """Moving average of the time admitted requests of a class spent queued"""
+        return self._wait_sec[traffic_class]
+
+    def retry_after(self) -> int:
+        """Whole seconds until a request arriving now would likely get a slot"""
+        if self.max_concurrency <= 0:
+            return 1
+        return max(1, math.ceil((self.queued + 1) / self.max_concurrency * self._hold_sec))
+
+    async def acquire(self, traffic_class: str = INTERACTIVE) -> float:
+        """
+        Take a slot, waiting in the class's queue if all are busy; returns seconds waited
+
+        Raises:
+            Overloaded: The queue is full or the wait exceeded queue_timeout_sec
+        """
+        if self.max_concurrency <= 0:
+            return 0.0
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            self._admitted[traffic_class] += 1
+            return 0.0
+        queue = self._queues[traffic_class]
+        if len(queue) >= self.max_queue:
+            self._rejected += 1
+            raise Overloaded(retry_after=self.retry_after())
+
+        finish = max(self._virtual_time, self._last_finish[traffic_class]) + 1.0 / self.weights[traffic_class]
+        self._last_finish[traffic_class] = finish
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), self.clock(), finish)
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(waiter.future, self.queue_timeout_sec)
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self.release()
+            else:
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.TimeoutError):
+                self._timed_out += 1
+                raise Overloaded(retry_after=self.retry_after())
+            raise
+        waited = self.clock() - waiter.enqueued_at
+        self._wait_sec[traffic_class] += EWMA_ALPHA * (waited - self._wait_sec[traffic_class])
+        self._admitted[traffic_class] += 1
+        return waited
+
+    def release(self, held_sec: Optional[float] = None):
+        """Return a slot, handing it to the next waiter if there is one"""
+        if self.max_concurrency <= 0:
+            return
+        if held_sec is not None:
+            self._hold_sec += EWMA_ALPHA * (held_sec - self._hold_sec)
+        waiter = self._next_waiter()
+        if waiter is None:
+            self.active -= 1
+            return
+        self._virtual_time = max(self._virtual_time, waiter.finish)
+        waiter.future.set_result(None)
+
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """Remove and return the waiter to serve next (aged first, then smallest finish time)"""
+        heads: List[Tuple[_Waiter, Deque[_Waiter]]] = []
+        for queue in self._queues.values():
+            while queue and queue[0].future.done():
+                queue.popleft()
+            if queue:
+                heads.append((queue[0], queue))
+        if not heads:
+            return None
+        fair, queue = min(heads, key=lambda head: head[0].finish)
+        oldest, oldest_queue = min(heads, key=lambda head: head[0].enqueued_at)
+        if oldest is not fair and self.clock() - oldest.enqueued_at >= self.aging_sec:
+            self._aged += 1
+            queue = oldest_queue
+        return queue.popleft()
+
+    def stats(self) -> dict:
+        heads = [queue[0].enqueued_at for queue in self._queues.values() if queue]
+        oldest = self.clock() - min(heads) if heads else 0.0
+        return {
+            "active": self.active,
+            "max_concurrency": self.max_concurrency,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "oldest_wait_ms": round(oldest * 1000, 3),
+            "avg_hold_ms": round(self._hold_sec * 1000, 3),
+            "admitted": sum(self._admitted.values()),
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "aged": self._aged,  # Waiters served out of fair order because they aged
+            "classes": {
+                traffic_class: {
+                    "weight": self.weights[traffic_class],
+                    "queued": len(self._queues[traffic_class]),
+                    "admitted": self._admitted[traffic_class],
+                    "avg_wait_ms": round(self._wait_sec[traffic_class] * 1000, 3),
+                }
+                for traffic_class in self.weights
+            },
+        }
+
+
+class AdmissionController:
+    """One AdmissionGate per computation type"""
+
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[int, int]],
+        queue_timeout_sec: float,
+        weights: Optional[Dict[str, float]] = None,
+        aging_sec: float = math.inf,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the controller
+
+        Args:
+            limits: (max_concurrency, max_queue per traffic class) per computation type
+            queue_timeout_sec: Longest a request waits for a slot
+            weights: Share of freed slots per traffic class while several are waiting
+            aging_sec: Queue time after which a waiter is served next regardless of class
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.gates = {
+            computation_type: AdmissionGate(concurrency, queue, queue_timeout_sec, weights, aging_sec, clock)
+            for computation_type, (concurrency, queue) in limits.items()
+        }
+
+    def gate(self, computation_type: str) -> AdmissionGate:
+        return self.gates[computation_type]
+
+    def stats(self) -> dict:
+        return {computation_type: gate.stats() for computation_type, gate in self.gates.items()}
+
+
+def traffic_weights(settings) -> Dict[str, float]:
+    """Weighted fair queuing weight per traffic class from settings"""
+    return {INTERACTIVE: settings.admission_interactive_weight, BULK: settings.admission_bulk_weight}
+
+
+def admission_limits(settings) -> Dict[str, Tuple[int, int]]:
+    """Per-computation (max_concurrency, max_queue) from settings"""
+    return {
+        "plan": (settings.admission_concurrency_plan, settings.admission_queue_plan),
+        "risk-score": (settings.admission_concurrency_risk_score, settings.admission_queue_risk_score),
+        "curve-eval": (settings.admission_concurrency_curve_eval, settings.admission_queue_curve_eval),
+    }
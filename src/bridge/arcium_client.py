@@ -1,12 +1,35 @@
 """Arcium bridge client for submitting confidential computations"""
 
 import asyncio
+import base64
 import json
-from typing import Optional
-from solana.rpc.async_api import AsyncClient
-from solders.pubkey import Pubkey
-from ..config.settings import Settings
-from ..utils.logger import get_logger
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+from ..config.settings import Settings, get_settings
+from ..utils.logger import fields, get_logger
+from ..utils.metrics import ERROR, Stage, mark_handler_end, mark_handler_start, observe_stage
+from .admission import AdmissionController, admission_limits, current_traffic_class, traffic_weights
+from .cache import ResultCache, cache_ttls
+from .encryption import InputEncryptor, associated_data
+from .errors import InvalidReceipt, Overloaded, RateLimited
+from . import codec
+from .fake_mxe import FakeMxe, Latency, decode_outputs
+from .intents import IntentIngestor
+from .key_pool import EphemeralKeyPool
+from .rate_limit import (
+    COST,
+    REQUESTS,
+    charged_keys,
+    computation_costs,
+    current_budget,
+    current_client_id,
+    current_source_address,
+    rate_limiter,
+)
+from .receipts import ReceiptVerifier
+from .rpc_pool import RpcPool
+from .scheduler import MicroBatcher
+from .shared_state import SharedNonceStore, SharedRateLimiter, SharedResultCache, SharedStateClient
 from .models import (
     UserPreferences,
     UserHistory,
@@ -20,10 +43,28 @@ from .models import (
     UserConstraints,
     CurveMetrics,
     ExecutionRecommendation,
+    PlanRequest,
+    RiskScoreRequest,
+    CurveEvalRequest,
+    IntentEnvelopeV1,
+    IntentAck,
 )
 
+if TYPE_CHECKING:
+    from solana.rpc.async_api import AsyncClient
+    from solders.pubkey import Pubkey
+
 logger = get_logger(__name__)
 
+# Result model for each computation type
+RESULT_MODELS = {
+    "plan": StrategyPlan,
+    "risk-score": RiskAssessment,
+    "curve-eval": ExecutionRecommendation,
+}
+
+ARCIUM_BACKENDS = ("simulated", "fake")
+
 
 class ArciumBridgeClient:
     """
@@ -36,27 +77,138 @@ class ArciumBridgeClient:
     - Decryption of results
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(self, settings: Optional[Settings] = None, rpc_pool: Optional[RpcPool] = None):
         """Initialize the Arcium bridge client"""
-        self.settings = settings or Settings()
-        self.solana_client: Optional[AsyncClient] = None
-        self.mxe_program_id: Optional[Pubkey] = None
+        self.settings = settings or get_settings()
+        self.rpc_pool = rpc_pool or RpcPool(self.settings)
+        self.policy = self.rpc_pool.policy
+        self.solana_client: Optional["AsyncClient"] = None
+        self.mxe_program_id: Optional["Pubkey"] = None
+        self._demo_warned = False
+        if self.settings.arcium_backend not in ARCIUM_BACKENDS:
+            raise ValueError(f"Unknown ARCIUM_BACKEND: {self.settings.arcium_backend}")
+        self.mxe: Optional[FakeMxe] = None
+        if self.settings.arcium_backend == "fake":
+            logger.warning("ARCIUM_BACKEND=fake - using the in-process MXE stand-in (testing only)")
+            self.mxe = FakeMxe(
+                self._simulate,
+                submit_latency=Latency(self.settings.fake_mxe_submit_latency_ms, self.settings.fake_mxe_latency_sigma),
+                compute_latency=Latency(self.settings.fake_mxe_compute_latency_ms, self.settings.fake_mxe_latency_sigma),
+                capacity=self.settings.fake_mxe_capacity,
+                network_error_rate=self.settings.fake_mxe_network_error_rate,
+                timeout_rate=self.settings.fake_mxe_timeout_rate,
+                invalid_receipt_rate=self.settings.fake_mxe_invalid_receipt_rate,
+                decryption_failure_rate=self.settings.fake_mxe_decryption_failure_rate,
+                seed=self.settings.fake_mxe_seed,
+            )
+        # Under the multi-worker launcher the cache and nonce store live in its shared state server
+        self.shared_state: Optional[SharedStateClient] = None
+        if self.settings.shared_state_socket:
+            self.shared_state = SharedStateClient(
+                self.settings.shared_state_socket,
+                timeout_sec=self.settings.shared_state_timeout_sec,
+                max_backoff_sec=self.settings.shared_state_max_backoff_sec,
+            )
+        self.cache: Optional[ResultCache] = None
+        if self.settings.cache_enabled:
+            if self.shared_state is not None:
+                self.cache = SharedResultCache(self.shared_state, cache_ttls(self.settings), self.settings.cache_max_bytes)
+            else:
+                self.cache = ResultCache(ttls=cache_ttls(self.settings), max_bytes=self.settings.cache_max_bytes)
+        self.intents = IntentIngestor(
+            max_age_sec=self.settings.intent_max_age_sec,
+            buckets=self.settings.nonce_store_buckets,
+            max_nonces=self.settings.nonce_store_max_nonces,
+            bloom_bits_per_nonce=self.settings.nonce_bloom_bits_per_nonce,
+            nonces=SharedNonceStore(self.shared_state) if self.shared_state is not None else None,
+        )
+        self.cluster_public_key: Optional[bytes] = None
+        if self.settings.arcium_cluster_public_key:
+            self.cluster_public_key = base64.b64decode(self.settings.arcium_cluster_public_key, validate=True)
+        elif self.mxe is not None:
+            self.cluster_public_key = self.mxe.cluster_public_key
+        self.key_pool: Optional[EphemeralKeyPool] = None
+        if self.cluster_public_key is not None and self.settings.ephemeral_key_pool_high_water > 0:
+            self.key_pool = EphemeralKeyPool(
+                self.cluster_public_key,
+                low_water=self.settings.ephemeral_key_pool_low_water,
+                high_water=self.settings.ephemeral_key_pool_high_water,
+            )
+        self.encryptor = InputEncryptor(
+            self.settings.arcium_client_encryption_key,
+            secret_ttl_sec=self.settings.encryption_secret_ttl_sec,
+            chunk_size=self.settings.encryption_chunk_size,
+            key_pool=self.key_pool,
+        )
+        node_public_key = self.settings.arcium_node_public_key
+        if node_public_key is None and self.mxe is not None:
+            node_public_key = str(self.mxe.node_public_key)
+        self.receipt_verifier = ReceiptVerifier(
+            node_public_key,
+            max_age_sec=self.settings.receipt_max_age_sec,
+            cache_size=self.settings.receipt_cache_size,
+            chunk_size=self.settings.receipt_verify_chunk_size,
+        )
+        self.admission = AdmissionController(
+            admission_limits(self.settings),
+            queue_timeout_sec=self.settings.admission_queue_timeout_sec,
+            weights=traffic_weights(self.settings),
+            aging_sec=self.settings.admission_aging_sec,
+        )
+        self.rate_limiter = None
+        if self.settings.rate_limit_enabled:
+            if self.shared_state is not None:
+                self.rate_limiter = SharedRateLimiter(self.shared_state)
+            else:
+                self.rate_limiter = rate_limiter(self.settings)
+        self.costs = computation_costs(self.settings)
+        self.scheduler: Optional[MicroBatcher] = None
+        if self.settings.batching_enabled:
+            self.scheduler = MicroBatcher(
+                self._run_batch,
+                window_ms=self.settings.batching_window_ms,
+                max_batch_size=self.settings.batching_max_size,
+            )
         
-    async def _initialize(self):
-        """Initialize Solana client and load program ID"""
-        if self.solana_client is None:
-            self.solana_client = AsyncClient(self.settings.solana_rpc_url)
+    async def start(self):
+        """
+        Open and warm the shared RPC connection pool
         
+        Called once from the app lifespan; requests made without it fall
+        back to lazy initialization. In demo mode nothing talks to Solana,
+        so the pool (and the solana-py import) is skipped entirely. The
+        ephemeral key pool starts filling in the background, and under the
+        multi-worker launcher the shared state connection is opened.
+        """
+        await self._initialize()
+        if self.shared_state is not None:
+            hello = await self.shared_state.connect()
+            if self.cache is not None:
+                use_secrets = lambda hello: self.cache.use_secrets(hello["cache_hash_key"], hello["cache_encryption_key"])
+                use_secrets(hello)
+                self.shared_state.on_connect(use_secrets)
+        if self.key_pool is not None:
+            self.key_pool.start()
+        if self.mxe_program_id is not None:
+            await self.rpc_pool.start(self.mxe_program_id)
+    
+    async def _initialize(self):
+        """Load the program ID and open the Solana client on the first real MXE call"""
         if self.mxe_program_id is None:
             if self.settings.arcium_mxe_program_id:
                 try:
+                    from solders.pubkey import Pubkey
                     self.mxe_program_id = Pubkey.from_string(self.settings.arcium_mxe_program_id)
                 except Exception as e:
-                    logger.error(f"Failed to parse MXE program ID: {e}")
+                    logger.error("Failed to parse MXE program ID: %s", e)
                     raise
-            else:
+            elif not self._demo_warned:
                 # Demo mode: no program ID needed for simulated computation
                 logger.warning("ARCIUM_MXE_PROGRAM_ID not set - running in demo mode (simulated computation)")
+                self._demo_warned = True
+        
+        if self.solana_client is None and self.mxe_program_id is not None:
+            self.solana_client = self.rpc_pool.solana
     
     async def get_confidential_plan(
         self,
@@ -77,7 +229,7 @@ class ArciumBridgeClient:
         """
         await self._initialize()
         
-        logger.info("Requesting confidential strategy plan from Arcium MXE")
+        logger.info("Requesting confidential strategy plan from Arcium MXE", extra=fields(sampled=True))
         
         # TODO: Implement actual Arcium client integration
         # This is a placeholder that simulates the computation
@@ -89,24 +241,16 @@ class ArciumBridgeClient:
         
         # Simulated computation result
         # In real implementation, this would come from Arcium MXE
-        risk_score = self._compute_risk_score_simulated(
-            user_preferences, user_history, curve_state
+        plan = await self._submit(
+            "plan",
+            PlanRequest.model_construct(
+                user_preferences=user_preferences,
+                user_history=user_history,
+                curve_state=curve_state,
+            ),
         )
         
-        recommended_mode = "max_ghost" if risk_score > 200 else "stealth" if risk_score > 100 else "normal"
-        num_slices = 8 if user_preferences.desired_size > 10_000_000_000 else 5 if user_preferences.desired_size > 1_000_000_000 else 3
-        
-        plan = StrategyPlan(
-            plan_id="mxe-simulated-123",
-            recommended_mode=recommended_mode,
-            num_slices=num_slices,
-            slice_size_base=user_preferences.desired_size // num_slices,
-            timing_window_sec=60 if curve_state.volatility > 500 else 120 if curve_state.volatility > 200 else 300,
-            risk_level=risk_score,
-            max_notional=user_preferences.desired_size * 2 if user_preferences.risk_appetite > 200 and user_history.win_rate > 6000 else user_preferences.desired_size,
-        )
-        
-        logger.info(f"Received strategy plan: mode={plan.recommended_mode}, risk={plan.risk_level}")
+        logger.info("Received strategy plan", extra=fields(sampled=True))
         return plan
     
     async def get_risk_score(
@@ -128,30 +272,20 @@ class ArciumBridgeClient:
         """
         await self._initialize()
         
-        logger.info("Requesting confidential risk score from Arcium MXE")
+        logger.info("Requesting confidential risk score from Arcium MXE", extra=fields(sampled=True))
         
         # TODO: Implement actual Arcium client integration
         # Simulated computation
-        exposure_ratio = (portfolio_context.current_exposure * 255) // portfolio_context.total_capital if portfolio_context.total_capital > 0 else 255
-        portfolio_risk = min(255, max(100, exposure_ratio))
-        trade_risk = 255 if market_conditions.curve_volatility > 500 else 200 if market_conditions.curve_volatility > 300 else 100
-        
-        overall_risk = (portfolio_risk + trade_risk) // 2
-        if performance_history.total_pnl < 0:
-            overall_risk = min(255, overall_risk + 50)
-        elif performance_history.sharpe_ratio > 100:
-            overall_risk = max(0, overall_risk - 30)
-        
-        recommendation = "avoid" if overall_risk > 200 else "caution" if overall_risk > 150 else "proceed"
-        
-        assessment = RiskAssessment(
-            overall_risk_score=overall_risk,
-            portfolio_risk=portfolio_risk,
-            trade_risk=trade_risk,
-            recommendation=recommendation,
+        assessment = await self._submit(
+            "risk-score",
+            RiskScoreRequest.model_construct(
+                portfolio_context=portfolio_context,
+                performance_history=performance_history,
+                market_conditions=market_conditions,
+            ),
         )
         
-        logger.info(f"Received risk assessment: score={assessment.overall_risk_score}, recommendation={assessment.recommendation}")
+        logger.info("Received risk assessment", extra=fields(sampled=True))
         return assessment
     
     async def get_curve_evaluation(
@@ -173,10 +307,401 @@ class ArciumBridgeClient:
         """
         await self._initialize()
         
-        logger.info("Requesting confidential curve evaluation from Arcium MXE")
+        logger.info("Requesting confidential curve evaluation from Arcium MXE", extra=fields(sampled=True))
         
         # TODO: Implement actual Arcium client integration
         # Simulated computation
+        recommendation = await self._submit(
+            "curve-eval",
+            CurveEvalRequest.model_construct(
+                sizing_preferences=sizing_preferences,
+                user_constraints=user_constraints,
+                curve_metrics=curve_metrics,
+            ),
+        )
+        
+        logger.info("Received curve evaluation", extra=fields(sampled=True))
+        return recommendation
+    
+    async def get_confidential_plan_batch(
+        self,
+        requests: List[PlanRequest],
+    ) -> List[Union[StrategyPlan, Exception]]:
+        """
+        Get confidential execution plans for many input triples at once
+        
+        Args:
+            requests: Strategy plan input triples
+            
+        Returns:
+            One entry per request, in order: the StrategyPlan, or the
+            exception raised while computing that item
+            
+        Raises:
+            BridgeError: A failure of the whole submission (Overloaded,
+                RateLimited, NetworkError or CircuitOpen after retries,
+                ComputationTimeout, InvalidReceipt) fails every item at once
+        """
+        await self._initialize()
+        
+        logger.info("Requesting confidential strategy plans from Arcium MXE", extra=fields(sampled=True, items=len(requests)))
+        
+        return await self._execute_batch("plan", requests)
+    
+    async def get_risk_score_batch(
+        self,
+        requests: List[RiskScoreRequest],
+    ) -> List[Union[RiskAssessment, Exception]]:
+        """
+        Get confidential risk assessments for many input triples at once
+        
+        Args:
+            requests: Risk score input triples
+            
+        Returns:
+            One entry per request, in order: the RiskAssessment, or the
+            exception raised while computing that item
+            
+        Raises:
+            BridgeError: A failure of the whole submission (Overloaded,
+                RateLimited, NetworkError or CircuitOpen after retries,
+                ComputationTimeout, InvalidReceipt) fails every item at once
+        """
+        await self._initialize()
+        
+        logger.info("Requesting confidential risk scores from Arcium MXE", extra=fields(sampled=True, items=len(requests)))
+        
+        return await self._execute_batch("risk-score", requests)
+    
+    async def get_curve_evaluation_batch(
+        self,
+        requests: List[CurveEvalRequest],
+    ) -> List[Union[ExecutionRecommendation, Exception]]:
+        """
+        Get confidential curve evaluations for many input triples at once
+        
+        Args:
+            requests: Curve evaluation input triples
+            
+        Returns:
+            One entry per request, in order: the ExecutionRecommendation, or
+            the exception raised while computing that item
+            
+        Raises:
+            BridgeError: A failure of the whole submission (Overloaded,
+                RateLimited, NetworkError or CircuitOpen after retries,
+                ComputationTimeout, InvalidReceipt) fails every item at once
+        """
+        await self._initialize()
+        
+        logger.info("Requesting confidential curve evaluations from Arcium MXE", extra=fields(sampled=True, items=len(requests)))
+        
+        return await self._execute_batch("curve-eval", requests)
+    
+    async def submit_intent(self, envelope: IntentEnvelopeV1) -> IntentAck:
+        """
+        Accept an encrypted intent envelope, rejecting stale or replayed ones
+        
+        Raises:
+            InvalidIntent, ReplayedIntent, ReplayStoreFull
+        """
+        mark_handler_start("intent")
+        ack = await self.intents.ingest_async(envelope)
+        mark_handler_end()
+        logger.info("Accepted intent envelope", extra=fields(sampled=True, intent_type=envelope.intent_type))
+        # TODO: Forward the encrypted payload to the MXE once real integration lands
+        return ack
+    
+    async def _submit(self, computation_type: str, request):
+        """
+        Submit a single request, coalescing it with concurrent requests when batching is enabled
+        
+        Cached results are returned without a submission; misses pass
+        admission control first. Raises the item's exception if its
+        computation failed, or Overloaded if it was not admitted.
+        """
+        mark_handler_start(computation_type)
+        key = None
+        if self.cache is not None and self.cache.enabled_for(computation_type):
+            key = self.cache.key(computation_type, request)
+            cached = await self.cache.fetch(computation_type, key, RESULT_MODELS[computation_type])
+            if cached is not None:
+                mark_handler_end()
+                return cached
+        
+        gate = await self._admit(computation_type)
+        start = gate.clock()
+        try:
+            if self.scheduler is not None:
+                result = await self.scheduler.submit(computation_type, request)
+            else:
+                result = (await self._run_batch(computation_type, [request]))[0]
+                if isinstance(result, Exception):
+                    raise result
+        finally:
+            gate.release(gate.clock() - start)
+        
+        if key is not None:
+            await self.cache.store(computation_type, key, result)
+        mark_handler_end()
+        return result
+    
+    async def _execute_batch(self, computation_type: str, requests: list) -> list:
+        """
+        Run a batch of requests, serving cached items and submitting only the misses
+        
+        The misses pass admission control as one request. Returns one result
+        or exception per item failure, in order; errors that fail the whole
+        submission (admission, rate limits, network, timeout, receipt) are
+        raised instead.
+        """
+        mark_handler_start(computation_type)
+        if self.cache is None or not self.cache.enabled_for(computation_type):
+            results = await self._run_admitted(computation_type, requests)
+            mark_handler_end()
+            return results
+        
+        model_cls = RESULT_MODELS[computation_type]
+        keys = [self.cache.key(computation_type, r) for r in requests]
+        results = await self.cache.fetch_many(computation_type, keys, model_cls)
+        misses = [i for i, result in enumerate(results) if result is None]
+        
+        if misses:
+            computed = await self._run_admitted(computation_type, [requests[i] for i in misses])
+            for i, result in zip(misses, computed):
+                results[i] = result
+                if not isinstance(result, Exception):
+                    await self.cache.store(computation_type, keys[i], result)
+        mark_handler_end()
+        return results
+    
+    async def charge_request(self):
+        """
+        Take one request token from the calling client's budget (no-op unless rate limiting is enabled)
+        
+        Raises:
+            RateLimited
+        """
+        if self.rate_limiter is not None:
+            await self._charge(REQUESTS, 1)
+    
+    def _charged_keys(self, amount: float) -> list:
+        """(bucket key, amount) pairs charged for the calling client: its id and its source address"""
+        return charged_keys(
+            current_client_id.get(), current_source_address.get(), amount, self.settings.rate_limit_address_factor
+        )
+    
+    async def _charge(self, bucket: str, amount: float):
+        """Charge the calling client and record its remaining budget for the response headers"""
+        taken = []
+        try:
+            for key, share in self._charged_keys(amount):
+                remaining = await self.rate_limiter.take_async(key, bucket, share)
+                if not taken:
+                    current_budget.set(remaining)
+                taken.append((key, share))
+        except RateLimited:
+            logger.warning("Client rate limited: bucket=%s, key=%s", bucket, key)
+            # Nothing runs, so give back what the client's other buckets were already charged
+            for key, share in taken:
+                await self.rate_limiter.credit_async(key, bucket, share)
+            raise
+    
+    async def _refund(self, bucket: str, amount: float):
+        """Give back a charge for work that never ran, updating the remaining budget for the response headers"""
+        for index, (key, share) in enumerate(self._charged_keys(amount)):
+            remaining = await self.rate_limiter.credit_async(key, bucket, share)
+            if index == 0 and remaining:
+                current_budget.set(remaining)
+    
+    async def _admit(self, computation_type: str, items: int = 1):
+        """
+        Charge the MXE cost of ``items`` computations, then wait for an admission slot; returns its gate
+        
+        The cost is charged before queueing, so a client over its budget
+        never takes a queue slot, and refunded if admission rejects the
+        request, since nothing reached the MXE. Raises RateLimited or
+        Overloaded.
+        """
+        cost = 0.0
+        if self.rate_limiter is not None:
+            cost = self.costs[computation_type] * items
+            await self._charge(COST, cost)
+        gate = self.admission.gate(computation_type)
+        start_ns = perf_counter_ns()
+        try:
+            await gate.acquire(current_traffic_class.get())
+        except Overloaded:
+            observe_stage(computation_type, "admission", start_ns, ERROR)
+            logger.warning("Admission rejected: type=%s, queued=%d", computation_type, gate.queued)
+            if cost:
+                await self._refund(COST, cost)
+            raise
+        observe_stage(computation_type, "admission", start_ns)
+        return gate
+    
+    async def _run_admitted(self, computation_type: str, requests: list) -> list:
+        """``_run_batch`` holding one admission slot"""
+        gate = await self._admit(computation_type, len(requests))
+        start = gate.clock()
+        try:
+            return await self._run_batch(computation_type, requests)
+        finally:
+            gate.release(gate.clock() - start)
+    
+    async def _run_batch(self, computation_type: str, requests: list) -> list:
+        """
+        Run one batch of requests of a single computation type
+        
+        The submission is retried with backoff on retryable errors (timeouts,
+        network errors). Returns one result or exception per request, in order.
+        """
+        return await self.policy.run(
+            f"mxe:{computation_type}",
+            lambda: self._compute_batch(computation_type, requests),
+        )
+    
+    async def _compute_batch(self, computation_type: str, requests: list) -> list:
+        """Submit one batch to the MXE and collect its per-item results"""
+        # TODO: Submit to the real MXE once integration lands; the fake backend
+        # already follows the spec's submit -> monitor -> verify -> decrypt flow.
+        if self.mxe is None:
+            with Stage(computation_type, "submission"):
+                return self._simulate(computation_type, requests)
+        
+        # Items that do not fit the binary encoding fail on their own and are not submitted
+        results = [self._capture(codec.encode, r) for r in requests]
+        valid = [i for i, encoded in enumerate(results) if not isinstance(encoded, Exception)]
+        if not valid:
+            return results
+        
+        with Stage(computation_type, "encryption"):
+            sealed = await self.encryptor.encrypt_batch(
+                self.cluster_public_key,
+                [results[i] for i in valid],
+                associated_data("input", computation_type),
+            )
+        # Network failures open the cluster's breaker; later batches then fail fast with retry_after
+        receipt = await self.policy.guard(
+            f"mxe:{self.settings.arcium_cluster_offset}",
+            lambda: self._submit_and_await(computation_type, sealed),
+        )
+        if not await self.receipt_verifier.verify_receipt(receipt, computation_type):
+            raise InvalidReceipt()
+        with Stage(computation_type, "decryption"):
+            outputs = decode_outputs(receipt.result.encrypted_output, sealed, computation_type, RESULT_MODELS[computation_type])
+        for i, output in zip(valid, outputs):
+            if isinstance(output, StrategyPlan):
+                # Name each plan after the MXE computation and batch position that produced it
+                output.plan_id = f"mxe-{receipt.computation_id}-{i}"
+            results[i] = output
+        return results
+    
+    async def _submit_and_await(self, computation_type: str, sealed: list):
+        """Submit sealed inputs to the MXE and wait for the computation's receipt"""
+        with Stage(computation_type, "submission"):
+            computation_id = await self.mxe.submit(computation_type, sealed)
+        with Stage(computation_type, "await_completion"):
+            return await self.mxe.await_completion(computation_id, self.settings.mxe_computation_timeout_sec)
+    
+    def _simulate(self, computation_type: str, requests: list) -> list:
+        """Compute a batch inline with the simulated formulas"""
+        if computation_type == "plan":
+            compute_one = lambda r: self._simulate_plan(r.user_preferences, r.user_history, r.curve_state)
+        elif computation_type == "risk-score":
+            compute_one = lambda r: self._simulate_risk_score(r.portfolio_context, r.performance_history, r.market_conditions)
+        elif computation_type == "curve-eval":
+            compute_one = lambda r: self._simulate_curve_evaluation(r.sizing_preferences, r.user_constraints, r.curve_metrics)
+        else:
+            raise ValueError(f"Unknown computation type: {computation_type}")
+        return self._simulate_batch(computation_type, requests, compute_one)
+    
+    def _simulate_batch(self, computation_type: str, requests: list, compute_one: Callable) -> list:
+        """
+        Run a simulated batch computation
+        
+        Large batches run through the vectorized engine; small batches, or
+        batches with inputs outside the engine's safe integer range, fall
+        back to the scalar path with per-item error capture.
+        """
+        if len(requests) >= self.settings.engine_min_batch_items:
+            # Imported here so NumPy loads on the first large batch, not at startup
+            from . import engine
+            to_columns, compute_columns, to_models = engine.PIPELINES[computation_type]
+            try:
+                columns = to_columns(requests)
+            except OverflowError:
+                columns = None
+            if columns is not None and engine.within_safe_range(columns):
+                return to_models(compute_columns(columns))
+        
+        return [self._capture(compute_one, r) for r in requests]
+    
+    @staticmethod
+    def _capture(compute: Callable, *args):
+        """Run a per-item computation, returning the exception instead of raising it"""
+        try:
+            return compute(*args)
+        except Exception as e:
+            return e
+    
+    def _simulate_plan(
+        self,
+        user_preferences: UserPreferences,
+        user_history: UserHistory,
+        curve_state: CurveState,
+    ) -> StrategyPlan:
+        """Simulated strategy plan computation (placeholder for actual MPC)"""
+        risk_score = self._compute_risk_score_simulated(
+            user_preferences, user_history, curve_state
+        )
+        
+        recommended_mode = "max_ghost" if risk_score > 200 else "stealth" if risk_score > 100 else "normal"
+        num_slices = 8 if user_preferences.desired_size > 10_000_000_000 else 5 if user_preferences.desired_size > 1_000_000_000 else 3
+        
+        return StrategyPlan(
+            plan_id="mxe-simulated-123",
+            recommended_mode=recommended_mode,
+            num_slices=num_slices,
+            slice_size_base=user_preferences.desired_size // num_slices,
+            timing_window_sec=60 if curve_state.volatility > 500 else 120 if curve_state.volatility > 200 else 300,
+            risk_level=risk_score,
+            max_notional=user_preferences.desired_size * 2 if user_preferences.risk_appetite > 200 and user_history.win_rate > 6000 else user_preferences.desired_size,
+        )
+    
+    def _simulate_risk_score(
+        self,
+        portfolio_context: PortfolioContext,
+        performance_history: PerformanceHistory,
+        market_conditions: MarketConditions,
+    ) -> RiskAssessment:
+        """Simulated risk assessment computation (placeholder for actual MPC)"""
+        exposure_ratio = (portfolio_context.current_exposure * 255) // portfolio_context.total_capital if portfolio_context.total_capital > 0 else 255
+        portfolio_risk = min(255, max(100, exposure_ratio))
+        trade_risk = 255 if market_conditions.curve_volatility > 500 else 200 if market_conditions.curve_volatility > 300 else 100
+        
+        overall_risk = (portfolio_risk + trade_risk) // 2
+        if performance_history.total_pnl < 0:
+            overall_risk = min(255, overall_risk + 50)
+        elif performance_history.sharpe_ratio > 100:
+            overall_risk = max(0, overall_risk - 30)
+        
+        recommendation = "avoid" if overall_risk > 200 else "caution" if overall_risk > 150 else "proceed"
+        
+        return RiskAssessment(
+            overall_risk_score=overall_risk,
+            portfolio_risk=portfolio_risk,
+            trade_risk=trade_risk,
+            recommendation=recommendation,
+        )
+    
+    def _simulate_curve_evaluation(
+        self,
+        sizing_preferences: SizingPreferences,
+        user_constraints: UserConstraints,
+        curve_metrics: CurveMetrics,
+    ) -> ExecutionRecommendation:
+        """Simulated curve evaluation computation (placeholder for actual MPC)"""
         recommended_size = min(
             sizing_preferences.max_size,
             max(
@@ -192,16 +717,13 @@ class ArciumBridgeClient:
         
         confidence_score = 200 if curve_metrics.liquidity_depth > recommended_size * 3 else 150 if curve_metrics.liquidity_depth > recommended_size else 100
         
-        recommendation = ExecutionRecommendation(
+        return ExecutionRecommendation(
             recommended_size=recommended_size,
             entry_price_target=price_adjustment,
             execution_urgency=execution_urgency,
             optimal_timing=min(user_constraints.time_constraint_sec, 60 if execution_urgency > 200 else 300),
             confidence_score=confidence_score,
         )
-        
-        logger.info(f"Received curve evaluation: size={recommendation.recommended_size}, urgency={recommendation.execution_urgency}")
-        return recommendation
     
     def _compute_risk_score_simulated(
         self,
@@ -224,8 +746,35 @@ class ArciumBridgeClient:
         
         return total_risk
     
+    def stats(self) -> dict:
+        """Runtime metrics for the bridge client"""
+        stats = {
+            "rpc_pool": self.rpc_pool.stats(),
+            "intents": self.intents.stats(),
+            "receipts": self.receipt_verifier.stats(),
+            "encryption": self.encryptor.stats(),
+            "admission": self.admission.stats(),
+        }
+        if self.rate_limiter is not None:
+            stats["rate_limit"] = self.rate_limiter.stats()
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        if self.scheduler is not None:
+            stats["scheduler"] = self.scheduler.stats()
+        if self.mxe is not None:
+            stats["fake_mxe"] = self.mxe.stats()
+        if self.shared_state is not None:
+            stats["shared_state"] = self.shared_state.stats()
+        return stats
+    
     async def close(self):
-        """Close the Solana client connection"""
-        if self.solana_client:
-            await self.solana_client.close()
+        """Flush pending batches, close the pooled RPC connections and drop unused key material"""
+        if self.scheduler is not None:
+            await self.scheduler.drain()
+        self.solana_client = None
+        await self.rpc_pool.close()
+        if self.key_pool is not None:
+            await self.key_pool.close()
+        if self.shared_state is not None:
+            await self.shared_state.close()
 
@@ -0,0 +1,188 @@
+"""Content-addressed result cache for confidential computations
+
+Cached results are decrypted plaintext, so they stay inside the confidential
+boundary (see docs/crypto.md):
+
+- Entries are keyed by an HMAC-SHA256 of the canonical input JSON under a
+  per-process secret, so keys cannot be brute-forced back to inputs.
+- Values are encrypted at rest in memory with AES-256-GCM under a
+  per-process key that is never persisted or logged.
+- Nothing about cached values is ever logged.
+
+With several worker processes, entries live in the shared state server
+(shared_state.py) and every worker uses the same secrets, handed out by
+that server, so a result cached by one worker is served by all of them.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Type, TypeVar
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from pydantic import BaseModel
+
+# Approximate per-entry bookkeeping cost (key, tuple, OrderedDict node)
+ENTRY_OVERHEAD_BYTES = 200
+NONCE_BYTES = 12
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def cache_ttls(settings) -> Dict[str, float]:
+    """Per-computation cache TTLs from settings"""
+    return {
+        "plan": settings.cache_ttl_plan_sec,
+        "risk-score": settings.cache_ttl_risk_score_sec,
+        "curve-eval": settings.cache_ttl_curve_eval_sec,
+    }
+
+
+class ResultCache:
+    """
+    Memory-bounded LRU cache with per-computation TTLs
+
+    Each computation type has its own TTL; a TTL of 0 disables caching for
+    that type. When the total size of cached entries exceeds ``max_bytes``,
+    the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+        hash_key: Optional[bytes] = None,
+        encryption_key: Optional[bytes] = None,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            ttls: TTL in seconds per computation type
+            max_bytes: Memory bound for cached entries
+            clock: Monotonic time source (injectable for tests)
+            hash_key: 32-byte HMAC key for entry keys (random if None)
+            encryption_key: 32-byte AES-GCM key for values (random if None)
+        """
+        self.ttls = ttls
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.use_secrets(hash_key or os.urandom(32), encryption_key or AESGCM.generate_key(bit_length=256))
+        self._entries: "OrderedDict[bytes, Tuple[float, bytes, str]]" = OrderedDict()
+        self._bytes = 0
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def use_secrets(self, hash_key: bytes, encryption_key: bytes):
+        """Key entries and encrypt values under these secrets (shared by all workers)"""
+        self._hash_key = hash_key
+        self._aead = AESGCM(encryption_key)
+
+    def enabled_for(self, computation_type: str) -> bool:
+        """Whether results of this computation type are cached"""
+        return self.ttls.get(computation_type, 0) > 0
+
+    def key(self, computation_type: str, request: BaseModel) -> bytes:
+        """Canonical keyed hash of a computation type and its input models"""
+        canonical = json.dumps(
+            request.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+        )
+        message = computation_type.encode() + b"\0" + canonical.encode()
+        return hmac.new(self._hash_key, message, hashlib.sha256).digest()
+
+    def get(self, computation_type: str, key: bytes, model_cls: Type[ModelT]) -> Optional[ModelT]:
+        """Look up a cached result, returning None on miss or expiry"""
+        return self.open(key, self.get_blob(computation_type, key), model_cls)
+
+    def put(self, computation_type: str, key: bytes, result: BaseModel):
+        """Store a result under its input hash, evicting LRU entries if over the memory bound"""
+        if self.enabled_for(computation_type):
+            self.put_blob(computation_type, key, self.seal(key, result))
+
+    async def fetch(self, computation_type: str, key: bytes, model_cls: Type[ModelT]) -> Optional[ModelT]:
+        """``get`` for callers on the event loop; overridden where entries are remote"""
+        return self.get(computation_type, key, model_cls)
+
+    async def fetch_many(self, computation_type: str, keys: List[bytes], model_cls: Type[ModelT]) -> List[Optional[ModelT]]:
+        """Look up several results at once, in order"""
+        return [self.get(computation_type, key, model_cls) for key in keys]
+
+    async def store(self, computation_type: str, key: bytes, result: BaseModel):
+        """``put`` for callers on the event loop; overridden where entries are remote"""
+        self.put(computation_type, key, result)
+
+    def seal(self, key: bytes, result: BaseModel) -> bytes:
+        """Encrypt a result for storage under its entry key"""
+        nonce = os.urandom(NONCE_BYTES)
+        return nonce + self._aead.encrypt(nonce, result.model_dump_json().encode(), key)
+
+    def open(self, key: bytes, blob: Optional[bytes], model_cls: Type[ModelT]) -> Optional[ModelT]:
+        """Decrypt a stored result (None passes through)"""
+        if blob is None:
+            return None
+        plaintext = self._aead.decrypt(blob[:NONCE_BYTES], blob[NONCE_BYTES:], key)
+        return model_cls.model_validate_json(plaintext)
+
+    def get_blob(self, computation_type: str, key: bytes) -> Optional[bytes]:
+        """Encrypted entry for a key, or None on miss or expiry (never decrypts)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._count(computation_type, "misses")
+            return None
+
+        expires_at, blob, _ = entry
+        if self.clock() >= expires_at:
+            self._remove(key)
+            self._count(computation_type, "expirations")
+            self._count(computation_type, "misses")
+            return None
+
+        self._entries.move_to_end(key)
+        self._count(computation_type, "hits")
+        return blob
+
+    def put_blob(self, computation_type: str, key: bytes, blob: bytes):
+        """Store an encrypted entry, evicting LRU entries if over the memory bound"""
+        ttl = self.ttls.get(computation_type, 0)
+        if ttl <= 0:
+            return
+        if len(blob) + ENTRY_OVERHEAD_BYTES > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (self.clock() + ttl, blob, computation_type)
+        self._bytes += len(blob) + ENTRY_OVERHEAD_BYTES
+
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            evicted_type = self._remove(oldest)
+            self._count(evicted_type, "evictions")
+
+    def _remove(self, key: bytes) -> str:
+        """Remove an entry, returning its computation type"""
+        _, blob, computation_type = self._entries.pop(key)
+        self._bytes -= len(blob) + ENTRY_OVERHEAD_BYTES
+        return computation_type
+
+    def _count(self, computation_type: str, counter: str):
+        counters = self._counters.setdefault(
+            computation_type, {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        )
+        counters[counter] += 1
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and memory usage"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "counters": {kind: dict(counters) for kind, counters in self._counters.items()},
+        }
@@ -0,0 +1,173 @@
+"""Fixed-width binary encoding of confidential inputs (see docs/crypto.md)
+
+Every input model is a fixed set of integers, so each request type has one
+fixed layout: a 2-byte header (codec version, request type tag) followed by
+the fields of its three sub-models in declaration order, little-endian, each
+with a declared width. A plan request is 63 bytes against about 330 as JSON.
+
+Values outside a field's width are rejected with InvalidInput rather than
+truncated. Changing a layout means bumping ``CODEC_VERSION``; decoders
+reject versions they do not know.
+"""
+
+import struct
+from operator import attrgetter
+from typing import Dict, List, Tuple, Type
+from pydantic import BaseModel
+from .errors import InvalidInput
+from .models import (
+    CurveEvalRequest,
+    CurveMetrics,
+    CurveState,
+    MarketConditions,
+    PerformanceHistory,
+    PlanRequest,
+    PortfolioContext,
+    RiskScoreRequest,
+    SizingPreferences,
+    UserConstraints,
+    UserHistory,
+    UserPreferences,
+)
+
+CODEC_VERSION = 1
+
+# struct format code for each declared width
+WIDTHS = {
+    "u8": "B", "u16": "H", "u32": "I", "u64": "Q",
+    "i8": "b", "i16": "h", "i32": "i", "i64": "q",
+}
+
+# Field widths per sub-model, in wire order
+FIELDS: Dict[Type[BaseModel], List[Tuple[str, str]]] = {
+    UserPreferences: [
+        ("desired_size", "u64"),
+        ("slippage_tolerance", "u16"),
+        ("risk_appetite", "u8"),
+        ("preferred_hold_time", "u32"),
+    ],
+    UserHistory: [
+        ("recent_pnl", "i64"),
+        ("win_rate", "u16"),
+        ("avg_hold_time", "u32"),
+        ("total_trades", "u32"),
+    ],
+    CurveState: [
+        ("current_price", "u64"),
+        ("liquidity_depth", "u64"),
+        ("volatility", "u32"),
+        ("recent_volume", "u64"),
+    ],
+    PortfolioContext: [
+        ("total_capital", "u64"),
+        ("current_exposure", "u64"),
+        ("diversification_score", "u8"),
+        ("leverage_ratio", "u32"),
+    ],
+    PerformanceHistory: [
+        ("total_pnl", "i64"),
+        ("sharpe_ratio", "i32"),
+        ("max_drawdown", "u16"),
+        ("consistency_score", "u8"),
+    ],
+    MarketConditions: [
+        ("curve_volatility", "u32"),
+        ("liquidity_risk", "u8"),
+        ("market_sentiment", "i8"),
+    ],
+    SizingPreferences: [
+        ("target_size", "u64"),
+        ("min_size", "u64"),
+        ("max_size", "u64"),
+        ("capital_allocation_pct", "u8"),
+    ],
+    UserConstraints: [
+        ("max_slippage_bps", "u16"),
+        ("time_constraint_sec", "u32"),
+        ("priority_level", "u8"),
+    ],
+    CurveMetrics: [
+        ("current_price", "u64"),
+        ("price_change_24h", "i32"),
+        ("liquidity_depth", "u64"),
+        ("buy_pressure", "u32"),
+        ("sell_pressure", "u32"),
+    ],
+}
+
+# Type tag for each request model; never reuse a tag within a codec version
+TAGS: Dict[Type[BaseModel], int] = {
+    PlanRequest: 1,
+    RiskScoreRequest: 2,
+    CurveEvalRequest: 3,
+}
+
+
+class Layout:
+    """Precompiled wire layout of one request model"""
+
+    def __init__(self, model_cls: Type[BaseModel], tag: int):
+        self.model_cls = model_cls
+        self.tag = tag
+        # (attribute name, sub-model class) for each of the request's groups
+        self.groups = [(name, field.annotation) for name, field in model_cls.model_fields.items()]
+        self.paths = [f"{group}.{name}" for group, sub_cls in self.groups for name, _ in FIELDS[sub_cls]]
+        self.widths = [width for _, sub_cls in self.groups for _, width in FIELDS[sub_cls]]
+        self.struct = struct.Struct("<BB" + "".join(WIDTHS[w] for w in self.widths))
+        self.values = attrgetter(*self.paths)
+        # (group, field names, start, end) into the unpacked tuple, after the 2 header values
+        self.slices = []
+        start = 2
+        for group, sub_cls in self.groups:
+            names = [name for name, _ in FIELDS[sub_cls]]
+            self.slices.append((group, names, start, start + len(names)))
+            start += len(names)
+
+    def check(self, values: tuple):
+        """Raise InvalidInput naming the first field outside its width (never its value)"""
+        for path, width, value in zip(self.paths, self.widths, values):
+            bits = int(width[1:])
+            low, high = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if width[0] == "i" else (0, (1 << bits) - 1)
+            if not low <= value <= high:
+                raise InvalidInput(f"Field {path} is outside the {width} range")
+
+
+LAYOUTS: Dict[Type[BaseModel], Layout] = {model_cls: Layout(model_cls, tag) for model_cls, tag in TAGS.items()}
+_BY_TAG = {layout.tag: layout for layout in LAYOUTS.values()}
+
+
+def encoded_size(model_cls: Type[BaseModel]) -> int:
+    """Encoded length in bytes of a request model, header included"""
+    return LAYOUTS[model_cls].struct.size
+
+
+def encode(request: BaseModel) -> bytes:
+    """Encode a request model; raises InvalidInput if a value does not fit its width"""
+    layout = LAYOUTS[type(request)]
+    values = layout.values(request)
+    try:
+        return layout.struct.pack(CODEC_VERSION, layout.tag, *values)
+    except struct.error:
+        layout.check(values)
+        raise
+
+
+def decode(data: bytes, model_cls: Type[BaseModel]) -> BaseModel:
+    """
+    Decode bytes produced by ``encode`` into ``model_cls``
+
+    Raises ValueError if the version, type tag or length does not match.
+    """
+    if len(data) < 2:
+        raise ValueError("Truncated codec header")
+    if data[0] != CODEC_VERSION:
+        raise ValueError(f"Unsupported codec version {data[0]}")
+    layout = _BY_TAG.get(data[1])
+    if layout is None or layout.model_cls is not model_cls:
+        raise ValueError("Codec type tag does not match the expected model")
+    if len(data) != layout.struct.size:
+        raise ValueError("Codec payload length does not match its layout")
+    values = layout.struct.unpack(data)
+    return model_cls.model_validate({
+        group: dict(zip(names, values[start:end])) for group, names, start, end in layout.slices
+    })
@@ -0,0 +1,203 @@
+"""Client-side encryption of confidential inputs (see docs/crypto.md)
+
+Inputs are encrypted to the MXE cluster with X25519 key agreement, HKDF-SHA256
+and AES-256-GCM. The cluster derives the same key from the client's public
+key, and encrypts each result back under it.
+
+Deriving a shared secret costs an X25519 scalar multiplication. With an
+``EphemeralKeyPool`` (key_pool.py) every payload gets a fresh single-use key
+derived ahead of time; without one, the static client key is used and its
+derived cipher is cached per peer key, re-derived only after a TTL.
+Batches are encrypted in chunks on an executor so large submissions do not
+block the event loop.
+"""
+
+import asyncio
+import base64
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional, Tuple
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+if TYPE_CHECKING:
+    from .key_pool import EphemeralKey, EphemeralKeyPool
+
+KEY_BYTES = 32
+NONCE_BYTES = 12
+HKDF_INFO = b"evalys-arcium-bridge/v1/confidential-payload"
+
+# Smaller batches are encrypted inline; handing them to a worker costs more than it saves
+INLINE_MAX_PAYLOADS = 16
+
+
+class SealedInput(NamedTuple):
+    """
+    One encrypted input
+
+    ``public_key``, ``nonce`` and ``ciphertext`` go to the MXE. ``cipher`` is
+    the derived AES-GCM key, kept on the bridge to decrypt the matching
+    result; it is never sent or logged.
+    """
+    public_key: bytes
+    nonce: bytes
+    ciphertext: bytes
+    cipher: AESGCM
+
+
+def associated_data(direction: str, computation_type: str) -> bytes:
+    """
+    AES-GCM associated data binding a payload to its direction and computation
+
+    An input cannot be replayed as a result, or as an input to another
+    computation type, without failing authentication.
+    """
+    return f"{direction}:{computation_type}".encode()
+
+
+def load_private_key(encoded: Optional[str]) -> X25519PrivateKey:
+    """X25519 private key from 32 base64-encoded bytes, or a fresh one if not configured"""
+    if not encoded:
+        return X25519PrivateKey.generate()
+    raw = base64.b64decode(encoded, validate=True)
+    if len(raw) != KEY_BYTES:
+        raise ValueError(f"Encryption key must be {KEY_BYTES} bytes")
+    return X25519PrivateKey.from_private_bytes(raw)
+
+
+def public_key_bytes(private_key: X25519PrivateKey) -> bytes:
+    return private_key.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+
+
+def derive_cipher(private_key: X25519PrivateKey, peer_public_key: bytes) -> AESGCM:
+    """AES-256-GCM cipher under the HKDF-expanded X25519 shared secret"""
+    shared = private_key.exchange(X25519PublicKey.from_public_bytes(peer_public_key))
+    key = HKDF(algorithm=hashes.SHA256(), length=KEY_BYTES, salt=None, info=HKDF_INFO).derive(shared)
+    return AESGCM(key)
+
+
+class SharedSecretCache:
+    """
+    Derived ciphers for one local private key, keyed by peer public key
+
+    Entries expire ``ttl_sec`` after derivation so key rotation on either
+    side takes effect without a restart. At most ``max_entries`` peers are
+    kept (least recently used evicted).
+    """
+
+    def __init__(
+        self,
+        private_key: X25519PrivateKey,
+        ttl_sec: float = 3600.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.private_key = private_key
+        self.public_key = public_key_bytes(private_key)
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.clock = clock
+        self._ciphers: "OrderedDict[bytes, Tuple[float, AESGCM]]" = OrderedDict()
+        self._derived = 0
+        self._hits = 0
+
+    def get(self, peer_public_key: bytes) -> AESGCM:
+        now = self.clock()
+        entry = self._ciphers.get(peer_public_key)
+        if entry is not None and entry[0] > now:
+            self._ciphers.move_to_end(peer_public_key)
+            self._hits += 1
+            return entry[1]
+        cipher = derive_cipher(self.private_key, peer_public_key)
+        self._derived += 1
+        self._ciphers[peer_public_key] = (now + self.ttl_sec, cipher)
+        self._ciphers.move_to_end(peer_public_key)
+        while len(self._ciphers) > self.max_entries:
+            self._ciphers.popitem(last=False)
+        return cipher
+
+    def stats(self) -> dict:
+        return {"derived": self._derived, "hits": self._hits, "cached": len(self._ciphers)}
+
+
+def _seal_chunk(public_key: bytes, cipher: AESGCM, plaintexts: List[bytes], aad: bytes) -> List[SealedInput]:
+    """Encrypt a chunk of payloads; pure CPU work, safe to run in a worker"""
+    sealed = []
+    for plaintext in plaintexts:
+        nonce = os.urandom(NONCE_BYTES)
+        sealed.append(SealedInput(public_key, nonce, cipher.encrypt(nonce, plaintext, aad), cipher))
+    return sealed
+
+
+def _seal_ephemeral_chunk(keys: List["EphemeralKey"], plaintexts: List[bytes], aad: bytes) -> List[SealedInput]:
+    """Encrypt a chunk of payloads, each under its own single-use key and nonce"""
+    return [
+        SealedInput(key.public_key, key.nonce, key.cipher.encrypt(key.nonce, plaintext, aad), key.cipher)
+        for key, plaintext in zip(keys, plaintexts)
+    ]
+
+
+class InputEncryptor:
+    """
+    Encrypts confidential inputs to an MXE cluster key
+
+    ``encrypt_batch`` takes every payload of a submission at once and seals
+    them in chunks of ``chunk_size`` on ``executor`` (the loop's default
+    executor if None). Each payload uses a key from ``key_pool`` when one is
+    given for the same cluster key, otherwise the static key's cached cipher.
+    Results are opened with the cipher carried by their SealedInput.
+    """
+
+    def __init__(
+        self,
+        private_key: Optional[str] = None,
+        secret_ttl_sec: float = 3600.0,
+        chunk_size: int = 256,
+        executor: Optional[Executor] = None,
+        key_pool: Optional["EphemeralKeyPool"] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.secrets = SharedSecretCache(load_private_key(private_key), ttl_sec=secret_ttl_sec, clock=clock)
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.key_pool = key_pool
+        self._encrypted = 0
+
+    def _sealer(self, cluster_key: bytes, plaintexts: List[bytes], aad: bytes):
+        """Seal function and per-chunk argument builder for these payloads"""
+        if self.key_pool is not None and self.key_pool.cluster_public_key == cluster_key:
+            keys = [self.key_pool.take() for _ in plaintexts]
+            return _seal_ephemeral_chunk, lambda start, end: (keys[start:end], plaintexts[start:end], aad)
+        public_key, cipher = self.secrets.public_key, self.secrets.get(cluster_key)
+        return _seal_chunk, lambda start, end: (public_key, cipher, plaintexts[start:end], aad)
+
+    def encrypt(self, cluster_key: bytes, plaintext: bytes, aad: bytes = b"") -> SealedInput:
+        """Encrypt one payload synchronously"""
+        self._encrypted += 1
+        seal, args = self._sealer(cluster_key, [plaintext], aad)
+        return seal(*args(0, 1))[0]
+
+    async def encrypt_batch(self, cluster_key: bytes, plaintexts: List[bytes], aad: bytes = b"") -> List[SealedInput]:
+        """Encrypt many payloads without blocking the event loop, returned in order"""
+        self._encrypted += len(plaintexts)
+        seal, args = self._sealer(cluster_key, plaintexts, aad)
+        if len(plaintexts) < INLINE_MAX_PAYLOADS:
+            return seal(*args(0, len(plaintexts)))
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, seal, *args(start, start + self.chunk_size))
+            for start in range(0, len(plaintexts), self.chunk_size)
+        ))
+        return [sealed for chunk in chunks for sealed in chunk]
+
+    def stats(self) -> dict:
+        """Payloads encrypted, shared-secret cache usage and ephemeral key pool state"""
+        stats = {"encrypted": self._encrypted, "secrets": self.secrets.stats()}
+        if self.key_pool is not None:
+            stats["key_pool"] = self.key_pool.stats()
+        return stats
@@ -0,0 +1,299 @@
+"""Vectorized NumPy engine for the simulated computations
+
+Runs the same integer formulas as the scalar simulated path in
+``ArciumBridgeClient`` over struct-of-arrays inputs, one NumPy column per
+model field. Results are bit-identical to the scalar path as long as every
+input is within ``MAX_SAFE_INPUT`` (so no int64 intermediate can overflow).
+"""
+
+from typing import List, NamedTuple
+import numpy as np
+from .models import (
+    StrategyPlan,
+    RiskAssessment,
+    ExecutionRecommendation,
+    PlanRequest,
+    RiskScoreRequest,
+    CurveEvalRequest,
+)
+
+# Largest intermediate is current_exposure * 255, which must fit in int64
+MAX_SAFE_INPUT = 2**55
+
+MODE_NAMES = ("normal", "stealth", "max_ghost")
+RECOMMENDATION_NAMES = ("proceed", "caution", "avoid")
+SIMULATED_PLAN_ID = "mxe-simulated-123"
+
+
+# Column sets (only the fields each formula reads)
+class PlanInputs(NamedTuple):
+    """Strategy plan input columns"""
+    desired_size: np.ndarray
+    risk_appetite: np.ndarray
+    recent_pnl: np.ndarray
+    win_rate: np.ndarray
+    volatility: np.ndarray
+
+
+class PlanOutputs(NamedTuple):
+    """Strategy plan result columns (recommended_mode indexes MODE_NAMES)"""
+    recommended_mode: np.ndarray
+    num_slices: np.ndarray
+    slice_size_base: np.ndarray
+    timing_window_sec: np.ndarray
+    risk_level: np.ndarray
+    max_notional: np.ndarray
+
+
+class RiskInputs(NamedTuple):
+    """Risk score input columns"""
+    total_capital: np.ndarray
+    current_exposure: np.ndarray
+    total_pnl: np.ndarray
+    sharpe_ratio: np.ndarray
+    curve_volatility: np.ndarray
+
+
+class RiskOutputs(NamedTuple):
+    """Risk assessment result columns (recommendation indexes RECOMMENDATION_NAMES)"""
+    overall_risk_score: np.ndarray
+    portfolio_risk: np.ndarray
+    trade_risk: np.ndarray
+    recommendation: np.ndarray
+
+
+class CurveInputs(NamedTuple):
+    """Curve evaluation input columns"""
+    target_size: np.ndarray
+    min_size: np.ndarray
+    max_size: np.ndarray
+    time_constraint_sec: np.ndarray
+    priority_level: np.ndarray
+    current_price: np.ndarray
+    price_change_24h: np.ndarray
+    liquidity_depth: np.ndarray
+    buy_pressure: np.ndarray
+    sell_pressure: np.ndarray
+
+
+class CurveOutputs(NamedTuple):
+    """Execution recommendation result columns"""
+    recommended_size: np.ndarray
+    entry_price_target: np.ndarray
+    execution_urgency: np.ndarray
+    optimal_timing: np.ndarray
+    confidence_score: np.ndarray
+
+
+def _column(values) -> np.ndarray:
+    """Build an int64 column, raising OverflowError for out-of-range values"""
+    return np.array(values, dtype=np.int64)
+
+
+def within_safe_range(inputs: NamedTuple) -> bool:
+    """Check that every input column is within MAX_SAFE_INPUT"""
+    # Compare the bounds directly: np.abs wraps INT64_MIN back to itself
+    return all(
+        column.size == 0 or (int(column.min()) > -MAX_SAFE_INPUT and int(column.max()) < MAX_SAFE_INPUT)
+        for column in inputs
+    )
+
+
+# Strategy Plan
+def compute_plans(inputs: PlanInputs) -> PlanOutputs:
+    """Vectorized equivalent of ArciumBridgeClient._simulate_plan"""
+    desired_size = inputs.desired_size
+    volatility = inputs.volatility
+
+    base_risk = np.where(
+        inputs.recent_pnl < 0,
+        inputs.risk_appetite + 50,
+        np.where(
+            inputs.win_rate < 5000,
+            inputs.risk_appetite + 30,
+            np.maximum(0, inputs.risk_appetite - 20),
+        ),
+    )
+    risk_score = np.minimum(255, base_risk + volatility // 10)
+
+    recommended_mode = np.where(risk_score > 200, 2, np.where(risk_score > 100, 1, 0)).astype(np.uint8)
+    num_slices = np.where(
+        desired_size > 10_000_000_000, 8, np.where(desired_size > 1_000_000_000, 5, 3)
+    ).astype(np.int64)
+
+    return PlanOutputs(
+        recommended_mode=recommended_mode,
+        num_slices=num_slices,
+        slice_size_base=desired_size // num_slices,
+        timing_window_sec=np.where(volatility > 500, 60, np.where(volatility > 200, 120, 300)).astype(np.int64),
+        risk_level=risk_score,
+        max_notional=np.where(
+            (inputs.risk_appetite > 200) & (inputs.win_rate > 6000), desired_size * 2, desired_size
+        ),
+    )
+
+
+def plan_inputs(requests: List[PlanRequest]) -> PlanInputs:
+    """Transpose strategy plan requests into input columns"""
+    return PlanInputs(
+        desired_size=_column([r.user_preferences.desired_size for r in requests]),
+        risk_appetite=_column([r.user_preferences.risk_appetite for r in requests]),
+        recent_pnl=_column([r.user_history.recent_pnl for r in requests]),
+        win_rate=_column([r.user_history.win_rate for r in requests]),
+        volatility=_column([r.curve_state.volatility for r in requests]),
+    )
+
+
+def plan_models(outputs: PlanOutputs) -> List[StrategyPlan]:
+    """Convert strategy plan result columns back into models"""
+    return [
+        StrategyPlan(
+            plan_id=SIMULATED_PLAN_ID,
+            recommended_mode=MODE_NAMES[mode],
+            num_slices=num_slices,
+            slice_size_base=slice_size_base,
+            timing_window_sec=timing_window_sec,
+            risk_level=risk_level,
+            max_notional=max_notional,
+        )
+        for mode, num_slices, slice_size_base, timing_window_sec, risk_level, max_notional in zip(
+            *(column.tolist() for column in outputs)
+        )
+    ]
+
+
+# Risk Score
+def compute_risk_scores(inputs: RiskInputs) -> RiskOutputs:
+    """Vectorized equivalent of ArciumBridgeClient._simulate_risk_score"""
+    total_capital = inputs.total_capital
+    curve_volatility = inputs.curve_volatility
+
+    has_capital = total_capital > 0
+    exposure_ratio = np.where(
+        has_capital,
+        (inputs.current_exposure * 255) // np.where(has_capital, total_capital, 1),
+        255,
+    )
+    portfolio_risk = np.minimum(255, np.maximum(100, exposure_ratio))
+    trade_risk = np.where(curve_volatility > 500, 255, np.where(curve_volatility > 300, 200, 100)).astype(np.int64)
+
+    overall_risk = (portfolio_risk + trade_risk) // 2
+    overall_risk = np.where(
+        inputs.total_pnl < 0,
+        np.minimum(255, overall_risk + 50),
+        np.where(inputs.sharpe_ratio > 100, np.maximum(0, overall_risk - 30), overall_risk),
+    )
+
+    return RiskOutputs(
+        overall_risk_score=overall_risk,
+        portfolio_risk=portfolio_risk,
+        trade_risk=trade_risk,
+        recommendation=np.where(overall_risk > 200, 2, np.where(overall_risk > 150, 1, 0)).astype(np.uint8),
+    )
+
+
+def risk_inputs(requests: List[RiskScoreRequest]) -> RiskInputs:
+    """Transpose risk score requests into input columns"""
+    return RiskInputs(
+        total_capital=_column([r.portfolio_context.total_capital for r in requests]),
+        current_exposure=_column([r.portfolio_context.current_exposure for r in requests]),
+        total_pnl=_column([r.performance_history.total_pnl for r in requests]),
+        sharpe_ratio=_column([r.performance_history.sharpe_ratio for r in requests]),
+        curve_volatility=_column([r.market_conditions.curve_volatility for r in requests]),
+    )
+
+
+def risk_models(outputs: RiskOutputs) -> List[RiskAssessment]:
+    """Convert risk assessment result columns back into models"""
+    return [
+        RiskAssessment(
+            overall_risk_score=overall_risk_score,
+            portfolio_risk=portfolio_risk,
+            trade_risk=trade_risk,
+            recommendation=RECOMMENDATION_NAMES[recommendation],
+        )
+        for overall_risk_score, portfolio_risk, trade_risk, recommendation in zip(
+            *(column.tolist() for column in outputs)
+        )
+    ]
+
+
+# Curve Evaluation
+def compute_curve_evaluations(inputs: CurveInputs) -> CurveOutputs:
+    """Vectorized equivalent of ArciumBridgeClient._simulate_curve_evaluation"""
+    liquidity_depth = inputs.liquidity_depth
+    current_price = inputs.current_price
+    price_change_24h = inputs.price_change_24h
+    buy_pressure = inputs.buy_pressure
+    sell_pressure = inputs.sell_pressure
+
+    recommended_size = np.minimum(
+        inputs.max_size,
+        np.maximum(
+            inputs.min_size,
+            np.where(liquidity_depth < inputs.max_size * 2, (liquidity_depth * 3) // 4, inputs.target_size),
+        ),
+    )
+
+    entry_price_target = np.where(
+        price_change_24h > 1000,
+        (current_price * 101) // 100,
+        np.where(price_change_24h < -1000, (current_price * 99) // 100, current_price),
+    )
+
+    execution_urgency = np.where(
+        buy_pressure > sell_pressure * 2, 200, np.where(sell_pressure > buy_pressure * 2, 50, 100)
+    )
+    execution_urgency = (execution_urgency + inputs.priority_level) // 2
+
+    confidence_score = np.where(
+        liquidity_depth > recommended_size * 3, 200, np.where(liquidity_depth > recommended_size, 150, 100)
+    ).astype(np.int64)
+
+    return CurveOutputs(
+        recommended_size=recommended_size,
+        entry_price_target=entry_price_target,
+        execution_urgency=execution_urgency,
+        optimal_timing=np.minimum(inputs.time_constraint_sec, np.where(execution_urgency > 200, 60, 300)),
+        confidence_score=confidence_score,
+    )
+
+
+def curve_inputs(requests: List[CurveEvalRequest]) -> CurveInputs:
+    """Transpose curve evaluation requests into input columns"""
+    return CurveInputs(
+        target_size=_column([r.sizing_preferences.target_size for r in requests]),
+        min_size=_column([r.sizing_preferences.min_size for r in requests]),
+        max_size=_column([r.sizing_preferences.max_size for r in requests]),
+        time_constraint_sec=_column([r.user_constraints.time_constraint_sec for r in requests]),
+        priority_level=_column([r.user_constraints.priority_level for r in requests]),
+        current_price=_column([r.curve_metrics.current_price for r in requests]),
+        price_change_24h=_column([r.curve_metrics.price_change_24h for r in requests]),
+        liquidity_depth=_column([r.curve_metrics.liquidity_depth for r in requests]),
+        buy_pressure=_column([r.curve_metrics.buy_pressure for r in requests]),
+        sell_pressure=_column([r.curve_metrics.sell_pressure for r in requests]),
+    )
+
+
+def curve_models(outputs: CurveOutputs) -> List[ExecutionRecommendation]:
+    """Convert execution recommendation result columns back into models"""
+    return [
+        ExecutionRecommendation(
+            recommended_size=recommended_size,
+            entry_price_target=entry_price_target,
+            execution_urgency=execution_urgency,
+            optimal_timing=optimal_timing,
+            confidence_score=confidence_score,
+        )
+        for recommended_size, entry_price_target, execution_urgency, optimal_timing, confidence_score in zip(
+            *(column.tolist() for column in outputs)
+        )
+    ]
+
+
+# Column conversion, vectorized computation and model conversion for each computation type
+PIPELINES = {
+    "plan": (plan_inputs, compute_plans, plan_models),
+    "risk-score": (risk_inputs, compute_risk_scores, risk_models),
+    "curve-eval": (curve_inputs, compute_curve_evaluations, curve_models),
+}
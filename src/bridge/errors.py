@@ -0,0 +1,121 @@
+"""Bridge error types matching the failure modes in docs/bridge-spec.md"""
+
+from typing import Optional
+
+
+class BridgeError(Exception):
+    """
+    Base class for errors with a spec-defined client response
+
+    Subclasses set the error code, HTTP status, default message, default
+    ``retry_after`` and whether the bridge may retry the operation itself.
+    Messages must never contain sensitive input or result values.
+    """
+
+    code = "bridge_error"
+    status_code = 500
+    default_message = "Bridge error"
+    default_retry_after: Optional[int] = None
+    retryable = False
+
+    def __init__(self, message: Optional[str] = None, retry_after: Optional[int] = None):
+        self.message = message or self.default_message
+        self.retry_after = retry_after if retry_after is not None else self.default_retry_after
+        super().__init__(self.message)
+
+    def to_response(self) -> dict:
+        """Client response body, as specified in docs/bridge-spec.md"""
+        body = {"error": self.code, "message": self.message}
+        if self.retry_after is not None:
+            body["retry_after"] = self.retry_after
+        return body
+
+
+class ComputationTimeout(BridgeError):
+    """MXE computation exceeded the timeout window"""
+    code = "computation_timeout"
+    status_code = 504
+    default_message = "Arcium computation exceeded timeout"
+    default_retry_after = 5
+    retryable = True
+
+
+class InvalidReceipt(BridgeError):
+    """Receipt signature or result hash verification failed (never retried)"""
+    code = "invalid_receipt"
+    status_code = 502
+    default_message = "Receipt verification failed"
+
+
+class SimulationFailed(BridgeError):
+    """Solana transaction simulation failed before submission (never retried)"""
+    code = "simulation_failed"
+    status_code = 502
+    default_message = "Transaction simulation failed"
+
+
+class NetworkError(BridgeError):
+    """Arcium MXE or Solana RPC unreachable"""
+    code = "network_error"
+    status_code = 503
+    default_message = "Failed to connect to Arcium service"
+    default_retry_after = 10
+    retryable = True
+
+
+class CircuitOpen(NetworkError):
+    """Circuit breaker is open for the dependency; fail fast instead of retrying"""
+    default_message = "Arcium service unavailable (circuit open)"
+    retryable = False
+
+
+class DecryptionFailed(BridgeError):
+    """Arcium result could not be decrypted (never retried)"""
+    code = "decryption_failed"
+    status_code = 502
+    default_message = "Failed to decrypt Arcium result"
+
+
+class InvalidIntent(BridgeError):
+    """Intent envelope is malformed, unsupported or outside the freshness window"""
+    code = "invalid_intent"
+    status_code = 400
+    default_message = "Invalid intent envelope"
+
+
+class ReplayedIntent(BridgeError):
+    """Intent envelope nonce was already used (never retried)"""
+    code = "replayed_intent"
+    status_code = 409
+    default_message = "Intent nonce already used"
+
+
+class ReplayStoreFull(BridgeError):
+    """Replay store is at its memory budget; the client may retry shortly"""
+    code = "replay_store_full"
+    status_code = 503
+    default_message = "Too many intents in the replay window"
+    default_retry_after = 1
+
+
+class InvalidInput(BridgeError):
+    """Input value does not fit the confidential payload encoding (never retried)"""
+    code = "invalid_input"
+    status_code = 422
+    default_message = "Input value outside the supported range"
+
+
+class Overloaded(BridgeError):
+    """Too many computations of this type are running and queued; the client should back off"""
+    code = "overloaded"
+    status_code = 503
+    default_message = "Too many pending computations"
+    default_retry_after = 1
+
+
+class RateLimited(BridgeError):
+    """The calling client has used up its request or MXE cost budget; it may retry after retry_after"""
+    code = "rate_limited"
+    status_code = 429
+    default_message = "Client rate limit exceeded"
+    default_retry_after = 1
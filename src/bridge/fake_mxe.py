@@ -0,0 +1,270 @@
+"""In-process stand-in for the Arcium MXE, for offline testing and benchmarks
+
+Implements the submit -> monitor -> receipt flow from docs/bridge-spec.md
+with configurable latency and injected failures, so concurrency, retries,
+batching, encryption and receipt handling can be exercised without a
+devnet. Selected with ``ARCIUM_BACKEND=fake``; never use it in production.
+
+Wire format: each input is encoded with codec.py, sealed separately (see
+encryption.py), and the receipt's ``encrypted_output`` holds one sealed result per input, in order,
+each encrypted under its input's key and framed as
+``nonce (12 bytes) | ciphertext length (4 bytes, big-endian) | ciphertext``.
+"""
+
+import asyncio
+import base64
+import json
+import math
+import os
+import random
+import struct
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from ..utils.logger import get_logger
+from . import codec
+from .encryption import NONCE_BYTES, SealedInput, SharedSecretCache, associated_data
+from .errors import ComputationTimeout, DecryptionFailed, SimulationFailed
+from .models import CurveEvalRequest, PlanRequest, ProofReceiptV1, ReceiptResult, RiskScoreRequest
+from .receipts import result_hash, signing_payload
+
+if TYPE_CHECKING:
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+
+logger = get_logger(__name__)
+
+# Input model for each computation type
+REQUEST_MODELS = {
+    "plan": PlanRequest,
+    "risk-score": RiskScoreRequest,
+    "curve-eval": CurveEvalRequest,
+}
+
+
+_LENGTH = struct.Struct(">I")
+
+
+def pack_sealed(items: List[Tuple[bytes, bytes]]) -> bytes:
+    """Frame (nonce, ciphertext) pairs into one output blob"""
+    return b"".join(nonce + _LENGTH.pack(len(ciphertext)) + ciphertext for nonce, ciphertext in items)
+
+
+def unpack_sealed(data: bytes) -> List[Tuple[bytes, bytes]]:
+    """Split an output blob back into (nonce, ciphertext) pairs; raises ValueError if truncated"""
+    items = []
+    offset = 0
+    while offset < len(data):
+        header_end = offset + NONCE_BYTES + _LENGTH.size
+        if header_end > len(data):
+            raise ValueError("Truncated output header")
+        (length,) = _LENGTH.unpack_from(data, offset + NONCE_BYTES)
+        if header_end + length > len(data):
+            raise ValueError("Truncated output ciphertext")
+        items.append((data[offset:offset + NONCE_BYTES], data[header_end:header_end + length]))
+        offset = header_end + length
+    return items
+
+
+def decode_outputs(encrypted_output: str, sealed: List[SealedInput], computation_type: str, model_cls) -> list:
+    """
+    Decrypt a receipt's output into one result model or exception per input
+
+    Raises DecryptionFailed if any result cannot be decrypted or decoded.
+    Items the MXE could not compute become SimulationFailed.
+    """
+    aad = associated_data("output", computation_type)
+    try:
+        items = unpack_sealed(base64.b64decode(encrypted_output, validate=True))
+        if len(items) != len(sealed):
+            raise ValueError("Result count does not match input count")
+        results = []
+        for (nonce, ciphertext), sealed_input in zip(items, sealed):
+            item = json.loads(sealed_input.cipher.decrypt(nonce, ciphertext, aad))
+            results.append(SimulationFailed(item["error"]) if "error" in item else model_cls.model_validate(item["ok"]))
+        return results
+    except (ValueError, TypeError, KeyError, InvalidTag) as e:
+        raise DecryptionFailed() from e
+
+
+class Latency:
+    """
+    Log-normal latency distribution
+
+    ``median_ms`` is the median; ``sigma`` the shape (0 gives a constant
+    latency, 0.5 a moderate tail, 1.0 a heavy one).
+    """
+
+    def __init__(self, median_ms: float, sigma: float = 0.0):
+        self.median_ms = median_ms
+        self.sigma = sigma
+
+    def sample(self, rng: random.Random) -> float:
+        """One latency in seconds"""
+        if self.median_ms <= 0:
+            return 0.0
+        if self.sigma <= 0:
+            return self.median_ms / 1000
+        return rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+class FakeMxe:
+    """
+    Simulated MXE cluster with an X25519 cluster key and a signing node key
+
+    ``submit`` stands in for the Solana transaction that queues a
+    computation; ``await_completion`` for monitoring it until the node
+    posts a signed ``ProofReceiptV1``. Inputs are decrypted with the
+    cluster key and each result is encrypted back under its input's key.
+    Results come from ``compute``
+    (computation type, request models) -> results or exceptions, so the
+    stand-in returns the same values as the inline simulation.
+
+    Failures are injected per call with the configured probabilities:
+    network errors on submit (ConnectionError, retried by the bridge),
+    computations that never complete (ComputationTimeout), receipts with a
+    bad signature, and outputs that cannot be decrypted. With ``capacity``
+    set, at most that many computations run at once and the rest queue.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[str, list], list],
+        submit_latency: Optional[Latency] = None,
+        compute_latency: Optional[Latency] = None,
+        capacity: int = 0,
+        network_error_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        invalid_receipt_rate: float = 0.0,
+        decryption_failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        node_keypair: Optional["Keypair"] = None,
+    ):
+        from solders.keypair import Keypair
+
+        self.compute = compute
+        self.submit_latency = submit_latency or Latency(0)
+        self.compute_latency = compute_latency or Latency(0)
+        self.network_error_rate = network_error_rate
+        self.timeout_rate = timeout_rate
+        self.invalid_receipt_rate = invalid_receipt_rate
+        self.decryption_failure_rate = decryption_failure_rate
+        self.rng = random.Random(seed)
+        self.node_keypair = node_keypair or Keypair()
+        self._secrets = SharedSecretCache(X25519PrivateKey.generate())
+        self._slots = asyncio.Semaphore(capacity) if capacity > 0 else None
+        self._pending: Dict[str, Tuple[str, List[SealedInput]]] = {}
+        self._counts = {
+            "submitted": 0,
+            "completed": 0,
+            "network_errors": 0,
+            "timeouts": 0,
+            "invalid_receipts": 0,
+            "decryption_failures": 0,
+        }
+
+    @property
+    def cluster_public_key(self) -> bytes:
+        """X25519 key the bridge encrypts inputs to"""
+        return self._secrets.public_key
+
+    @property
+    def node_public_key(self) -> "Pubkey":
+        """Key the bridge must trust to verify this stand-in's receipts"""
+        return self.node_keypair.pubkey()
+
+    def _chance(self, rate: float) -> bool:
+        return rate > 0 and self.rng.random() < rate
+
+    async def submit(self, computation_type: str, encrypted_inputs: List[SealedInput]) -> str:
+        """Queue a computation and return its computation id"""
+        await asyncio.sleep(self.submit_latency.sample(self.rng))
+        if self._chance(self.network_error_rate):
+            self._counts["network_errors"] += 1
+            raise ConnectionError("fake MXE: injected network error")
+        if computation_type not in REQUEST_MODELS:
+            raise ValueError(f"Unknown computation type: {computation_type}")
+        computation_id = f"fake-{uuid.uuid4().hex}"
+        self._pending[computation_id] = (computation_type, encrypted_inputs)
+        self._counts["submitted"] += 1
+        return computation_id
+
+    async def await_completion(self, computation_id: str, timeout: float) -> ProofReceiptV1:
+        """
+        Wait for a computation's receipt
+
+        Raises ComputationTimeout if it does not complete within ``timeout``
+        seconds (including time queued for capacity).
+        """
+        computation_type, encrypted_inputs = self._pending.pop(computation_id)
+        hang = self._chance(self.timeout_rate)
+        try:
+            return await asyncio.wait_for(
+                self._run(computation_id, computation_type, encrypted_inputs, hang),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            self._counts["timeouts"] += 1
+            raise ComputationTimeout() from None
+
+    async def _run(
+        self,
+        computation_id: str,
+        computation_type: str,
+        encrypted_inputs: List[SealedInput],
+        hang: bool,
+    ) -> ProofReceiptV1:
+        if self._slots is not None:
+            await self._slots.acquire()
+        try:
+            if hang:
+                await asyncio.Event().wait()
+            await asyncio.sleep(self.compute_latency.sample(self.rng))
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+        model_cls = REQUEST_MODELS[computation_type]
+        input_aad = associated_data("input", computation_type)
+        output_aad = associated_data("output", computation_type)
+        # Only the public key, nonce and ciphertext are used; the bridge's cipher stays on its side
+        ciphers = [self._secrets.get(item.public_key) for item in encrypted_inputs]
+        requests = [
+            codec.decode(cipher.decrypt(item.nonce, item.ciphertext, input_aad), model_cls)
+            for item, cipher in zip(encrypted_inputs, ciphers)
+        ]
+        sealed = []
+        for result, cipher in zip(self.compute(computation_type, requests), ciphers):
+            item = {"error": "Computation failed"} if isinstance(result, Exception) else {"ok": result.model_dump()}
+            nonce = os.urandom(NONCE_BYTES)
+            sealed.append((nonce, cipher.encrypt(nonce, json.dumps(item, separators=(",", ":")).encode(), output_aad)))
+        output = pack_sealed(sealed)
+        if self._chance(self.decryption_failure_rate):
+            self._counts["decryption_failures"] += 1
+            output = self.rng.randbytes(len(output))
+        self._counts["completed"] += 1
+        return self._receipt(computation_id, output)
+
+    def _receipt(self, computation_id: str, output: bytes) -> ProofReceiptV1:
+        encrypted_output = base64.b64encode(output).decode()
+        receipt = ProofReceiptV1(
+            receipt_id=f"receipt-{uuid.uuid4().hex}",
+            computation_id=computation_id,
+            result_hash=result_hash(encrypted_output),
+            signature="",
+            timestamp=datetime.now(timezone.utc),
+            status="completed",
+            result=ReceiptResult(encrypted_output=encrypted_output),
+        )
+        payload = signing_payload(receipt)
+        if self._chance(self.invalid_receipt_rate):
+            self._counts["invalid_receipts"] += 1
+            payload += b"tampered"
+        receipt.signature = str(self.node_keypair.sign_message(payload))
+        return receipt
+
+    def stats(self) -> dict:
+        """Submitted and completed computations, and injected failures"""
+        return {**self._counts, "pending": len(self._pending)}
@@ -0,0 +1,126 @@
+"""Hedged requests to cut tail latency on routed RPC and relay calls"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, Set, TypeVar
+from ..utils.logger import get_logger
+from .routing import Endpoint, EndpointRouter
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate call to a second endpoint when the first is slow
+
+    If the primary endpoint has not answered within its learned latency
+    percentile, the same call is sent to the next-best endpoint and the
+    first valid response wins; the other call is cancelled. Hedges are
+    limited to ``max_fraction`` of hedge-eligible calls so a slow cluster
+    cannot double its own load.
+
+    Only idempotent calls may be hedged: reads such as status queries, or
+    re-broadcasts of one already-signed transaction, which the chain
+    deduplicates by signature so it commits at most once.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_fraction: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.005,
+    ):
+        self.percentile = percentile
+        self.max_fraction = max_fraction
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.calls = 0
+        self.sent = 0
+        self.won = 0
+        self.over_budget = 0
+
+    def delay_for(self, endpoint: Endpoint) -> Optional[float]:
+        """Hedge delay for an endpoint, or None until enough latency samples exist"""
+        latencies = sorted(latency for latency, ok in endpoint.samples if ok)
+        if len(latencies) < self.min_samples:
+            return None
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return max(self.min_delay, latencies[index])
+
+    def _acquire(self) -> bool:
+        """Take a hedge from the budget if doing so stays within max_fraction"""
+        if self.sent + 1 > self.max_fraction * self.calls:
+            self.over_budget += 1
+            return False
+        self.sent += 1
+        return True
+
+    async def call(
+        self,
+        router: EndpointRouter,
+        fn: Callable[[str], Awaitable[T]],
+        is_endpoint_failure: Callable[[Exception], bool] = lambda e: True,
+    ) -> T:
+        """
+        Run fn(url) on the best endpoint, hedging to a second one if it is slow
+
+        Falls back to the router's ordinary failover once both calls fail
+        with endpoint failures. Request errors are raised immediately.
+        """
+        self.calls += 1
+        primary = router.select()
+        delay = self.delay_for(primary)
+        tried = [primary]
+        primary_task = asyncio.ensure_future(router.attempt(primary, fn, is_endpoint_failure))
+        pending: Set[asyncio.Future] = {primary_task}
+        hedge_task: Optional[asyncio.Future] = None
+        last_error: Optional[Exception] = None
+
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                secondary = router.select(exclude=tried) if not done else None
+                if secondary is not None and self._acquire():
+                    tried.append(secondary)
+                    hedge_task = asyncio.ensure_future(router.attempt(secondary, fn, is_endpoint_failure))
+                    pending.add(hedge_task)
+                elif secondary is not None:
+                    secondary.probing = False
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task, error in [(task, task.exception()) for task in done]:
+                    if error is None:
+                        if task is hedge_task:
+                            self.won += 1
+                        return task.result()
+                    if not is_endpoint_failure(error):
+                        raise error
+                    last_error = error
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Both calls failed on their endpoints: continue failing over as usual
+        while True:
+            endpoint = router.select(exclude=tried)
+            if endpoint is None:
+                raise last_error
+            tried.append(endpoint)
+            try:
+                return await router.attempt(endpoint, fn, is_endpoint_failure)
+            except Exception as e:
+                if not is_endpoint_failure(e):
+                    raise
+                last_error = e
+
+    def stats(self) -> dict:
+        """Hedge-eligible calls, hedges sent and hedges that answered first"""
+        return {
+            "calls": self.calls,
+            "sent": self.sent,
+            "won": self.won,
+            "over_budget": self.over_budget,
+        }
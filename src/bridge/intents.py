@@ -0,0 +1,112 @@
+"""Ingestion of IntentEnvelopeV1 messages with replay prevention"""
+
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from ..utils.logger import get_logger
+from .errors import InvalidIntent, ReplayedIntent, ReplayStoreFull
+from .models import IntentAck, IntentEnvelopeV1
+from .nonces import NonceStore, NonceStoreFull
+
+logger = get_logger(__name__)
+
+INTENT_TYPES = ("strategy_plan", "risk_score", "curve_eval")
+MAX_NONCE_LENGTH = 128
+# Envelopes dated this far in the future are rejected (allows for clock skew)
+MAX_CLOCK_SKEW = timedelta(seconds=30)
+
+
+def nonce_store(
+    max_age_sec: float,
+    buckets: int,
+    max_nonces: int,
+    bloom_bits_per_nonce: int = 0,
+) -> NonceStore:
+    """Nonce store retaining nonces for the age window plus the allowed clock skew"""
+    return NonceStore(
+        retention_sec=max_age_sec + MAX_CLOCK_SKEW.total_seconds(),
+        buckets=buckets,
+        max_nonces=max_nonces,
+        bloom_bits_per_nonce=bloom_bits_per_nonce,
+    )
+
+
+class IntentIngestor:
+    """
+    Validates intent envelopes and rejects replays
+
+    An envelope is accepted once: its timestamp must be within
+    ``max_age_sec`` and its nonce must not have been seen in that window.
+    The nonce store retains nonces for the age window plus the allowed
+    clock skew, so a replay is rejected either by its nonce or, once the
+    nonce has expired, by its timestamp.
+    """
+
+    def __init__(
+        self,
+        max_age_sec: float = 300.0,
+        buckets: int = 10,
+        max_nonces: int = 1_000_000,
+        bloom_bits_per_nonce: int = 0,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        nonces: Optional[NonceStore] = None,
+    ):
+        self.max_age = timedelta(seconds=max_age_sec)
+        self.clock = clock
+        self.nonces = nonces or nonce_store(max_age_sec, buckets, max_nonces, bloom_bits_per_nonce)
+
+    def _validate(self, envelope: IntentEnvelopeV1, now: datetime):
+        if envelope.version != "v1":
+            raise InvalidIntent(f"Unsupported envelope version: {envelope.version}")
+        if envelope.intent_type not in INTENT_TYPES:
+            raise InvalidIntent(f"Unknown intent type: {envelope.intent_type}")
+        if not envelope.nonce or len(envelope.nonce) > MAX_NONCE_LENGTH:
+            raise InvalidIntent(f"Nonce must be 1-{MAX_NONCE_LENGTH} characters")
+        timestamp = envelope.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        if now - timestamp > self.max_age:
+            raise InvalidIntent("Intent timestamp too old")
+        if timestamp - now > MAX_CLOCK_SKEW:
+            raise InvalidIntent("Intent timestamp in the future")
+        try:
+            base64.b64decode(envelope.encrypted_payload, validate=True)
+        except (ValueError, binascii.Error):
+            raise InvalidIntent("encrypted_payload is not valid base64")
+
+    def ingest(self, envelope: IntentEnvelopeV1) -> IntentAck:
+        """
+        Accept an envelope, consuming its nonce
+
+        Raises:
+            InvalidIntent: Malformed, unsupported or stale envelope
+            ReplayedIntent: Nonce already used within the window
+            ReplayStoreFull: Replay store at its memory budget
+        """
+        now = self.clock()
+        self._validate(envelope, now)
+        try:
+            fresh = self.nonces.add(envelope.nonce)
+        except NonceStoreFull:
+            raise ReplayStoreFull(retry_after=max(1, round(self.nonces.bucket_sec)))
+        return self._ack(envelope, now, fresh)
+
+    async def ingest_async(self, envelope: IntentEnvelopeV1) -> IntentAck:
+        """``ingest`` for callers on the event loop, where the nonce store may be shared"""
+        now = self.clock()
+        self._validate(envelope, now)
+        try:
+            fresh = await self.nonces.add_async(envelope.nonce)
+        except NonceStoreFull:
+            raise ReplayStoreFull(retry_after=max(1, round(self.nonces.bucket_sec)))
+        return self._ack(envelope, now, fresh)
+
+    def _ack(self, envelope: IntentEnvelopeV1, now: datetime, fresh: bool) -> IntentAck:
+        if not fresh:
+            logger.warning("Replayed intent rejected: type=%s", envelope.intent_type)
+            raise ReplayedIntent()
+        return IntentAck(intent_type=envelope.intent_type, nonce=envelope.nonce, accepted_at=now)
+
+    def stats(self) -> dict:
+        return self.nonces.stats()
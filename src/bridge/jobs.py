@@ -0,0 +1,155 @@
+"""In-process job table for asynchronous confidential computations"""
+
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+from .errors import BridgeError
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Job status values
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class JobTableFull(Exception):
+    """Raised when every job slot is held by an unfinished job"""
+
+
+class Job:
+    """A single submitted computation and its outcome"""
+
+    __slots__ = (
+        "job_id", "computation_type", "status", "result", "error",
+        "created_at", "completed_at", "_done", "_finished_at",
+    )
+
+    def __init__(self, job_id: str, computation_type: str):
+        self.job_id = job_id
+        self.computation_type = computation_type
+        self.status = PENDING
+        self.result = None
+        self.error: Optional[Exception] = None
+        self.created_at = datetime.now(timezone.utc)
+        self.completed_at: Optional[datetime] = None
+        self._done = asyncio.Event()
+        self._finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for the job to finish; returns whether it did"""
+        if not self.done and timeout > 0:
+            try:
+                await asyncio.wait_for(self._done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.done
+
+
+class JobTable:
+    """
+    Bounded table of asynchronous jobs
+
+    Finished jobs are kept for ``ttl_sec`` so callers can fetch their
+    results, then expire. The table holds at most ``max_jobs`` jobs; when it
+    is full the oldest finished job is evicted early, and if every slot is
+    held by an unfinished job new submissions are rejected.
+    """
+
+    def __init__(self, max_jobs: int, ttl_sec: float, clock: Callable[[], float] = time.monotonic):
+        self.max_jobs = max_jobs
+        self.ttl_sec = ttl_sec
+        self.clock = clock
+        self._jobs: Dict[str, Job] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._expired = 0
+        self._rejected = 0
+
+    def submit(self, computation_type: str, run: Callable[[], Awaitable]) -> Job:
+        """
+        Start a job running in the background
+
+        Args:
+            computation_type: Computation type label for the job
+            run: Zero-argument coroutine function producing the result
+
+        Raises:
+            JobTableFull: If no slot can be freed for the new job
+        """
+        self._expire()
+        if len(self._jobs) >= self.max_jobs:
+            if not self._finished:
+                self._rejected += 1
+                raise JobTableFull("Job table full")
+            oldest, _ = self._finished.popitem(last=False)
+            del self._jobs[oldest]
+
+        job = Job(secrets.token_urlsafe(16), computation_type)
+        self._jobs[job.job_id] = job
+        self._tasks[job.job_id] = asyncio.ensure_future(self._run(job, run))
+        return job
+
+    async def _run(self, job: Job, run: Callable[[], Awaitable]):
+        job.status = RUNNING
+        try:
+            job.result = await run()
+            job.status = COMPLETED
+        except asyncio.CancelledError:
+            # Cancelled at shutdown once the grace period is over; never leave it running
+            logger.warning("Job cancelled: job_id=%s, type=%s", job.job_id, job.computation_type)
+            job.error = BridgeError("Job cancelled before completion")
+            job.status = FAILED
+            raise
+        except Exception as e:
+            logger.error("Job failed: job_id=%s, type=%s", job.job_id, job.computation_type)
+            job.error = e
+            job.status = FAILED
+        finally:
+            self._tasks.pop(job.job_id, None)
+            job.completed_at = datetime.now(timezone.utc)
+            job._finished_at = self.clock()
+            if job.job_id in self._jobs:
+                self._finished[job.job_id] = None
+            job._done.set()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job, returning None if unknown or expired"""
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def _expire(self):
+        """Drop finished jobs older than the TTL (oldest first)"""
+        now = self.clock()
+        while self._finished:
+            job_id = next(iter(self._finished))
+            if now - self._jobs[job_id]._finished_at < self.ttl_sec:
+                break
+            del self._finished[job_id]
+            del self._jobs[job_id]
+            self._expired += 1
+
+    async def drain(self):
+        """Wait for all running jobs to finish"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def stats(self) -> dict:
+        """Job counts by state"""
+        return {
+            "jobs": len(self._jobs),
+            "running": len(self._tasks),
+            "finished": len(self._finished),
+            "max_jobs": self.max_jobs,
+            "expired": self._expired,
+            "rejected": self._rejected,
+        }
@@ -0,0 +1,138 @@
+"""Pre-generated ephemeral key material for input encryption
+
+Each confidential request is encrypted under a fresh ephemeral X25519 key, so
+a leaked key exposes one request only. Generating a key and deriving its
+shared secret with the cluster costs an X25519 key generation and exchange,
+so the pool does that work ahead of time, in a worker, and the request path
+only pops a ready item.
+"""
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import Executor
+from typing import Deque, List, Optional
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from ..utils.logger import get_logger
+from .encryption import NONCE_BYTES, derive_cipher, public_key_bytes
+
+logger = get_logger(__name__)
+
+
+class EphemeralKey:
+    """Single-use key material: public key sent to the MXE, derived cipher and nonce"""
+
+    __slots__ = ("public_key", "cipher", "nonce")
+
+    def __init__(self, public_key: bytes, cipher: AESGCM, nonce: bytes):
+        self.public_key = public_key
+        self.cipher = cipher
+        self.nonce = nonce
+
+
+def generate_ephemeral(cluster_public_key: bytes) -> EphemeralKey:
+    """Fresh key pair and nonce; the private key is dropped once the secret is derived"""
+    private_key = X25519PrivateKey.generate()
+    return EphemeralKey(
+        public_key_bytes(private_key),
+        derive_cipher(private_key, cluster_public_key),
+        os.urandom(NONCE_BYTES),
+    )
+
+
+def _generate_many(cluster_public_key: bytes, count: int) -> List[EphemeralKey]:
+    return [generate_ephemeral(cluster_public_key) for _ in range(count)]
+
+
+class EphemeralKeyPool:
+    """
+    Background-refilled pool of single-use ephemeral keys for one cluster key
+
+    ``take`` pops a key, so no item is ever handed out twice. When fewer
+    than ``low_water`` keys remain a background task refills the pool to
+    ``high_water`` in batches of ``refill_batch`` on ``executor`` (the loop's
+    default executor if None). If the pool is empty, ``take`` generates a
+    key inline and counts a miss.
+    """
+
+    def __init__(
+        self,
+        cluster_public_key: bytes,
+        low_water: int = 256,
+        high_water: int = 1024,
+        refill_batch: int = 64,
+        executor: Optional[Executor] = None,
+    ):
+        if not 0 <= low_water <= high_water:
+            raise ValueError("Key pool low water must be between 0 and high water")
+        self.cluster_public_key = cluster_public_key
+        self.low_water = low_water
+        self.high_water = high_water
+        self.refill_batch = refill_batch
+        self.executor = executor
+        self._keys: Deque[EphemeralKey] = deque()
+        self._refill: Optional[asyncio.Task] = None
+        self._taken = 0
+        self._misses = 0
+        self._generated = 0
+
+    def start(self):
+        """Begin filling the pool in the background (call from the running loop)"""
+        self._schedule_refill()
+
+    def take(self) -> EphemeralKey:
+        """Remove and return one key, generating it inline if the pool is empty"""
+        try:
+            key = self._keys.popleft()
+        except IndexError:
+            self._misses += 1
+            self._generated += 1
+            key = generate_ephemeral(self.cluster_public_key)
+        self._taken += 1
+        if len(self._keys) < self.low_water:
+            self._schedule_refill()
+        return key
+
+    def _schedule_refill(self):
+        if self._refill is not None and not self._refill.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refill = loop.create_task(self._fill())
+
+    async def _fill(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while len(self._keys) < self.high_water:
+                count = min(self.refill_batch, self.high_water - len(self._keys))
+                keys = await loop.run_in_executor(self.executor, _generate_many, self.cluster_public_key, count)
+                self._keys.extend(keys)
+                self._generated += count
+        except Exception as e:
+            # Requests still get keys inline; the next take() retries the refill
+            logger.error("Ephemeral key refill failed: %s", type(e).__name__)
+
+    async def close(self):
+        """Stop refilling and drop unused key material"""
+        if self._refill is not None:
+            self._refill.cancel()
+            try:
+                await self._refill
+            except asyncio.CancelledError:
+                pass
+            self._refill = None
+        self._keys.clear()
+
+    def stats(self) -> dict:
+        """Pool depth, water marks, and keys taken, generated and missed"""
+        return {
+            "depth": len(self._keys),
+            "low_water": self.low_water,
+            "high_water": self.high_water,
+            "taken": self._taken,
+            "misses": self._misses,
+            "generated": self._generated,
+        }
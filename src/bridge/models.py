@@ -1,7 +1,13 @@
 """Data models for Arcium bridge"""
 
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, field_validator
+from pydantic_core import PydanticCustomError
+from datetime import datetime
+from typing import List, Optional, Union
+from ..config.settings import get_settings
+
+# Validation error type for batches over BATCH_MAX_ITEMS (the API maps it to 413)
+BATCH_TOO_LARGE = "batch_too_large"
 
 
 # Strategy Plan Models
@@ -105,3 +111,148 @@ class ExecutionRecommendation(BaseModel):
     optimal_timing: int  # Optimal timing window in seconds
     confidence_score: int  # Confidence: 0-255
 
+
+
+# Batch Models
+class PlanRequest(BaseModel):
+    """Single strategy plan input triple"""
+    user_preferences: UserPreferences
+    user_history: UserHistory
+    curve_state: CurveState
+
+
+class RiskScoreRequest(BaseModel):
+    """Single risk score input triple"""
+    portfolio_context: PortfolioContext
+    performance_history: PerformanceHistory
+    market_conditions: MarketConditions
+
+
+class CurveEvalRequest(BaseModel):
+    """Single curve evaluation input triple"""
+    sizing_preferences: SizingPreferences
+    user_constraints: UserConstraints
+    curve_metrics: CurveMetrics
+
+
+class _BatchRequest(BaseModel):
+    """Batch of input triples, capped at BATCH_MAX_ITEMS"""
+
+    @field_validator("items", mode="before", check_fields=False)
+    @classmethod
+    def check_batch_size(cls, items):
+        """Reject oversized batches before any item is validated"""
+        max_items = get_settings().batch_max_items
+        if isinstance(items, list) and len(items) > max_items:
+            raise PydanticCustomError(
+                BATCH_TOO_LARGE,
+                "Batch too large: {num_items} items (max {max_items})",
+                {"num_items": len(items), "max_items": max_items},
+            )
+        return items
+
+
+class PlanBatchRequest(_BatchRequest):
+    """Batch of strategy plan requests"""
+    items: List[PlanRequest]
+
+
+class RiskScoreBatchRequest(_BatchRequest):
+    """Batch of risk score requests"""
+    items: List[RiskScoreRequest]
+
+
+class CurveEvalBatchRequest(_BatchRequest):
+    """Batch of curve evaluation requests"""
+    items: List[CurveEvalRequest]
+
+
+class BatchItemError(BaseModel):
+    """Error for a single batch item"""
+    error: str  # Error code, e.g. "computation_failed"
+    message: str  # Sanitized error message
+
+
+class PlanBatchItem(BaseModel):
+    """Result slot for a single strategy plan request"""
+    index: int  # Position of the request in the batch
+    result: Optional[StrategyPlan] = None
+    error: Optional[BatchItemError] = None
+
+
+class RiskScoreBatchItem(BaseModel):
+    """Result slot for a single risk score request"""
+    index: int
+    result: Optional[RiskAssessment] = None
+    error: Optional[BatchItemError] = None
+
+
+class CurveEvalBatchItem(BaseModel):
+    """Result slot for a single curve evaluation request"""
+    index: int
+    result: Optional[ExecutionRecommendation] = None
+    error: Optional[BatchItemError] = None
+
+
+class PlanBatchResponse(BaseModel):
+    """Batch strategy plan results, in request order"""
+    results: List[PlanBatchItem]
+
+
+class RiskScoreBatchResponse(BaseModel):
+    """Batch risk score results, in request order"""
+    results: List[RiskScoreBatchItem]
+
+
+class CurveEvalBatchResponse(BaseModel):
+    """Batch curve evaluation results, in request order"""
+    results: List[CurveEvalBatchItem]
+
+
+# Job Models
+class JobInfo(BaseModel):
+    """Status of an asynchronous computation job"""
+    job_id: str  # Opaque job identifier
+    computation_type: str  # "plan", "risk-score", "curve-eval"
+    status: str  # "pending", "running", "completed", "failed"
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    result: Optional[Union[StrategyPlan, RiskAssessment, ExecutionRecommendation]] = None
+    error: Optional[BatchItemError] = None
+
+
+# Intent Models (see docs/bridge-spec.md)
+class IntentEnvelopeV1(BaseModel):
+    """Encrypted user intent for confidential computation"""
+    version: str = "v1"
+    intent_type: str  # "strategy_plan", "risk_score", "curve_eval"
+    encrypted_payload: str  # Base64-encoded encrypted sensitive fields
+    public_context: dict = {}  # Public on-chain data (curve_state, market_conditions)
+    nonce: str  # Single-use random nonce
+    timestamp: datetime
+
+
+class IntentAck(BaseModel):
+    """Acknowledgement of an accepted intent envelope"""
+    intent_type: str
+    nonce: str
+    accepted_at: datetime
+
+
+# Receipt Models (see docs/bridge-spec.md)
+class ReceiptResult(BaseModel):
+    """Computation output attached to a receipt"""
+    encrypted_output: str  # Base64-encoded encrypted result blob
+    public_output: Optional[dict] = None  # Non-sensitive results
+
+
+class ProofReceiptV1(BaseModel):
+    """Attestation of confidential computation completion, signed by an Arcium node"""
+    version: str = "v1"
+    receipt_id: str  # Arcium receipt id
+    computation_id: str  # MXE computation id
+    result_hash: str  # Hex SHA256 of the decoded encrypted_output
+    signature: str  # Base58 Ed25519 signature over the canonical receipt fields
+    timestamp: datetime
+    status: str  # "completed", "failed"
+    result: ReceiptResult
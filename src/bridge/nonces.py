@@ -0,0 +1,210 @@
+"""Memory-bounded, time-bucketed nonce store for replay prevention
+
+Nonces are reduced to 64-bit keyed fingerprints (BLAKE2b under a
+per-process secret, so they cannot be chosen to collide) and stored in
+fixed-size open-addressing tables of unsigned 64-bit integers, one table per
+time bucket. A bucket older than the retention window is dropped as a whole,
+so expiry is O(1) and never scans individual nonces.
+
+With 64-bit fingerprints, the chance that a fresh nonce is mistaken for a
+replay is below 1e-5 even at 10M nonces per window.
+"""
+
+import hashlib
+import math
+import os
+import time
+from array import array
+from collections import deque
+from typing import Callable, Deque
+
+# Fingerprint 0 marks an empty table slot
+EMPTY = 0
+# Tables are sized so they are at most this full at capacity
+MAX_LOAD_FACTOR = 0.75
+BLOOM_HASHES = 4
+
+
+class NonceStoreFull(Exception):
+    """Raised when the current bucket has no room left within the memory budget"""
+
+
+class _Bucket:
+    """Nonces first seen during one time bucket"""
+
+    __slots__ = ("epoch", "table", "mask", "count")
+
+    def __init__(self, epoch: int, slots: int):
+        self.epoch = epoch
+        self.table = array("Q", bytes(8 * slots))
+        self.mask = slots - 1
+        self.count = 0
+
+    def contains(self, fingerprint: int) -> bool:
+        table, mask = self.table, self.mask
+        slot = fingerprint & mask
+        while True:
+            value = table[slot]
+            if value == fingerprint:
+                return True
+            if value == EMPTY:
+                return False
+            slot = (slot + 1) & mask
+
+    def insert(self, fingerprint: int):
+        table, mask = self.table, self.mask
+        slot = fingerprint & mask
+        while table[slot] != EMPTY:
+            slot = (slot + 1) & mask
+        table[slot] = fingerprint
+        self.count += 1
+
+
+class _Bloom:
+    """Fixed-size Bloom filter over fingerprints (double hashing)"""
+
+    __slots__ = ("epoch", "bits", "size")
+
+    def __init__(self, epoch: int, size_bits: int):
+        self.epoch = epoch
+        self.bits = bytearray((size_bits + 7) // 8)
+        self.size = size_bits
+
+    def _positions(self, fingerprint: int):
+        h1 = fingerprint & 0xFFFFFFFF
+        h2 = (fingerprint >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(BLOOM_HASHES)]
+
+    def add(self, fingerprint: int):
+        bits = self.bits
+        for position in self._positions(fingerprint):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, fingerprint: int) -> bool:
+        bits = self.bits
+        for position in self._positions(fingerprint):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class NonceStore:
+    """
+    Remembers nonces for at least ``retention_sec`` within a fixed memory budget
+
+    The retention window is split into ``buckets`` time buckets. Each bucket
+    gets a preallocated table sized for ``max_nonces / buckets`` nonces, so
+    memory never exceeds the budget reported by ``memory_bytes``; a bucket
+    that fills up raises NonceStoreFull until the next bucket starts.
+
+    With ``bloom_bits_per_nonce`` > 0, a Bloom filter per retention window
+    (two generations) answers most lookups for unseen nonces without
+    probing the per-bucket tables.
+    """
+
+    def __init__(
+        self,
+        retention_sec: float = 330.0,
+        buckets: int = 10,
+        max_nonces: int = 1_000_000,
+        bloom_bits_per_nonce: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.bucket_sec = retention_sec / buckets
+        self.retained_buckets = buckets + 1  # The current, partially filled bucket is extra
+        self.bucket_capacity = math.ceil(max_nonces / buckets)
+        self.slots = 1 << max(3, math.ceil(math.log2(self.bucket_capacity / MAX_LOAD_FACTOR)))
+        self.clock = clock
+        self._key = os.urandom(16)
+        self._buckets: Deque[_Bucket] = deque()
+        self._inserted = 0
+        self._replays = 0
+        self._full = 0
+
+        self.bloom_bits = max_nonces * bloom_bits_per_nonce
+        self._blooms: Deque[_Bloom] = deque()
+        self._bloom_epochs = self.retained_buckets
+        self._bloom_skips = 0
+
+    def fingerprint(self, nonce: str) -> int:
+        """Keyed 64-bit fingerprint of a nonce (never 0)"""
+        digest = hashlib.blake2b(nonce.encode(), digest_size=8, key=self._key).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _advance(self) -> int:
+        """Drop buckets (and Bloom generations) that left the retention window"""
+        epoch = int(self.clock() // self.bucket_sec)
+        oldest = epoch - self.retained_buckets + 1
+        while self._buckets and self._buckets[0].epoch < oldest:
+            self._buckets.popleft()
+        # A Bloom generation covers a full retention window of buckets
+        while self._blooms and self._blooms[0].epoch + self._bloom_epochs <= oldest:
+            self._blooms.popleft()
+        return epoch
+
+    def _contains(self, fingerprint: int) -> bool:
+        if self.bloom_bits and not any(b.might_contain(fingerprint) for b in self._blooms):
+            self._bloom_skips += 1
+            return False
+        return any(bucket.contains(fingerprint) for bucket in self._buckets)
+
+    def __contains__(self, nonce: str) -> bool:
+        self._advance()
+        return self._contains(self.fingerprint(nonce))
+
+    def add(self, nonce: str) -> bool:
+        """
+        Record a nonce; returns False if it was already seen in the window
+
+        Raises:
+            NonceStoreFull: If the current bucket is at capacity
+        """
+        epoch = self._advance()
+        fingerprint = self.fingerprint(nonce)
+        if self._contains(fingerprint):
+            self._replays += 1
+            return False
+
+        if not self._buckets or self._buckets[-1].epoch != epoch:
+            self._buckets.append(_Bucket(epoch, self.slots))
+        bucket = self._buckets[-1]
+        if bucket.count >= self.bucket_capacity:
+            self._full += 1
+            raise NonceStoreFull("Nonce store bucket full")
+        bucket.insert(fingerprint)
+
+        if self.bloom_bits:
+            if not self._blooms or self._blooms[-1].epoch + self._bloom_epochs <= epoch:
+                self._blooms.append(_Bloom(epoch, self.bloom_bits))
+            self._blooms[-1].add(fingerprint)
+
+        self._inserted += 1
+        return True
+
+    async def add_async(self, nonce: str) -> bool:
+        """``add`` for callers on the event loop; the shared store overrides it"""
+        return self.add(nonce)
+
+    def __len__(self) -> int:
+        return sum(bucket.count for bucket in self._buckets)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Upper bound on table and filter memory at full retention"""
+        tables = 8 * self.slots * self.retained_buckets
+        blooms = 2 * ((self.bloom_bits + 7) // 8)
+        return tables + blooms
+
+    def stats(self) -> dict:
+        """Stored nonces, replays caught and memory use"""
+        return {
+            "nonces": len(self),
+            "buckets": len(self._buckets),
+            "inserted": self._inserted,
+            "replays": self._replays,
+            "rejected_full": self._full,
+            "bloom_skips": self._bloom_skips,
+            "memory_bytes": sum(8 * len(bucket.table) for bucket in self._buckets)
+            + sum(len(bloom.bits) for bloom in self._blooms),
+            "max_memory_bytes": self.memory_bytes,
+        }
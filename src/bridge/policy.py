@@ -0,0 +1,238 @@
+"""Retry, backoff and circuit breaker policy for MXE and RPC calls
+
+Implements the retry policy from docs/bridge-spec.md: up to 3 retries with
+exponential backoff (1 s initial, 2x multiplier, 10 s cap) for retryable
+errors only, plus a per-endpoint circuit breaker for network errors.
+"""
+
+import asyncio
+import math
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+import httpx
+from ..utils.logger import get_logger
+from .errors import BridgeError, CircuitOpen, NetworkError
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_NETWORK_EXCEPTIONS = (ConnectionError, TimeoutError, asyncio.TimeoutError, httpx.TransportError)
+
+
+def classify(error: Exception) -> Exception:
+    """
+    Map an exception onto the spec's error taxonomy
+
+    Bridge errors pass through. Connection failures and timeouts anywhere
+    in the exception's cause chain (e.g. an httpx error wrapped by
+    solana-py) become NetworkError. Anything else is returned unchanged and
+    treated as non-retryable.
+    """
+    if isinstance(error, BridgeError):
+        return error
+    cause: Optional[BaseException] = error
+    while cause is not None:
+        if isinstance(cause, _NETWORK_EXCEPTIONS):
+            return NetworkError()
+        cause = cause.__cause__ or cause.__context__
+    return error
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether the bridge may retry after this error"""
+    return getattr(classify(error), "retryable", False)
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter"""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        multiplier: float = 2.0,
+        max_backoff: float = 10.0,
+        rng: Optional[random.Random] = None,
+    ):
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.rng = rng or random.Random()
+
+    def backoff(self, retry: int) -> float:
+        """
+        Delay before the given retry (0-based), in seconds
+
+        Uses "equal jitter": half the exponential delay is fixed and half is
+        random, so retries from many callers spread out without ever
+        collapsing to zero delay.
+        """
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier ** retry)
+        return delay / 2 + self.rng.uniform(0, delay / 2)
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker for network errors
+
+    Opens after ``failure_threshold`` consecutive network failures. While
+    open, calls fail fast with CircuitOpen. After ``reset_timeout`` one
+    trial call is let through (half-open); its outcome closes or re-opens
+    the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self._trial_in_flight = False
+
+    def before_call(self):
+        """Raise CircuitOpen if the call must fail fast"""
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN:
+            remaining = self.opened_at + self.reset_timeout - self.clock()
+            if remaining > 0:
+                raise CircuitOpen(retry_after=max(1, math.ceil(remaining)))
+            self.state = HALF_OPEN
+        if self._trial_in_flight:
+            raise CircuitOpen(retry_after=1)
+        self._trial_in_flight = True
+
+    def record_success(self):
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = None
+
+    def record_failure(self):
+        self._trial_in_flight = False
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+    def release(self):
+        """Release a half-open trial slot without judging the dependency"""
+        self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+        }
+
+
+class ExecutionPolicy:
+    """
+    Retry and circuit breaker policy around MXE and RPC calls
+
+    ``guard`` wraps a single call to one endpoint with that endpoint's
+    breaker. ``run`` retries a whole operation with jittered exponential
+    backoff when it fails with a retryable error.
+    """
+
+    def __init__(
+        self,
+        retry: Optional[RetryPolicy] = None,
+        breaker_factory: Callable[[], CircuitBreaker] = CircuitBreaker,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.retry = retry or RetryPolicy()
+        self.breaker_factory = breaker_factory
+        self.sleep = sleep
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.retries: Dict[str, int] = {}
+        self.exhausted: Dict[str, int] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = self.breakers[endpoint] = self.breaker_factory()
+        return breaker
+
+    async def guard(self, endpoint: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run one call to an endpoint through its circuit breaker
+
+        Network failures count against the breaker; other errors do not.
+        Errors are re-raised in the spec taxonomy (see ``classify``).
+        """
+        breaker = self.breaker(endpoint)
+        breaker.before_call()
+        try:
+            result = await fn()
+        except Exception as e:
+            error = classify(e)
+            if isinstance(error, NetworkError):
+                breaker.record_failure()
+            else:
+                breaker.release()
+            if error is e:
+                raise
+            raise error from e
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return result
+
+    async def run(self, operation: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an operation, retrying retryable errors with backoff
+
+        Args:
+            operation: Label for retry counters (e.g. "submit", "rpc:solana")
+            fn: Zero-argument coroutine function performing one attempt
+
+        Raises:
+            The classified error once it is non-retryable or retries run out
+        """
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                error = classify(e)
+                if not getattr(error, "retryable", False):
+                    raise
+                if attempt >= self.retry.max_retries:
+                    self.exhausted[operation] = self.exhausted.get(operation, 0) + 1
+                    logger.warning(
+                        "Retries exhausted: operation=%s, error=%s", operation, getattr(error, "code", type(error).__name__)
+                    )
+                    if error is e:
+                        raise
+                    raise error from e
+                self.retries[operation] = self.retries.get(operation, 0) + 1
+                await self.sleep(self.retry.backoff(attempt))
+                attempt += 1
+
+    def stats(self) -> dict:
+        """Breaker state per endpoint and retry counts per operation"""
+        return {
+            "breakers": {endpoint: breaker.stats() for endpoint, breaker in self.breakers.items()},
+            "retries": dict(self.retries),
+            "retries_exhausted": dict(self.exhausted),
+        }
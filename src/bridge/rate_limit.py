@@ -0,0 +1,186 @@
+"""Per-client token bucket rate limiting for request rate and MXE compute cost"""
+
+import math
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+from .errors import RateLimited
+
+# Bucket names
+REQUESTS = "requests"
+COST = "cost"
+
+# Client id used for requests that do not declare one
+ANONYMOUS = "anonymous"
+
+# Calling Evalys component, from X-Evalys-Client-Id
+current_client_id: ContextVar[str] = ContextVar("current_client_id", default=ANONYMOUS)
+# Network address the request came from (None outside the API)
+current_source_address: ContextVar[Optional[str]] = ContextVar("current_source_address", default=None)
+# Budget left in the calling client's buckets after its last charge in this request
+current_budget: ContextVar[Optional[Dict[str, float]]] = ContextVar("current_budget", default=None)
+
+
+class _Buckets:
+    """Token levels of one client's two buckets, refilled lazily on each charge"""
+
+    __slots__ = ("requests", "cost", "updated_at")
+
+    def __init__(self, requests: float, cost: float, updated_at: float):
+        self.requests = requests
+        self.cost = cost
+        self.updated_at = updated_at
+
+
+class RateLimiter:
+    """
+    Token buckets per client id: one for requests, one for MXE compute cost
+
+    Each bucket holds up to ``burst`` tokens and refills at ``rate`` tokens
+    per second; a rate of 0 disables that bucket. Every request takes one
+    request token; every computation submitted to the MXE (not cache hits)
+    takes its computation type's cost, times the number of items in a
+    batch. A charge larger than the whole burst is allowed once the bucket
+    is full and leaves it in debt, so large batches are delayed rather
+    than refused forever.
+
+    Buckets are refilled from elapsed time when charged, so a decision is
+    a dict lookup and a few float operations. At most ``max_clients`` ids
+    are tracked; the least recently seen is evicted and starts again with
+    a full bucket if it returns.
+    """
+
+    def __init__(
+        self,
+        request_rate: float,
+        request_burst: float,
+        cost_rate: float,
+        cost_burst: float,
+        max_clients: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rates = {REQUESTS: request_rate, COST: cost_rate}
+        self.bursts = {REQUESTS: request_burst, COST: cost_burst}
+        self.max_clients = max_clients
+        self.clock = clock
+        self._clients: "OrderedDict[str, _Buckets]" = OrderedDict()
+        self._allowed = {REQUESTS: 0, COST: 0}
+        self._limited = {REQUESTS: 0, COST: 0}
+        self._refunded = {REQUESTS: 0, COST: 0}
+        self._evicted = 0
+
+    def _buckets(self, client_id: str, now: float) -> _Buckets:
+        """The client's buckets refilled to now, marking it most recently seen"""
+        buckets = self._clients.get(client_id)
+        if buckets is None:
+            buckets = self._clients[client_id] = _Buckets(self.bursts[REQUESTS], self.bursts[COST], now)
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+                self._evicted += 1
+            return buckets
+        self._clients.move_to_end(client_id)
+        elapsed = now - buckets.updated_at
+        if elapsed > 0:
+            buckets.requests = min(self.bursts[REQUESTS], buckets.requests + elapsed * self.rates[REQUESTS])
+            buckets.cost = min(self.bursts[COST], buckets.cost + elapsed * self.rates[COST])
+            buckets.updated_at = now
+        return buckets
+
+    def take(self, client_id: str, bucket: str, amount: float) -> Dict[str, float]:
+        """
+        Charge ``amount`` tokens from one of the client's buckets; returns the tokens left in each enabled bucket
+
+        Raises:
+            RateLimited: Not enough tokens; retry_after is when there will be
+        """
+        buckets = self._buckets(client_id, self.clock())
+        rate = self.rates[bucket]
+        if rate > 0:
+            tokens = getattr(buckets, bucket)
+            needed = min(amount, self.bursts[bucket])
+            if tokens < needed:
+                self._limited[bucket] += 1
+                raise RateLimited(
+                    f"Client {bucket} budget exhausted",
+                    retry_after=max(1, math.ceil((needed - tokens) / rate)),
+                )
+            setattr(buckets, bucket, tokens - amount)
+        self._allowed[bucket] += 1
+        return self.remaining(buckets)
+
+    def credit(self, client_id: str, bucket: str, amount: float) -> Dict[str, float]:
+        """
+        Return ``amount`` tokens to one of the client's buckets, for a charge whose work never ran
+
+        A client evicted since the charge starts with full buckets anyway,
+        so nothing is recorded for it and an empty dict is returned.
+        """
+        if client_id not in self._clients:
+            return {}
+        buckets = self._buckets(client_id, self.clock())
+        if self.rates[bucket] > 0:
+            setattr(buckets, bucket, min(self.bursts[bucket], getattr(buckets, bucket) + amount))
+        self._refunded[bucket] += 1
+        return self.remaining(buckets)
+
+    def remaining(self, buckets: _Buckets) -> Dict[str, float]:
+        """Tokens left in each enabled bucket"""
+        return {bucket: max(0.0, getattr(buckets, bucket)) for bucket, rate in self.rates.items() if rate > 0}
+
+    async def take_async(self, client_id: str, bucket: str, amount: float) -> Dict[str, float]:
+        """``take`` for callers on the event loop; overridden where buckets are shared"""
+        return self.take(client_id, bucket, amount)
+
+    async def credit_async(self, client_id: str, bucket: str, amount: float) -> Dict[str, float]:
+        """``credit`` for callers on the event loop; overridden where buckets are shared"""
+        return self.credit(client_id, bucket, amount)
+
+    def stats(self) -> dict:
+        return {
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "evicted": self._evicted,
+            "allowed": dict(self._allowed),
+            "limited": dict(self._limited),
+            "refunded": dict(self._refunded),
+        }
+
+
+def charged_keys(client_id: str, address: Optional[str], amount: float, address_factor: float) -> List[Tuple[str, float]]:
+    """
+    Bucket keys a charge is taken from, with the amount taken from each
+
+    Client ids are declared, not authenticated, so a caller could rotate
+    ids to get fresh buckets. With an ``address_factor``, every id sent from
+    one source address also draws ``amount / address_factor`` from that
+    address's buckets, so an address gets at most ``address_factor`` client
+    budgets whatever ids it declares. Requests without an id are charged
+    to their address alone.
+    """
+    if address is None or address_factor <= 0:
+        return [(client_id, amount)]
+    address_key = f"addr:{address}"
+    if client_id == ANONYMOUS:
+        return [(address_key, amount)]
+    return [(client_id, amount), (address_key, amount / address_factor)]
+
+
+def rate_limiter(settings) -> RateLimiter:
+    """Rate limiter configured from settings"""
+    return RateLimiter(
+        request_rate=settings.rate_limit_requests_per_sec,
+        request_burst=settings.rate_limit_request_burst,
+        cost_rate=settings.rate_limit_cost_per_sec,
+        cost_burst=settings.rate_limit_cost_burst,
+        max_clients=settings.rate_limit_max_clients,
+    )
+
+
+def computation_costs(settings) -> Dict[str, float]:
+    """MXE cost units per computation from settings"""
+    return {
+        "plan": settings.rate_limit_cost_plan,
+        "risk-score": settings.rate_limit_cost_risk_score,
+        "curve-eval": settings.rate_limit_cost_curve_eval,
+    }
@@ -0,0 +1,227 @@
+"""Verification of Arcium computation receipts (see docs/crypto.md)
+
+Every receipt must pass all of these checks before its result is decrypted
+or returned to a client:
+
+1. Ed25519 signature by the Arcium node key over the canonical receipt fields
+2. SHA256 of the encrypted output matches ``result_hash``
+3. Timestamp within the freshness window (replay protection)
+4. Status is "completed"
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import Executor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, List, Optional
+from ..utils.logger import get_logger
+from ..utils.metrics import Stage
+from .models import ProofReceiptV1
+
+if TYPE_CHECKING:
+    from solders.pubkey import Pubkey
+
+logger = get_logger(__name__)
+
+# Receipts dated this far in the future are rejected (allows for clock skew)
+MAX_CLOCK_SKEW = timedelta(seconds=30)
+
+
+def signing_payload(receipt: ProofReceiptV1) -> bytes:
+    """
+    Canonical bytes covered by the receipt signature
+
+    Compact, key-sorted JSON of the receipt's identifying fields, with the
+    timestamp as integer Unix milliseconds so it has one encoding.
+    """
+    timestamp = receipt.timestamp
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    fields = {
+        "version": receipt.version,
+        "receipt_id": receipt.receipt_id,
+        "computation_id": receipt.computation_id,
+        "result_hash": receipt.result_hash,
+        "timestamp_ms": round(timestamp.timestamp() * 1000),
+        "status": receipt.status,
+    }
+    return json.dumps(fields, sort_keys=True, separators=(",", ":")).encode()
+
+
+def result_hash(encrypted_output: str) -> str:
+    """Hex SHA256 of a base64-encoded encrypted output"""
+    return hashlib.sha256(base64.b64decode(encrypted_output, validate=True)).hexdigest()
+
+
+def _check_integrity(node_key: Optional["Pubkey"], receipt: ProofReceiptV1) -> Optional[str]:
+    """
+    Check signature and result hash; returns the failure reason or None
+
+    Pure CPU work with no shared state, so it is safe to run in a worker.
+    """
+    if node_key is None:
+        return "no_node_key"
+    from solders.signature import Signature
+    try:
+        signature = Signature.from_string(receipt.signature)
+        output_hash = result_hash(receipt.result.encrypted_output)
+    except (ValueError, binascii.Error):
+        return "malformed"
+    if not signature.verify(node_key, signing_payload(receipt)):
+        return "bad_signature"
+    if output_hash != receipt.result_hash.lower():
+        return "hash_mismatch"
+    return None
+
+
+def _check_integrity_chunk(node_key: Optional["Pubkey"], receipts: List[ProofReceiptV1]) -> List[Optional[str]]:
+    return [_check_integrity(node_key, receipt) for receipt in receipts]
+
+
+class ReceiptVerifier:
+    """
+    Verifies receipts against the configured Arcium node public key
+
+    Receipts that pass the signature and hash checks are remembered by id
+    (with a fingerprint of their content) in a bounded LRU, so re-checking a
+    duplicate costs one SHA256 instead of an Ed25519 verification.
+    Freshness and status are re-checked on every call.
+
+    ``verify_receipts`` runs signature checks in an executor in chunks so
+    large batches do not block the event loop.
+    """
+
+    def __init__(
+        self,
+        node_public_key: Optional[str],
+        max_age_sec: float = 300.0,
+        cache_size: int = 100_000,
+        chunk_size: int = 256,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        self.node_key: Optional["Pubkey"] = None
+        if node_public_key:
+            from solders.pubkey import Pubkey
+            self.node_key = Pubkey.from_string(node_public_key)
+        self.max_age = timedelta(seconds=max_age_sec)
+        self.cache_size = cache_size
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.clock = clock
+        self._verified: "OrderedDict[str, bytes]" = OrderedDict()
+        self._rejected = {}
+        self._accepted = 0
+        self._cache_hits = 0
+
+    def _check_envelope(self, receipt: ProofReceiptV1, now: datetime) -> Optional[str]:
+        """Cheap checks done on every call: version, status and freshness"""
+        if receipt.version != "v1":
+            return "unsupported_version"
+        if receipt.status != "completed":
+            return "not_completed"
+        timestamp = receipt.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        if now - timestamp > self.max_age:
+            return "expired"
+        if timestamp - now > MAX_CLOCK_SKEW:
+            return "future_timestamp"
+        return None
+
+    @staticmethod
+    def _fingerprint(receipt: ProofReceiptV1) -> bytes:
+        digest = hashlib.sha256(signing_payload(receipt))
+        digest.update(receipt.signature.encode())
+        digest.update(receipt.result.encrypted_output.encode())
+        return digest.digest()
+
+    def _cached(self, receipt: ProofReceiptV1, fingerprint: bytes) -> bool:
+        if self._verified.get(receipt.receipt_id) != fingerprint:
+            return False
+        self._verified.move_to_end(receipt.receipt_id)
+        self._cache_hits += 1
+        return True
+
+    def _remember(self, receipt: ProofReceiptV1, fingerprint: bytes):
+        self._verified[receipt.receipt_id] = fingerprint
+        self._verified.move_to_end(receipt.receipt_id)
+        while len(self._verified) > self.cache_size:
+            self._verified.popitem(last=False)
+
+    def _finish(self, receipt: ProofReceiptV1, reason: Optional[str]) -> bool:
+        if reason is None:
+            self._accepted += 1
+            return True
+        self._rejected[reason] = self._rejected.get(reason, 0) + 1
+        logger.warning("Receipt rejected: receipt_id=%s, reason=%s", receipt.receipt_id, reason)
+        return False
+
+    def verify(self, receipt: ProofReceiptV1) -> bool:
+        """Verify one receipt synchronously"""
+        reason = self._check_envelope(receipt, self.clock())
+        if reason is None:
+            fingerprint = self._fingerprint(receipt)
+            if not self._cached(receipt, fingerprint):
+                reason = _check_integrity(self.node_key, receipt)
+                if reason is None:
+                    self._remember(receipt, fingerprint)
+        return self._finish(receipt, reason)
+
+    async def verify_receipt(self, receipt: ProofReceiptV1, computation_type: str = "unknown") -> bool:
+        """Verify one receipt without blocking the event loop"""
+        return (await self.verify_receipts([receipt], computation_type))[0]
+
+    async def verify_receipts(self, receipts: List[ProofReceiptV1], computation_type: str = "unknown") -> List[bool]:
+        """
+        Verify many receipts, returning one bool per receipt in order
+
+        Envelope checks and cache lookups run inline; signature and hash
+        checks for the remaining receipts run in the executor in chunks.
+        Timed as the receipt_verification stage for ``computation_type``.
+        """
+        with Stage(computation_type, "receipt_verification"):
+            return await self._verify_receipts(receipts)
+
+    async def _verify_receipts(self, receipts: List[ProofReceiptV1]) -> List[bool]:
+        now = self.clock()
+        reasons: List[Optional[str]] = [self._check_envelope(r, now) for r in receipts]
+        pending = []
+        for index, receipt in enumerate(receipts):
+            if reasons[index] is None:
+                fingerprint = self._fingerprint(receipt)
+                if not self._cached(receipt, fingerprint):
+                    pending.append((index, fingerprint))
+
+        if pending:
+            loop = asyncio.get_running_loop()
+            chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+            results = await asyncio.gather(*(
+                loop.run_in_executor(
+                    self.executor,
+                    _check_integrity_chunk,
+                    self.node_key,
+                    [receipts[index] for index, _ in chunk],
+                )
+                for chunk in chunks
+            ))
+            for chunk, chunk_reasons in zip(chunks, results):
+                for (index, fingerprint), reason in zip(chunk, chunk_reasons):
+                    reasons[index] = reason
+                    if reason is None:
+                        self._remember(receipts[index], fingerprint)
+
+        return [self._finish(receipt, reason) for receipt, reason in zip(receipts, reasons)]
+
+    def stats(self) -> dict:
+        """Accepted and rejected counts, and verified-receipt cache usage"""
+        return {
+            "accepted": self._accepted,
+            "rejected": dict(self._rejected),
+            "cache_hits": self._cache_hits,
+            "cached": len(self._verified),
+        }
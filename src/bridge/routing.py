@@ -0,0 +1,196 @@
+"""Latency-aware routing across multiple RPC and relay endpoints"""
+
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Iterable, List, Optional, Tuple, TypeVar
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Endpoints with no samples yet score as fastest so they get tried
+UNMEASURED_LATENCY = 0.0
+
+
+class Endpoint:
+    """One RPC or relay endpoint and its rolling health statistics"""
+
+    def __init__(self, url: str, window_size: int):
+        self.url = url
+        self.samples: Deque[Tuple[float, bool]] = deque(maxlen=window_size)  # (latency, ok)
+        self.ejected_until: Optional[float] = None
+        self.probing = False
+        self.ejections = 0
+
+    @property
+    def latency(self) -> float:
+        """Mean latency of successful calls in the window, in seconds"""
+        latencies = [latency for latency, ok in self.samples if ok]
+        if not latencies:
+            return UNMEASURED_LATENCY
+        return sum(latencies) / len(latencies)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the window"""
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+    def score(self) -> float:
+        """Lower is better: mean latency inflated by the error rate"""
+        return self.latency * (1 + 4 * self.error_rate) + self.error_rate
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "latency_ms": round(self.latency * 1000, 3),
+            "error_rate": round(self.error_rate, 4),
+            "samples": len(self.samples),
+            "ejected": self.ejected_until is not None,
+            "ejections": self.ejections,
+        }
+
+
+class EndpointRouter:
+    """
+    Routes each call to the healthiest, fastest endpoint
+
+    Each endpoint keeps a rolling window of call latencies and outcomes.
+    Calls go to the endpoint with the lowest latency-and-error score. An
+    endpoint whose error rate exceeds ``max_error_rate`` (after at least
+    ``min_samples`` calls) is ejected for ``eject_sec``; once that elapses it
+    receives a single probe call, and is reinstated if the probe succeeds or
+    ejected again if it fails. A failed call fails over to the next-best
+    endpoint until every endpoint has been tried.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        window_size: int = 50,
+        max_error_rate: float = 0.5,
+        min_samples: int = 5,
+        eject_sec: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.endpoints: List[Endpoint] = [Endpoint(url, window_size) for url in dict.fromkeys(urls)]
+        if not self.endpoints:
+            raise ValueError("At least one endpoint URL is required")
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.eject_sec = eject_sec
+        self.clock = clock
+
+    def _available(self, endpoint: Endpoint, now: float) -> bool:
+        """Whether an endpoint may take a call now (healthy, or due for a probe)"""
+        if endpoint.ejected_until is None:
+            return True
+        return now >= endpoint.ejected_until and not endpoint.probing
+
+    def select(self, exclude: Iterable[Endpoint] = ()) -> Optional[Endpoint]:
+        """
+        Pick the best endpoint, skipping excluded ones
+
+        If every candidate is ejected, the one whose ejection ends soonest
+        is returned rather than failing outright.
+        """
+        now = self.clock()
+        excluded = set(id(e) for e in exclude)
+        candidates = [e for e in self.endpoints if id(e) not in excluded]
+        if not candidates:
+            return None
+
+        available = [e for e in candidates if self._available(e, now)]
+        if not available:
+            return min(candidates, key=lambda e: e.ejected_until or 0.0)
+
+        # Prefer a due probe so ejected endpoints get a chance to recover
+        for endpoint in available:
+            if endpoint.ejected_until is not None:
+                endpoint.probing = True
+                return endpoint
+        return min(available, key=Endpoint.score)
+
+    def record(self, endpoint: Endpoint, latency: float, ok: bool):
+        """Record a call outcome and eject or reinstate the endpoint"""
+        endpoint.samples.append((latency, ok))
+
+        if endpoint.ejected_until is not None:
+            endpoint.probing = False
+            if ok:
+                logger.info("Endpoint reinstated after probe: %s", endpoint.url)
+                endpoint.ejected_until = None
+                endpoint.samples.clear()
+                endpoint.samples.append((latency, ok))
+            else:
+                endpoint.ejected_until = self.clock() + self.eject_sec
+            return
+
+        if (
+            not ok
+            and len(endpoint.samples) >= self.min_samples
+            and endpoint.error_rate > self.max_error_rate
+        ):
+            logger.warning("Ejecting endpoint: %s (error_rate=%.2f)", endpoint.url, endpoint.error_rate)
+            endpoint.ejected_until = self.clock() + self.eject_sec
+            endpoint.ejections += 1
+
+    async def call(
+        self,
+        fn: Callable[[str], Awaitable[T]],
+        is_endpoint_failure: Callable[[Exception], bool] = lambda e: True,
+    ) -> T:
+        """
+        Run fn(url) on the best endpoint, failing over on endpoint failures
+
+        Args:
+            fn: Coroutine function taking the endpoint URL
+            is_endpoint_failure: Whether an exception reflects on the endpoint
+                (and should fail over) rather than on the request itself
+
+        Raises:
+            The last endpoint failure if every endpoint failed, or the
+            request's own error immediately.
+        """
+        tried: List[Endpoint] = []
+        last_error: Optional[Exception] = None
+
+        while True:
+            endpoint = self.select(exclude=tried)
+            if endpoint is None:
+                raise last_error
+            tried.append(endpoint)
+
+            try:
+                return await self.attempt(endpoint, fn, is_endpoint_failure)
+            except Exception as e:
+                if not is_endpoint_failure(e):
+                    raise
+                last_error = e
+
+    async def attempt(
+        self,
+        endpoint: Endpoint,
+        fn: Callable[[str], Awaitable[T]],
+        is_endpoint_failure: Callable[[Exception], bool] = lambda e: True,
+    ) -> T:
+        """Run fn(url) once on a specific endpoint and record the outcome"""
+        start = self.clock()
+        try:
+            result = await fn(endpoint.url)
+        except Exception as e:
+            self.record(endpoint, self.clock() - start, ok=not is_endpoint_failure(e))
+            raise
+        except BaseException:
+            # Cancelled mid-call: release a probe slot without judging the endpoint
+            endpoint.probing = False
+            raise
+
+        self.record(endpoint, self.clock() - start, ok=True)
+        return result
+
+    def stats(self) -> List[dict]:
+        """Per-endpoint latency, error rate and ejection state"""
+        return [endpoint.stats() for endpoint in self.endpoints]
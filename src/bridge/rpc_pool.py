@@ -0,0 +1,207 @@
+"""Shared Solana RPC clients with keep-alive connection pooling"""
+
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, TypeVar
+from ..config.settings import Settings
+from ..utils.logger import get_logger
+from .errors import NetworkError
+from .hedging import HedgePolicy
+from .policy import CircuitBreaker, ExecutionPolicy, RetryPolicy
+from .routing import EndpointRouter
+
+if TYPE_CHECKING:
+    from solana.rpc.async_api import AsyncClient
+    from solders.pubkey import Pubkey
+    from solders.signature import Signature
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RpcPool:
+    """
+    Long-lived RPC clients shared by every request
+
+    One ``AsyncClient`` is kept per distinct endpoint URL, each backed by a
+    pool of keep-alive HTTP connections sized from ``Settings``. The pool is
+    opened and warmed once at startup and drained on shutdown, so requests
+    never pay connection setup and no sockets outlive the app. solana-py is
+    imported when the first client is created, not with this module.
+
+    Calls made through ``call()`` are routed across the configured Solana or
+    Arcium endpoints by an ``EndpointRouter`` and run under the pool's
+    ``ExecutionPolicy`` (retries with backoff, per-endpoint circuit breakers).
+    With hedging enabled, idempotent calls that are slow on one endpoint are
+    duplicated to another by a ``HedgePolicy``.
+    """
+
+    def __init__(self, settings: Settings, policy: Optional[ExecutionPolicy] = None):
+        self.settings = settings
+        self._clients: Dict[str, "AsyncClient"] = {}
+        self._warmed = False
+        self.policy = policy or self._create_policy()
+        self.hedging: Optional[HedgePolicy] = None
+        if settings.hedging_enabled:
+            self.hedging = HedgePolicy(
+                percentile=settings.hedging_percentile,
+                max_fraction=settings.hedging_max_fraction,
+                min_samples=settings.hedging_min_samples,
+            )
+        self.routers: Dict[str, EndpointRouter] = {
+            "solana": self._create_router(settings.solana_rpc_endpoints),
+            "arcium": self._create_router(settings.arcium_rpc_endpoints),
+        }
+
+    def _create_router(self, urls) -> EndpointRouter:
+        return EndpointRouter(
+            urls,
+            window_size=self.settings.routing_window_size,
+            max_error_rate=self.settings.routing_max_error_rate,
+            min_samples=self.settings.routing_min_samples,
+            eject_sec=self.settings.routing_eject_sec,
+        )
+
+    def _create_policy(self) -> ExecutionPolicy:
+        return ExecutionPolicy(
+            retry=RetryPolicy(
+                max_retries=self.settings.retry_max_retries,
+                initial_backoff=self.settings.retry_initial_backoff_sec,
+                multiplier=self.settings.retry_backoff_multiplier,
+                max_backoff=self.settings.retry_max_backoff_sec,
+            ),
+            breaker_factory=lambda: CircuitBreaker(
+                failure_threshold=self.settings.breaker_failure_threshold,
+                reset_timeout=self.settings.breaker_reset_timeout_sec,
+            ),
+        )
+
+    def client(self, url: str) -> "AsyncClient":
+        """Get the shared client for an endpoint, creating it on first use"""
+        client = self._clients.get(url)
+        if client is None:
+            client = self._create_client(url)
+            self._clients[url] = client
+        return client
+
+    @property
+    def solana(self) -> "AsyncClient":
+        """Client for the primary (first configured) Solana RPC endpoint"""
+        return self.client(self.routers["solana"].endpoints[0].url)
+
+    @property
+    def arcium(self) -> "AsyncClient":
+        """Client for the primary (first configured) Arcium RPC endpoint"""
+        return self.client(self.routers["arcium"].endpoints[0].url)
+
+    async def call(
+        self,
+        role: str,
+        fn: Callable[["AsyncClient"], Awaitable[T]],
+        is_endpoint_failure: Callable[[Exception], bool] = lambda e: True,
+        hedge: bool = False,
+    ) -> T:
+        """
+        Run fn(client) against the best endpoint for a role ("solana" or "arcium")
+
+        Each endpoint call goes through that endpoint's circuit breaker and
+        fails over to the next-best endpoint on network errors. If every
+        endpoint failed with a retryable error the whole call is retried with
+        backoff; if every breaker is open it fails fast with CircuitOpen.
+
+        Pass ``hedge=True`` only for idempotent calls: fn may run on two
+        endpoints at once when hedging is enabled.
+        """
+        router = self.routers[role]
+
+        def endpoint_call(url: str) -> Awaitable[T]:
+            return self.policy.guard(url, lambda: fn(self.client(url)))
+
+        def endpoint_failure(e: Exception) -> bool:
+            return isinstance(e, NetworkError) or is_endpoint_failure(e)
+
+        def attempt():
+            if hedge and self.hedging is not None:
+                return self.hedging.call(router, endpoint_call, endpoint_failure)
+            return router.call(endpoint_call, endpoint_failure)
+
+        return await self.policy.run(f"rpc:{role}", attempt)
+
+    async def send_raw_transaction(self, role: str, signed_tx: bytes) -> "Signature":
+        """
+        Broadcast a signed transaction (e.g. an MXE computation submission)
+
+        Hedged copies re-send these exact bytes, so every copy carries the
+        same signature and the chain commits the transaction at most once.
+        """
+        async def send(client: "AsyncClient") -> "Signature":
+            response = await client.send_raw_transaction(signed_tx)
+            return response.value
+
+        return await self.call(role, send, hedge=True)
+
+    async def get_signature_statuses(self, role: str, signatures: List["Signature"]) -> list:
+        """Query confirmation status for submitted transactions (hedged when enabled)"""
+        async def query(client: "AsyncClient") -> list:
+            response = await client.get_signature_statuses(signatures)
+            return response.value
+
+        return await self.call(role, query, hedge=True)
+
+    def _create_client(self, url: str) -> "AsyncClient":
+        from solana.rpc.async_api import AsyncClient
+
+        try:
+            return AsyncClient(
+                url,
+                timeout=self.settings.rpc_timeout_sec,
+                max_connections=self.settings.rpc_max_connections,
+                max_keepalive_connections=self.settings.rpc_max_keepalive_connections,
+                keepalive_expiry=self.settings.rpc_keepalive_expiry_sec,
+            )
+        except TypeError:
+            # solana-py < 0.40 does not accept connection pool limits
+            logger.warning("Installed solana-py does not support pool limits - using its defaults")
+            return AsyncClient(url, timeout=self.settings.rpc_timeout_sec)
+
+    async def start(self, mxe_program_id: Optional["Pubkey"] = None):
+        """
+        Open clients for the configured endpoints and warm their connections
+
+        Warming resolves the MXE program account, which establishes a
+        keep-alive connection before the first request arrives. Failures
+        are logged, not raised, so the service still starts when RPC is
+        briefly unavailable.
+        """
+        for router in self.routers.values():
+            for endpoint in router.endpoints:
+                self.client(endpoint.url)
+
+        if mxe_program_id is not None and not self._warmed:
+            for endpoint in self.routers["arcium"].endpoints:
+                try:
+                    response = await self.client(endpoint.url).get_account_info(mxe_program_id)
+                    if response.value is None:
+                        logger.warning("MXE program account not found via %s: %s", endpoint.url, mxe_program_id)
+                    self._warmed = True
+                except Exception as e:
+                    logger.warning("Failed to warm RPC endpoint %s: %s", endpoint.url, type(e).__name__)
+
+    async def close(self):
+        """Close every client and its pooled connections"""
+        clients, self._clients = self._clients, {}
+        self._warmed = False
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning("Error closing RPC client: %s", type(e).__name__)
+
+    def stats(self) -> dict:
+        """Open endpoints, warm-up state, per-endpoint routing health, breaker state and hedge counters"""
+        return {
+            "endpoints": len(self._clients),
+            "warmed": self._warmed,
+            "routing": {role: router.stats() for role, router in self.routers.items()},
+            "policy": self.policy.stats(),
+            "hedging": self.hedging.stats() if self.hedging is not None else None,
+        }
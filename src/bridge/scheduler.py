@@ -0,0 +1,147 @@
+"""Micro-batching scheduler for confidential computations"""
+
+import asyncio
+import copy
+from typing import Awaitable, Callable, Dict, List, Set, Tuple
+from .errors import BridgeError
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BatchHandler = Callable[[str, list], Awaitable[list]]
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent requests of the same computation type into one submission
+
+    Requests are queued per computation type. A queue is flushed as a single
+    batch when it reaches ``max_batch_size`` items or when ``window_ms`` has
+    elapsed since its first item arrived, whichever comes first. The handler
+    returns one result (or exception) per item, in order, and each result is
+    delivered to the future of the caller that submitted that item.
+    """
+
+    def __init__(self, handler: BatchHandler, window_ms: float, max_batch_size: int):
+        """
+        Initialize the scheduler
+
+        Args:
+            handler: Coroutine taking (computation_type, items) and returning
+                one result or exception per item, in order
+            window_ms: Maximum time to hold the first queued item before flushing
+            max_batch_size: Queue length that triggers an immediate flush
+        """
+        self.handler = handler
+        self.window_ms = window_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self._queues: Dict[str, List[Tuple[object, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self._batch_stats: Dict[str, Dict[str, int]] = {}
+
+    async def submit(self, computation_type: str, item) -> object:
+        """
+        Queue one item and wait for its result
+
+        Raises the item's exception if its computation failed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._queues.setdefault(computation_type, [])
+        queue.append((item, future))
+
+        if len(queue) >= self.max_batch_size:
+            self._flush(computation_type)
+        elif computation_type not in self._timers:
+            self._timers[computation_type] = loop.call_later(
+                self.window_ms / 1000, self._flush, computation_type
+            )
+
+        return await future
+
+    def _flush(self, computation_type: str):
+        """Dispatch everything queued for a computation type as one batch"""
+        timer = self._timers.pop(computation_type, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._queues.pop(computation_type, None)
+        if not batch:
+            return
+
+        self._record_batch(computation_type, len(batch))
+        task = asyncio.ensure_future(self._dispatch(computation_type, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, computation_type: str, batch: List[Tuple[object, asyncio.Future]]):
+        """Run the handler for one batch and fan results back out to callers"""
+        items = [item for item, _ in batch]
+        try:
+            results = await self.handler(computation_type, items)
+        except Exception as e:
+            logger.error("Batch submission failed: type=%s, size=%d", computation_type, len(batch))
+            results = [_caller_error(e) for _ in batch]
+        else:
+            if len(results) != len(batch):
+                # Results can no longer be matched to callers; fail them all rather than leave any waiting
+                logger.error(
+                    "Batch handler returned %d results for %d items: type=%s", len(results), len(batch), computation_type
+                )
+                results = [BridgeError("Batch result count mismatch") for _ in batch]
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                # Caller stopped waiting (e.g. request cancelled)
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _record_batch(self, computation_type: str, size: int):
+        """Update batch size counters for a computation type"""
+        stats = self._batch_stats.setdefault(
+            computation_type, {"batches": 0, "items": 0, "max_batch_size": 0, "last_batch_size": 0}
+        )
+        stats["batches"] += 1
+        stats["items"] += size
+        stats["max_batch_size"] = max(stats["max_batch_size"], size)
+        stats["last_batch_size"] = size
+
+    async def drain(self):
+        """Flush all queues and wait for in-flight batches to finish"""
+        for computation_type in list(self._queues):
+            self._flush(computation_type)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """Queue depth and batch size metrics per computation type"""
+        return {
+            "queue_depth": {kind: len(queue) for kind, queue in self._queues.items()},
+            "in_flight_batches": len(self._in_flight),
+            "batches": {
+                kind: {
+                    **stats,
+                    "mean_batch_size": stats["items"] / stats["batches"],
+                }
+                for kind, stats in self._batch_stats.items()
+            },
+        }
+
+
+def _caller_error(error: Exception) -> Exception:
+    """
+    A copy of a batch-wide error for one caller, chained to the original
+
+    Each caller re-raises its own instance, so tracebacks from different
+    callers do not accumulate on one shared exception.
+    """
+    try:
+        fresh = copy.copy(error)
+    except Exception:
+        fresh = BridgeError()
+    fresh.__cause__ = error
+    return fresh
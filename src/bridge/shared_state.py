@@ -0,0 +1,468 @@
+"""State shared by the worker processes of one bridge instance
+
+With several uvicorn workers (see src/api/launcher.py), each worker keeping
+its own result cache and nonce store would miss results cached by its
+siblings and, worse, accept an intent nonce replayed to another worker.
+The launcher process therefore runs a ``SharedStateServer`` on a Unix
+socket that holds the one result cache and nonce store, and each worker
+talks to it through a ``SharedStateClient``.
+
+Cache entries keep their confidentiality properties: workers derive entry
+keys and encrypt values with secrets handed out by the server on connect,
+so the server only ever holds HMAC keys and ciphertext. The socket lives in
+a private (0700) directory created by the launcher.
+
+Wire format: each message is a 4-byte big-endian length followed by a
+JSON object; requests carry an ``id`` echoed by the response, so one
+connection serves many concurrent requests. Binary values are base64.
+
+When per-client rate limiting is enabled, the server also holds the
+token buckets (``rate_take`` and ``rate_credit``), so a client's budget is
+shared by all workers.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import struct
+import threading
+from typing import Any, Callable, Dict, List, Optional, Type
+from pydantic import BaseModel
+from ..utils.logger import get_logger
+from .cache import ResultCache, cache_ttls
+from .errors import NetworkError, RateLimited
+from .intents import nonce_store
+from .nonces import NonceStore, NonceStoreFull
+from .rate_limit import RateLimiter, rate_limiter
+
+logger = get_logger(__name__)
+
+_LENGTH = struct.Struct(">I")
+
+# Delay before the first reconnect attempt after the connection is lost; doubles per failure
+RECONNECT_BACKOFF_SEC = 0.1
+# Largest message accepted from a peer
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class SharedStateUnavailable(ConnectionError):
+    """The shared state server cannot be reached"""
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _unb64(data: str) -> bytes:
+    return base64.b64decode(data)
+
+
+async def _read_message(reader: asyncio.StreamReader) -> dict:
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    if length > MAX_MESSAGE_BYTES:
+        raise ValueError("Shared state message too large")
+    return json.loads(await reader.readexactly(length))
+
+
+def _write_message(writer: asyncio.StreamWriter, message: dict):
+    data = json.dumps(message, separators=(",", ":")).encode()
+    writer.write(_LENGTH.pack(len(data)) + data)
+
+
+class SharedStateServer:
+    """
+    Holds the result cache and nonce store for all workers
+
+    Run ``start`` on an event loop, or ``start_in_thread`` from a process
+    that has none (the launcher). Requests are handled one at a time on
+    the server's loop, so each operation is atomic across workers.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cache: Optional[ResultCache],
+        nonces: NonceStore,
+        limiter: Optional[RateLimiter] = None,
+    ):
+        self.path = path
+        self.cache = cache
+        self.nonces = nonces
+        self.limiter = limiter
+        self._secrets = {"cache_hash_key": _b64(os.urandom(32)), "cache_encryption_key": _b64(os.urandom(32))}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connections = 0
+        self._requests = 0
+        self._writers: set = set()
+
+    @classmethod
+    def from_settings(cls, path: str, settings) -> "SharedStateServer":
+        cache = None
+        if settings.cache_enabled:
+            cache = ResultCache(ttls=cache_ttls(settings), max_bytes=settings.cache_max_bytes)
+        nonces = nonce_store(
+            settings.intent_max_age_sec,
+            settings.nonce_store_buckets,
+            settings.nonce_store_max_nonces,
+            settings.nonce_bloom_bits_per_nonce,
+        )
+        limiter = rate_limiter(settings) if settings.rate_limit_enabled else None
+        return cls(path, cache, nonces, limiter)
+
+    async def start(self):
+        """Listen on the Unix socket (owner-only permissions)"""
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+        os.chmod(self.path, 0o600)
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            # Drop open worker connections too, so workers see the server go away
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def start_in_thread(self):
+        """Run the server on its own event loop in a daemon thread; returns once it is listening"""
+        ready = threading.Event()
+        failure: List[BaseException] = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(self.start())
+            except BaseException as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="shared-state", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+
+    def stop_thread(self):
+        if self._thread is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                request = await _read_message(reader)
+                self._requests += 1
+                try:
+                    response = {"id": request["id"], "ok": self._handle(request)}
+                except NonceStoreFull:
+                    response = {"id": request["id"], "error": "nonce_store_full"}
+                except RateLimited as e:
+                    response = {"id": request["id"], "error": "rate_limited", "message": e.message, "retry_after": e.retry_after}
+                except Exception as e:
+                    logger.error("Shared state request failed: op=%s, error=%s", request.get("op"), type(e).__name__)
+                    response = {"id": request["id"], "error": "internal"}
+                _write_message(writer, response)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._connections -= 1
+            self._writers.discard(writer)
+            writer.close()
+
+    def _handle(self, request: dict) -> Any:
+        op = request["op"]
+        if op == "hello":
+            return {**self._secrets, "cache_enabled": self.cache is not None, "nonce_bucket_sec": self.nonces.bucket_sec}
+        if op == "cache_get":
+            blobs = [self.cache.get_blob(request["kind"], _unb64(key)) for key in request["keys"]]
+            return [None if blob is None else _b64(blob) for blob in blobs]
+        if op == "cache_put":
+            self.cache.put_blob(request["kind"], _unb64(request["key"]), _unb64(request["blob"]))
+            return None
+        if op == "nonce_add":
+            return self.nonces.add(request["nonce"])
+        if op == "rate_take":
+            return self.limiter.take(request["client_id"], request["bucket"], request["amount"])
+        if op == "rate_credit":
+            return self.limiter.credit(request["client_id"], request["bucket"], request["amount"])
+        if op == "stats":
+            return self.stats()
+        raise ValueError(f"Unknown shared state op: {op}")
+
+    def stats(self) -> dict:
+        stats = {"connections": self._connections, "requests": self._requests, "nonces": self.nonces.stats()}
+        if self.cache is not None:
+            stats["cache"] = self.cache.stats()
+        if self.limiter is not None:
+            stats["rate_limit"] = self.limiter.stats()
+        return stats
+
+
+class SharedStateClient:
+    """
+    One worker's connection to the shared state server
+
+    Requests are pipelined over a single connection and matched to their
+    responses by id. Raises SharedStateUnavailable when the server cannot
+    be reached or does not answer within ``timeout_sec``; callers decide
+    whether to fail open (cache) or closed (nonces).
+
+    A lost connection is reopened by the next call. Failed attempts back
+    off exponentially up to ``max_backoff_sec``, and calls in between fail
+    at once. Callbacks registered with ``on_connect`` get the new hello
+    after every reconnect, since a restarted server hands out new secrets.
+    """
+
+    def __init__(self, path: str, timeout_sec: float = 1.0, max_backoff_sec: float = 5.0):
+        self.path = path
+        self.timeout_sec = timeout_sec
+        self.max_backoff_sec = max_backoff_sec
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._receiver: Optional[asyncio.Task] = None
+        self._connecting = asyncio.Lock()
+        self._backoff_sec = 0.0
+        self._retry_at = 0.0
+        self._closed = False
+        self._reconnects = 0
+        self._timeouts = 0
+        self._callbacks: List[Callable[[dict], None]] = []
+        self.hello: dict = {}
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    def on_connect(self, callback: Callable[[dict], None]):
+        """Call ``callback(hello)`` after each reconnect"""
+        self._callbacks.append(callback)
+
+    async def connect(self) -> dict:
+        """Open the connection and return the server's hello (shared cache secrets, nonce bucket length)"""
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(self.path), self.timeout_sec)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise SharedStateUnavailable(f"Cannot connect to shared state at {self.path}") from e
+        # Each connection fails only its own pending requests when it ends
+        self._writer, self._pending = writer, {}
+        self._receiver = asyncio.get_running_loop().create_task(self._receive(reader, writer, self._pending))
+        hello = await self._request("hello")
+        self.hello = {
+            "cache_enabled": hello["cache_enabled"],
+            "cache_hash_key": _unb64(hello["cache_hash_key"]),
+            "cache_encryption_key": _unb64(hello["cache_encryption_key"]),
+            "nonce_bucket_sec": hello["nonce_bucket_sec"],
+        }
+        return self.hello
+
+    async def call(self, op: str, **args) -> Any:
+        if not self.connected:
+            await self._reconnect()
+        return await self._request(op, **args)
+
+    async def _reconnect(self):
+        """Reopen a lost connection, at most one attempt per backoff interval"""
+        if self._closed:
+            raise SharedStateUnavailable("Shared state client closed")
+        loop = asyncio.get_running_loop()
+        async with self._connecting:
+            if self.connected:
+                return
+            if loop.time() < self._retry_at:
+                raise SharedStateUnavailable("Shared state connection lost")
+            try:
+                await self.connect()
+            except SharedStateUnavailable:
+                if self._writer is not None:
+                    self._writer.close()
+                self._backoff_sec = min(self.max_backoff_sec, max(RECONNECT_BACKOFF_SEC, self._backoff_sec * 2))
+                self._retry_at = loop.time() + self._backoff_sec
+                raise
+            self._backoff_sec = 0.0
+            self._reconnects += 1
+            logger.warning("Reconnected to shared state server: reconnects=%d", self._reconnects)
+            for callback in self._callbacks:
+                callback(self.hello)
+
+    async def _request(self, op: str, **args) -> Any:
+        writer, pending = self._writer, self._pending
+        if writer is None or writer.is_closing():
+            raise SharedStateUnavailable("Shared state connection closed")
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        pending[request_id] = future
+        _write_message(writer, {"id": request_id, "op": op, **args})
+        try:
+            await writer.drain()
+        except ConnectionError as e:
+            pending.pop(request_id, None)
+            writer.close()
+            raise SharedStateUnavailable("Shared state connection lost") from e
+        try:
+            return await asyncio.wait_for(future, self.timeout_sec)
+        except asyncio.TimeoutError as e:
+            pending.pop(request_id, None)
+            self._timeouts += 1
+            # A server that stopped answering is treated as lost; the next call reconnects
+            writer.close()
+            raise SharedStateUnavailable(f"Shared state request timed out: op={op}") from e
+
+    async def _receive(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, pending: Dict[int, asyncio.Future]):
+        try:
+            while True:
+                response = await _read_message(reader)
+                future = pending.pop(response["id"], None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    future.set_exception(self._error(response))
+                else:
+                    future.set_result(response["ok"])
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(SharedStateUnavailable("Shared state connection lost"))
+            pending.clear()
+            writer.close()
+
+    @staticmethod
+    def _error(response: dict) -> Exception:
+        """Exception for an error response (store-full and rate-limit errors keep their meaning)"""
+        if response["error"] == "nonce_store_full":
+            return NonceStoreFull()
+        if response["error"] == "rate_limited":
+            return RateLimited(response["message"], retry_after=response["retry_after"])
+        return SharedStateUnavailable(f"Shared state error: {response['error']}")
+
+    def stats(self) -> dict:
+        return {"connected": self.connected, "reconnects": self._reconnects, "timeouts": self._timeouts}
+
+    async def close(self):
+        self._closed = True
+        if self._writer is not None:
+            self._writer.close()
+        if self._receiver is not None:
+            self._receiver.cancel()
+            try:
+                await self._receiver
+            except asyncio.CancelledError:
+                pass
+            self._receiver = None
+
+
+class SharedResultCache(ResultCache):
+    """
+    Result cache whose entries live in the shared state server
+
+    Keys and values are computed and encrypted in the worker, under the
+    secrets set with ``use_secrets`` after connecting. If the server is
+    unreachable, lookups miss and stores are skipped.
+    """
+
+    def __init__(self, client: SharedStateClient, ttls: Dict[str, float], max_bytes: int):
+        super().__init__(ttls=ttls, max_bytes=max_bytes)
+        self.client = client
+        self._remote = {"hits": 0, "misses": 0, "errors": 0}
+
+    async def fetch(self, computation_type: str, key: bytes, model_cls: Type[BaseModel]) -> Optional[BaseModel]:
+        return (await self.fetch_many(computation_type, [key], model_cls))[0]
+
+    async def fetch_many(self, computation_type: str, keys: List[bytes], model_cls: Type[BaseModel]) -> List[Optional[BaseModel]]:
+        try:
+            blobs = await self.client.call("cache_get", kind=computation_type, keys=[_b64(k) for k in keys])
+        except SharedStateUnavailable:
+            self._remote["errors"] += 1
+            return [None] * len(keys)
+        results = [self.open(key, None if blob is None else _unb64(blob), model_cls) for key, blob in zip(keys, blobs)]
+        hits = sum(result is not None for result in results)
+        self._remote["hits"] += hits
+        self._remote["misses"] += len(keys) - hits
+        return results
+
+    async def store(self, computation_type: str, key: bytes, result: BaseModel):
+        if not self.enabled_for(computation_type):
+            return
+        try:
+            await self.client.call("cache_put", kind=computation_type, key=_b64(key), blob=_b64(self.seal(key, result)))
+        except SharedStateUnavailable:
+            self._remote["errors"] += 1
+
+    def stats(self) -> dict:
+        """This worker's lookups against the shared cache (entry counts are on the server)"""
+        return {"shared": True, **self._remote}
+
+
+class SharedNonceStore:
+    """
+    Nonce store in the shared state server, so a replay to any worker is caught
+
+    Fails closed: if the server is unreachable, intents are rejected with
+    a retryable NetworkError rather than accepted unchecked.
+    """
+
+    def __init__(self, client: SharedStateClient):
+        self.client = client
+        self._errors = 0
+
+    @property
+    def bucket_sec(self) -> float:
+        """Server's bucket length, which bounds how long a full store stays full"""
+        return self.client.hello.get("nonce_bucket_sec", 1.0)
+
+    async def add_async(self, nonce: str) -> bool:
+        try:
+            return await self.client.call("nonce_add", nonce=nonce)
+        except SharedStateUnavailable:
+            self._errors += 1
+            raise NetworkError("Replay store unavailable")
+
+    def stats(self) -> dict:
+        """This worker's view (nonce counts are on the server)"""
+        return {"shared": True, "errors": self._errors}
+
+
+class SharedRateLimiter:
+    """
+    Per-client token buckets in the shared state server, so a client's budget spans all workers
+
+    Fails open: if the server is unreachable, requests are allowed (and
+    counted as errors), since the limits protect MXE budget rather than
+    confidentiality.
+    """
+
+    def __init__(self, client: SharedStateClient):
+        self.client = client
+        self._errors = 0
+
+    async def take_async(self, client_id: str, bucket: str, amount: float) -> Dict[str, float]:
+        try:
+            return await self.client.call("rate_take", client_id=client_id, bucket=bucket, amount=amount)
+        except SharedStateUnavailable:
+            self._errors += 1
+            return {}
+
+    async def credit_async(self, client_id: str, bucket: str, amount: float) -> Dict[str, float]:
+        try:
+            return await self.client.call("rate_credit", client_id=client_id, bucket=bucket, amount=amount)
+        except SharedStateUnavailable:
+            self._errors += 1
+            return {}
+
+    def stats(self) -> dict:
+        """This worker's view (bucket counts are on the server)"""
+        return {"shared": True, "errors": self._errors}
@@ -1,6 +1,5 @@
 """Configuration module"""
 
-from .settings import Settings
-
-__all__ = ["Settings"]
+from .settings import Settings, get_settings
 
+__all__ = ["Settings", "get_settings"]
@@ -10,7 +10,13 @@ except ImportError:
         # Fallback for pydantic v1
         from pydantic import BaseSettings
 
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
+
+
+def _split_urls(value: Optional[str]) -> List[str]:
+    """Parse a comma-separated URL list"""
+    return [url.strip() for url in (value or "").split(",") if url.strip()]
 
 
 class Settings(BaseSettings):
@@ -21,21 +27,172 @@ class Settings(BaseSettings):
     arcium_mxe_program_id: Optional[str] = None
     arcium_cluster_offset: int = 1078779259
     arcium_rpc_url: str = "https://api.devnet.solana.com"
+    arcium_rpc_urls: Optional[str] = None  # Comma-separated relay list; overrides arcium_rpc_url
     
     # Solana Configuration
     solana_rpc_url: str = "https://api.devnet.solana.com"
+    solana_rpc_urls: Optional[str] = None  # Comma-separated RPC list; overrides solana_rpc_url
     solana_keypair_path: Optional[str] = None
     
+    # Multi-relay Routing Configuration
+    routing_window_size: int = 50  # Recent calls tracked per endpoint
+    routing_max_error_rate: float = 0.5  # Error rate above which an endpoint is ejected
+    routing_min_samples: int = 5  # Calls required before an endpoint can be ejected
+    routing_eject_sec: float = 30.0  # Time before an ejected endpoint is re-probed
+    
+    # RPC Connection Pool Configuration
+    rpc_timeout_sec: float = 10.0
+    rpc_max_connections: int = 100  # Per endpoint
+    rpc_max_keepalive_connections: int = 20  # Idle connections kept open per endpoint
+    rpc_keepalive_expiry_sec: float = 30.0
+    
+    # Retry and Circuit Breaker Configuration (see docs/bridge-spec.md)
+    retry_max_retries: int = 3
+    retry_initial_backoff_sec: float = 1.0
+    retry_backoff_multiplier: float = 2.0
+    retry_max_backoff_sec: float = 10.0
+    breaker_failure_threshold: int = 5  # Consecutive network errors that open an endpoint's breaker
+    breaker_reset_timeout_sec: float = 30.0  # Time an open breaker fails fast before a trial call
+    
+    # Request Hedging Configuration
+    # Duplicates slow idempotent calls (status queries, signed tx re-broadcasts) to a second endpoint
+    hedging_enabled: bool = False
+    hedging_percentile: float = 95.0  # Per-endpoint latency percentile after which a hedge is sent
+    hedging_max_fraction: float = 0.05  # Hedges may not exceed this fraction of eligible calls
+    hedging_min_samples: int = 20  # Latency samples an endpoint needs before it is hedged
+    
     # Service Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8010
     api_debug: bool = False
+    metrics_enabled: bool = True  # Per-stage latency histograms on /metrics
+    
+    # Production Launcher Configuration (python start_server.py --production)
+    api_workers: int = 0  # Worker processes; 0 = one per CPU
+    shutdown_grace_sec: float = 30.0  # In-flight requests and jobs get this long to finish on shutdown
+    shared_state_socket: Optional[str] = None  # Set by the launcher for its workers; not for manual use
+    shared_state_timeout_sec: float = 1.0  # Longest a worker waits for the shared state server to answer
+    shared_state_max_backoff_sec: float = 5.0  # Cap on the delay between reconnect attempts after it is lost
+    
+    # Logging Configuration
+    # Records are written to stdout by a background thread through a bounded queue
+    log_queue_size: int = 10000  # Records buffered before the overflow policy applies
+    log_overflow_policy: str = "drop"  # "drop" (never block the caller) or "block" (wait up to 1s)
+    log_info_sample_rate: float = 1.0  # Fraction of high-rate per-request INFO logs kept
+    
+    # Request Profiling Configuration (debug only; see docs/runbook.md)
+    profiling_enabled: bool = False  # Allows profiling requests sent with X-Evalys-Profile
+    profiling_dir: str = "profiles"  # Where X-Evalys-Profile: file writes .prof files
+    profiling_max_per_minute: int = 6
+    
+    # Batch Configuration
+    batch_max_items: int = 1000  # Maximum input triples per :batch request
+    engine_min_batch_items: int = 64  # Simulated batches at least this large use the NumPy engine
+    
+    # Micro-batching Configuration
+    # Coalesces concurrent single requests of the same type into one MXE submission
+    batching_enabled: bool = False
+    batching_window_ms: float = 5.0  # Max time to hold a request waiting for others
+    batching_max_size: int = 64  # Queue length that flushes a batch immediately
+    
+    # Admission Control Configuration
+    # Cache misses of each type run at most N at once; up to M more per traffic class wait in a queue
+    admission_concurrency_plan: int = 64  # 0 disables admission control for the type
+    admission_concurrency_risk_score: int = 256
+    admission_concurrency_curve_eval: int = 256
+    admission_queue_plan: int = 256  # Waiting requests per traffic class beyond this get 503 overloaded
+    admission_queue_risk_score: int = 1024
+    admission_queue_curve_eval: int = 1024
+    admission_queue_timeout_sec: float = 5.0  # Longest wait for a slot before 503 overloaded
+    admission_interactive_weight: float = 8.0  # Share of freed slots for interactive vs bulk waiters
+    admission_bulk_weight: float = 1.0
+    admission_aging_sec: float = 1.0  # Waiters queued this long are served next whatever their class
+    
+    # Per-client Rate Limiting Configuration
+    # Token buckets per X-Evalys-Client-Id: one for requests, one for MXE compute cost
+    rate_limit_enabled: bool = False
+    rate_limit_requests_per_sec: float = 100.0  # 0 disables the request bucket
+    rate_limit_request_burst: float = 200.0
+    rate_limit_cost_per_sec: float = 100.0  # MXE cost units per second; 0 disables the cost bucket
+    rate_limit_cost_burst: float = 500.0
+    rate_limit_cost_plan: float = 4.0  # Cost units per computation (cache hits are free)
+    rate_limit_cost_risk_score: float = 1.0
+    rate_limit_cost_curve_eval: float = 1.0
+    rate_limit_max_clients: int = 10000  # Client ids tracked (LRU); bounds memory
+    # Client ids are declared by the caller, not authenticated. So that rotating ids does not buy
+    # fresh buckets, each source address also has buckets worth this many client budgets, shared by
+    # every id it sends; requests without an id use their address's alone. 0 = per-id limits only.
+    # Behind a proxy, run uvicorn with --forwarded-allow-ips so the address is the caller's.
+    rate_limit_address_factor: float = 4.0
+    
+    # Result Cache Configuration
+    # Results are keyed by input hash and encrypted in memory (see docs/crypto.md)
+    cache_enabled: bool = True
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_ttl_plan_sec: float = 0.0  # Off by default: MXE plans carry a per-computation plan_id that a cached copy would repeat
+    cache_ttl_risk_score_sec: float = 10.0
+    cache_ttl_curve_eval_sec: float = 5.0
+    
+    # Async Job Configuration
+    jobs_max_entries: int = 10000  # Maximum jobs held in memory (running + finished)
+    jobs_ttl_sec: float = 300.0  # How long finished job results stay retrievable
+    jobs_max_wait_sec: float = 30.0  # Upper bound for the long-poll wait= parameter
     
     # Arcium Client Configuration
-    arcium_client_encryption_key: Optional[str] = None
+    arcium_client_encryption_key: Optional[str] = None  # Base64 X25519 private key (random per process if unset)
+    arcium_cluster_public_key: Optional[str] = None  # Base64 X25519 key of the MXE cluster inputs are encrypted to
+    encryption_secret_ttl_sec: float = 3600.0  # Derived shared secrets are re-derived after this
+    encryption_chunk_size: int = 256  # Payloads per worker task in batch encryption
+    ephemeral_key_pool_low_water: int = 256  # Background refill starts below this many ready keys
+    ephemeral_key_pool_high_water: int = 1024  # Refill target; 0 disables ephemeral keys (static client key)
+    arcium_backend: str = "simulated"  # "simulated" (inline formulas) or "fake" (in-process MXE stand-in)
+    mxe_computation_timeout_sec: float = 30.0  # Max wait for a computation's receipt
+    
+    # Fake MXE Configuration (ARCIUM_BACKEND=fake; testing and benchmarks only)
+    fake_mxe_submit_latency_ms: float = 5.0  # Median submission latency
+    fake_mxe_compute_latency_ms: float = 50.0  # Median computation latency
+    fake_mxe_latency_sigma: float = 0.5  # Log-normal shape (0 = constant latency)
+    fake_mxe_capacity: int = 0  # Concurrent computations before queueing (0 = unlimited)
+    fake_mxe_network_error_rate: float = 0.0  # Probability a submission fails to connect
+    fake_mxe_timeout_rate: float = 0.0  # Probability a computation never completes
+    fake_mxe_invalid_receipt_rate: float = 0.0  # Probability a receipt has a bad signature
+    fake_mxe_decryption_failure_rate: float = 0.0  # Probability an output cannot be decrypted
+    fake_mxe_seed: Optional[int] = None  # Seed for reproducible latency and failures
+    
+    # Intent Replay Protection Configuration
+    intent_max_age_sec: float = 300.0  # Older intent envelopes are rejected
+    nonce_store_buckets: int = 10  # Time buckets per window; a whole bucket expires at once
+    nonce_store_max_nonces: int = 1000000  # Nonces per window; fixes the store's memory budget
+    nonce_bloom_bits_per_nonce: int = 0  # Bloom pre-filter size (0 disables, ~10 for 1% false positives)
+    
+    # Receipt Verification Configuration (see docs/crypto.md)
+    arcium_node_public_key: Optional[str] = None  # Base58 Ed25519 key that signs receipts
+    receipt_max_age_sec: float = 300.0  # Older receipts are rejected as replays
+    receipt_cache_size: int = 100000  # Verified receipt ids remembered
+    receipt_verify_chunk_size: int = 256  # Receipts per worker task in batch verification
+    
+    @property
+    def solana_rpc_endpoints(self) -> List[str]:
+        """Solana RPC endpoints, in configured order"""
+        return _split_urls(self.solana_rpc_urls) or [self.solana_rpc_url]
+    
+    @property
+    def arcium_rpc_endpoints(self) -> List[str]:
+        """Arcium RPC/relay endpoints, in configured order"""
+        return _split_urls(self.arcium_rpc_urls) or [self.arcium_rpc_url]
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Settings shared by the whole process
+
+    Built (and ``.env`` parsed) once on first use. Tests and tools that need
+    different values construct their own ``Settings(...)`` instead.
+    """
+    return Settings()
@@ -1,6 +1,5 @@
 """Utility modules"""
 
-from .logger import get_logger
-
-__all__ = ["get_logger"]
+from .logger import fields, get_logger, logging_stats
 
+__all__ = ["fields", "get_logger", "logging_stats"]
@@ -1,19 +1,179 @@
-"""Logging utilities"""
+"""Logging utilities
 
+Module loggers hand records to one shared, bounded in-memory queue; a
+background thread formats them and writes them to stdout. A slow or
+blocked stdout pipe therefore never stalls the event loop. When the
+queue is full, records are dropped (``LOG_OVERFLOW_POLICY=drop``, the
+default) or the caller waits up to a second for room (``block``), and
+the number dropped is reported in the next record that gets through.
+
+Message formatting happens on the writer thread, so pass values as
+%-style arguments or as ``fields(...)`` rather than building f-strings.
+Arguments must not be mutated after the call. Never log confidential
+inputs or results; log computation types, counts and ids instead.
+"""
+
+import atexit
 import logging
+import queue
+import random
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Seconds a caller waits for queue space under the "block" policy before dropping the record
+BLOCK_TIMEOUT_SEC = 1.0
+
+LOG_OVERFLOW_POLICIES = ("drop", "block")
+
+
+def fields(sampled: bool = False, **values: Any) -> dict:
+    """
+    ``extra=`` for a log call carrying structured key=value fields
+
+    Fields are appended to the message on the writer thread; callable
+    values are called there too, so expensive ones cost nothing when the
+    record is dropped, sampled out or filtered by level. ``sampled=True``
+    marks a high-rate INFO or DEBUG record as subject to
+    ``LOG_INFO_SAMPLE_RATE``.
+    """
+    return {"fields": values, "sampled": sampled}
+
+
+class StructuredFormatter(logging.Formatter):
+    """Standard line format followed by the record's ``fields`` as key=value pairs"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        values = getattr(record, "fields", None)
+        if values:
+            line += " " + " ".join(f"{key}={value() if callable(value) else value}" for key, value in values.items())
+        return line
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Enqueues records without formatting them, applying the overflow policy and sampling
+
+    Records marked ``sampled`` at INFO or below are kept with probability
+    ``sample_rate``. Counts are exposed through ``stats``.
+    """
+
+    def __init__(self, log_queue: queue.Queue, block: bool = False, sample_rate: float = 1.0):
+        super().__init__(log_queue)
+        self.block = block
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._enqueued = 0
+        self._dropped = 0
+        self._unreported = 0
+        self._sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if (
+            self.sample_rate < 1.0
+            and record.levelno <= logging.INFO
+            and getattr(record, "sampled", False)
+            and random.random() >= self.sample_rate
+        ):
+            self._sampled_out += 1
+            return False
+        return super().filter(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is left to the writer thread; the record stays in-process
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.block:
+                self.queue.put(record, timeout=BLOCK_TIMEOUT_SEC)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+                self._unreported += 1
+            return
+        self._enqueued += 1
+        if self._unreported:
+            with self._lock:
+                dropped, self._unreported = self._unreported, 0
+            notice = logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": "Log queue full: dropped %d records",
+                "args": (dropped,),
+            })
+            try:
+                self.queue.put_nowait(notice)
+            except queue.Full:
+                with self._lock:
+                    self._unreported += dropped
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "enqueued": self._enqueued,
+            "dropped": self._dropped,
+            "sampled_out": self._sampled_out,
+        }
+
+
+_handler: Optional[BoundedQueueHandler] = None
+_listener: Optional[QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+def _queue_handler() -> BoundedQueueHandler:
+    """The process-wide queue handler, starting its writer thread on first use"""
+    global _handler, _listener
+    if _handler is None:
+        with _setup_lock:
+            if _handler is None:
+                # Imported here: settings must not depend on logging at import time
+                from ..config.settings import get_settings
+
+                settings = get_settings()
+                if settings.log_overflow_policy not in LOG_OVERFLOW_POLICIES:
+                    raise ValueError(f"Unknown log overflow policy: {settings.log_overflow_policy}")
+                log_queue = queue.Queue(maxsize=settings.log_queue_size)
+                stream = logging.StreamHandler(sys.stdout)
+                stream.setFormatter(StructuredFormatter(FORMAT))
+                _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+                _listener.start()
+                atexit.register(shutdown_logging)
+                _handler = BoundedQueueHandler(
+                    log_queue,
+                    block=settings.log_overflow_policy == "block",
+                    sample_rate=settings.log_info_sample_rate,
+                )
+    return _handler
 
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance"""
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_queue_handler())
         logger.setLevel(logging.INFO)
     return logger
 
+
+def logging_stats() -> dict:
+    """Log queue depth and capacity, and records enqueued, dropped and sampled out"""
+    return _queue_handler().stats()
+
+
+def shutdown_logging():
+    """Write out queued records and stop the writer thread (idempotent)"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
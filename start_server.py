@@ -3,9 +3,13 @@
 Quick start script for Arcium Bridge Service
 
 This script starts the bridge service with minimal configuration for demo purposes.
-For production, use proper .env configuration.
+For production, use proper .env configuration and pass --production to run
+several worker processes (see src/api/launcher.py):
+
+    python start_server.py --production --workers 4
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -23,15 +27,28 @@ os.environ.setdefault("LOG_LEVEL", "INFO")
 # Uncomment and set if you have a real program ID:
 # os.environ["ARCIUM_MXE_PROGRAM_ID"] = "your_program_id_here"
 
-print("Starting Evalys Arcium Bridge Service in demo mode...")
-print("Note: This uses simulated computation (v0.1)")
-print("For production, configure .env file with real Arcium credentials")
-print()
-
 # Import and run server
 if __name__ == "__main__":
     import uvicorn
-    
+
+    parser = argparse.ArgumentParser(description="Start the Evalys Arcium Bridge Service")
+    parser.add_argument("--production", action="store_true", help="Multi-worker launcher, no reload")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: API_WORKERS, else one per CPU)")
+    args = parser.parse_args()
+
+    if args.production:
+        # Worker processes re-import this script; everything they must not repeat stays in this block
+        os.environ["API_DEBUG"] = "false"
+        print("Starting Evalys Arcium Bridge Service (production launcher)...")
+        from src.api.launcher import run
+        run(workers=args.workers)
+        sys.exit(0)
+
+    print("Starting Evalys Arcium Bridge Service in demo mode...")
+    print("Note: This uses simulated computation (v0.1)")
+    print("For production, configure .env file with real Arcium credentials")
+    print()
+
     # Use import string for reload mode, direct import for non-reload
     api_debug = os.environ.get("API_DEBUG", "false").lower() == "true"
     
@@ -0,0 +1,63 @@
+"""Example request payloads shared by the API tests"""
+
+PLAN_ITEM = {
+    "user_preferences": {
+        "desired_size": 1_000_000_000,
+        "slippage_tolerance": 100,
+        "risk_appetite": 150,
+        "preferred_hold_time": 3600,
+    },
+    "user_history": {
+        "recent_pnl": 5_000_000,
+        "win_rate": 6500,
+        "avg_hold_time": 1800,
+        "total_trades": 50,
+    },
+    "curve_state": {
+        "current_price": 1_000_000,
+        "liquidity_depth": 5_000_000_000,
+        "volatility": 300,
+        "recent_volume": 10_000_000_000,
+    },
+}
+
+RISK_ITEM = {
+    "portfolio_context": {
+        "total_capital": 10_000_000_000,
+        "current_exposure": 3_000_000_000,
+        "diversification_score": 180,
+        "leverage_ratio": 10000,
+    },
+    "performance_history": {
+        "total_pnl": 2_000_000,
+        "sharpe_ratio": 120,
+        "max_drawdown": 2000,
+        "consistency_score": 200,
+    },
+    "market_conditions": {
+        "curve_volatility": 400,
+        "liquidity_risk": 100,
+        "market_sentiment": 50,
+    },
+}
+
+CURVE_ITEM = {
+    "sizing_preferences": {
+        "target_size": 500_000_000,
+        "min_size": 100_000_000,
+        "max_size": 1_000_000_000,
+        "capital_allocation_pct": 10,
+    },
+    "user_constraints": {
+        "max_slippage_bps": 200,
+        "time_constraint_sec": 300,
+        "priority_level": 150,
+    },
+    "curve_metrics": {
+        "current_price": 1_000_000,
+        "price_change_24h": 500,
+        "liquidity_depth": 2_000_000_000,
+        "buy_pressure": 150,
+        "sell_pressure": 100,
+    },
+}
@@ -0,0 +1,232 @@
+"""
+Tests for admission control
+
+Tests the per-type concurrency limit and bounded wait queues, weighted
+fair scheduling of interactive and bulk traffic with aging, the
+overloaded rejections with retry_after, and the queue and traffic class
+headers on the API.
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from src.api.server import app
+from src.bridge.admission import BULK, INTERACTIVE, AdmissionGate
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.errors import Overloaded
+from src.bridge.models import RiskScoreRequest
+from src.config.settings import Settings
+from tests.payloads import CURVE_ITEM, RISK_ITEM
+
+
+def make_client(**overrides) -> ArciumBridgeClient:
+    settings = dict(
+        arcium_backend="fake",
+        cache_enabled=False,
+        fake_mxe_submit_latency_ms=0,
+        fake_mxe_compute_latency_ms=20,
+        fake_mxe_latency_sigma=0,
+    )
+    settings.update(overrides)
+    return ArciumBridgeClient(Settings(**settings))
+
+
+async def risk_score(client: ArciumBridgeClient):
+    request = RiskScoreRequest(**RISK_ITEM)
+    return await client.get_risk_score(request.portfolio_context, request.performance_history, request.market_conditions)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _serve_order(gate: AdmissionGate, arrivals: list, clock: FakeClock = None) -> list:
+    """Queue (name, traffic class) arrivals behind one held slot, then release slots one at a time"""
+    await gate.acquire()
+    served = []
+
+    async def wait(name, traffic_class):
+        await gate.acquire(traffic_class)
+        served.append(name)
+
+    tasks = []
+    for name, traffic_class in arrivals:
+        tasks.append(asyncio.ensure_future(wait(name, traffic_class)))
+        await asyncio.sleep(0)
+        if clock is not None:
+            clock.now += 1.0
+    for _ in arrivals:
+        gate.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    gate.release()
+    return served
+
+
+@pytest.mark.asyncio
+async def test_slots_are_handed_to_waiters_in_order():
+    """Test that at most max_concurrency run and waiters are admitted first come, first served"""
+    gate = AdmissionGate(max_concurrency=2, max_queue=10, queue_timeout_sec=1.0)
+    admitted = []
+
+    async def hold(name):
+        await gate.acquire()
+        admitted.append(name)
+        await asyncio.sleep(0.01)
+        assert gate.active <= 2
+        gate.release(0.01)
+
+    await asyncio.gather(*(hold(i) for i in range(6)))
+    assert admitted == list(range(6))
+    assert gate.active == 0
+    assert gate.stats()["admitted"] == 6
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_retry_after():
+    """Test that a request arriving at a full queue fails fast with Overloaded"""
+    gate = AdmissionGate(max_concurrency=1, max_queue=1, queue_timeout_sec=1.0)
+    gate._hold_sec = 2.5
+    await gate.acquire()
+    waiter = asyncio.ensure_future(gate.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(Overloaded) as exc_info:
+        await gate.acquire()
+    # Two requests ahead (one queued, then this one) of one slot held ~2.5s each
+    assert exc_info.value.retry_after == 5
+    assert exc_info.value.status_code == 503
+
+    gate.release(2.5)
+    await waiter
+    gate.release(2.5)
+    assert gate.stats()["rejected"] == 1
+    assert gate.active == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_and_cancellation_free_the_queue():
+    """Test that waiters that time out or are cancelled leave the queue and never hold a slot"""
+    gate = AdmissionGate(max_concurrency=1, max_queue=10, queue_timeout_sec=0.01)
+    await gate.acquire()
+
+    with pytest.raises(Overloaded):
+        await gate.acquire()
+    cancelled = asyncio.ensure_future(gate.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert gate.queued == 0
+    gate.release()
+    assert gate.active == 0
+    assert gate.stats()["timed_out"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_overtakes_bulk_backlog():
+    """Test that interactive waiters are served before an earlier bulk backlog"""
+    gate = AdmissionGate(1, 100, 1.0, weights={INTERACTIVE: 8.0, BULK: 1.0})
+    arrivals = [(f"b{i}", BULK) for i in range(8)] + [(f"i{i}", INTERACTIVE) for i in range(4)]
+
+    served = await _serve_order(gate, arrivals)
+    assert served[:4] == ["i0", "i1", "i2", "i3"]
+    assert served[4:] == [f"b{i}" for i in range(8)]
+    assert gate.stats()["classes"][BULK]["admitted"] == 8
+
+
+@pytest.mark.asyncio
+async def test_backlogged_classes_share_slots_by_weight():
+    """Test that freed slots are split 2:1 while both classes are waiting"""
+    gate = AdmissionGate(1, 100, 1.0, weights={INTERACTIVE: 2.0, BULK: 1.0})
+    arrivals = [(f"b{i}", BULK) for i in range(6)] + [(f"i{i}", INTERACTIVE) for i in range(6)]
+
+    served = await _serve_order(gate, arrivals)
+    assert sum(name.startswith("i") for name in served[:9]) == 6
+    assert [name for name in served if name.startswith("b")] == [f"b{i}" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_aged_bulk_waiter_is_not_starved():
+    """Test that a waiter queued past aging_sec is served before newer interactive ones"""
+    clock = FakeClock()
+    gate = AdmissionGate(1, 100, 100.0, weights={INTERACTIVE: 100.0, BULK: 1.0}, aging_sec=3.0, clock=clock)
+    arrivals = [("b0", BULK)] + [(f"i{i}", INTERACTIVE) for i in range(5)]
+
+    served = await _serve_order(gate, arrivals, clock)
+    assert served.index("b0") == 0
+    assert gate.stats()["aged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disabled_gate_admits_everything():
+    """Test that max_concurrency 0 turns admission control off"""
+    gate = AdmissionGate(max_concurrency=0, max_queue=0, queue_timeout_sec=0.0)
+    await asyncio.gather(*(gate.acquire() for _ in range(100)))
+    assert gate.stats()["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_client_rejects_beyond_capacity():
+    """Test that excess computations of one type get Overloaded while other types are unaffected"""
+    client = make_client(admission_concurrency_risk_score=2, admission_queue_risk_score=2)
+
+    results = await asyncio.gather(*(risk_score(client) for _ in range(6)), return_exceptions=True)
+    rejected = [r for r in results if isinstance(r, Overloaded)]
+    assert len(rejected) == 2
+    assert all(r.retry_after >= 1 for r in rejected)
+
+    stats = client.stats()["admission"]
+    assert stats["risk-score"]["admitted"] == 4
+    assert stats["risk-score"]["rejected"] == 2
+    assert stats["curve-eval"]["admitted"] == 0
+
+
+def test_api_returns_queue_headers_and_overloaded_body(monkeypatch):
+    """Test the queue headers on success and the spec error body with Retry-After on rejection"""
+    from src.api import routes
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/arcium/risk-score", json=RISK_ITEM)
+        assert response.status_code == 200
+        assert response.headers["x-evalys-queue-depth"] == "0"
+        assert "x-evalys-queue-wait-ms" in response.headers
+
+        gate = routes.bridge_client.admission.gate("risk-score")
+        monkeypatch.setattr(gate, "max_concurrency", 1)
+        monkeypatch.setattr(gate, "max_queue", 0)
+        monkeypatch.setattr(gate, "active", 1)
+        # A cached result would be served without admission; ask for a new one
+        uncached = {**RISK_ITEM, "market_conditions": {**RISK_ITEM["market_conditions"], "curve_volatility": 999}}
+        response = client.post("/api/v1/arcium/risk-score", json=uncached)
+
+    assert response.status_code == 503
+    assert response.json()["error"] == "overloaded"
+    assert response.json()["retry_after"] >= 1
+    assert response.headers["retry-after"] == str(response.json()["retry_after"])
+
+
+def test_api_traffic_class_header():
+    """Test that single requests default to interactive, batches to bulk, and the header overrides both"""
+    from src.api import routes
+
+    classes = routes.bridge_client.admission.gate("curve-eval").stats()["classes"]
+    before = {name: classes[name]["admitted"] for name in classes}
+    item = {**CURVE_ITEM, "user_constraints": {**CURVE_ITEM["user_constraints"], "priority_level": 1}}
+    with TestClient(app) as client:
+        assert client.post("/api/v1/arcium/curve-eval", json=item).status_code == 200
+        # Distinct inputs, so none is served from the result cache without admission
+        priced = lambda price: {**item, "curve_metrics": {**item["curve_metrics"], "current_price": price}}
+        assert client.post("/api/v1/arcium/curve-eval:batch", json={"items": [priced(5)]}).status_code == 200
+        response = client.post("/api/v1/arcium/curve-eval", json=priced(7), headers={"X-Evalys-Traffic-Class": "bulk"})
+        assert response.status_code == 200
+        assert client.post("/api/v1/arcium/curve-eval", json=item, headers={"X-Evalys-Traffic-Class": "urgent"}).status_code == 422
+
+    classes = routes.bridge_client.admission.gate("curve-eval").stats()["classes"]
+    assert classes[INTERACTIVE]["admitted"] - before[INTERACTIVE] == 1
+    assert classes[BULK]["admitted"] - before[BULK] == 2
@@ -0,0 +1,97 @@
+"""
+Tests for batch computation endpoints
+
+Tests that batch requests return one result per input, in order, with
+failures reported per item.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.api.server import app
+from src.api.routes import bridge_client
+from src.bridge.errors import CircuitOpen
+from src.bridge.models import PlanRequest, StrategyPlan
+from tests.payloads import PLAN_ITEM, RISK_ITEM, CURVE_ITEM
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_batch_matches_single_requests(client):
+    """Test that each batch result equals the corresponding single-request result"""
+    for path, item in [
+        ("/api/v1/arcium/plan", PLAN_ITEM),
+        ("/api/v1/arcium/risk-score", RISK_ITEM),
+        ("/api/v1/arcium/curve-eval", CURVE_ITEM),
+    ]:
+        single = client.post(path, json=item)
+        assert single.status_code == 200
+
+        batch = client.post(f"{path}:batch", json={"items": [item, item]})
+        assert batch.status_code == 200
+        results = batch.json()["results"]
+        assert [r["index"] for r in results] == [0, 1]
+        for r in results:
+            assert r["error"] is None
+            assert r["result"] == single.json()
+
+
+def test_batch_preserves_order(client):
+    """Test that results come back in request order"""
+    small = {**PLAN_ITEM, "user_preferences": {**PLAN_ITEM["user_preferences"], "desired_size": 900}}
+    large = {**PLAN_ITEM, "user_preferences": {**PLAN_ITEM["user_preferences"], "desired_size": 20_000_000_000}}
+
+    response = client.post("/api/v1/arcium/plan:batch", json={"items": [large, small, large]})
+    assert response.status_code == 200
+    slices = [r["result"]["num_slices"] for r in response.json()["results"]]
+    assert slices == [8, 3, 8]
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_errors_per_item(monkeypatch):
+    """Test that one failing item does not fail the whole batch"""
+    original = bridge_client._simulate_plan
+
+    def failing_for_zero(prefs, hist, curve):
+        if prefs.desired_size == 0:
+            raise ValueError("computation failed")
+        return original(prefs, hist, curve)
+
+    monkeypatch.setattr(bridge_client, "_simulate_plan", failing_for_zero)
+
+    good = PlanRequest(**PLAN_ITEM)
+    bad = PlanRequest(**{**PLAN_ITEM, "user_preferences": {**PLAN_ITEM["user_preferences"], "desired_size": 0}})
+    results = await bridge_client.get_confidential_plan_batch([good, bad, good])
+
+    assert isinstance(results[0], StrategyPlan)
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], StrategyPlan)
+
+
+def test_batch_too_large_rejected(client, monkeypatch):
+    """Test that batches over the configured limit are rejected"""
+    monkeypatch.setattr(bridge_client.settings, "batch_max_items", 2)
+    response = client.post("/api/v1/arcium/risk-score:batch", json={"items": [RISK_ITEM] * 3})
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Batch too large: 3 items (max 2)"
+
+    # The limit is checked before items are validated, so invalid items are never looked at
+    response = client.post("/api/v1/arcium/risk-score:batch", json={"items": [{}] * 3})
+    assert response.status_code == 413
+    assert client.post("/api/v1/arcium/risk-score:batch", json={"items": [{}]}).status_code == 422
+
+
+def test_batch_wide_failure_is_one_error_response(client, monkeypatch):
+    """Test that a failure of the whole submission is one 503 with Retry-After, not per-item errors"""
+    async def circuit_open(computation_type, requests):
+        raise CircuitOpen(retry_after=7)
+
+    monkeypatch.setattr(bridge_client, "_run_batch", circuit_open)
+    items = [{**RISK_ITEM, "market_conditions": {**RISK_ITEM["market_conditions"], "curve_volatility": 4000 + i}} for i in range(3)]
+    response = client.post("/api/v1/arcium/risk-score:batch", json={"items": items})
+
+    assert response.status_code == 503
+    assert response.json()["error"] == "network_error"
+    assert response.headers["retry-after"] == "7"
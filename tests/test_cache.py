@@ -0,0 +1,134 @@
+"""
+Tests for the result cache
+
+Tests TTL expiry, LRU eviction under the memory bound, and that cached
+results never sit in memory as plaintext.
+"""
+
+import pytest
+from src.bridge.cache import ResultCache
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.models import RiskScoreRequest, RiskAssessment
+from src.config.settings import Settings
+from tests.payloads import RISK_ITEM
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(total_capital: int = 10_000_000_000) -> RiskScoreRequest:
+    request = RiskScoreRequest(**RISK_ITEM)
+    request.portfolio_context.total_capital = total_capital
+    return request
+
+
+def _result(score: int = 120) -> RiskAssessment:
+    return RiskAssessment(overall_risk_score=score, portfolio_risk=110, trade_risk=130, recommendation="proceed")
+
+
+def test_hit_after_put_and_miss_before():
+    """Test basic hit/miss accounting"""
+    cache = ResultCache({"risk-score": 10}, max_bytes=1 << 20)
+    key = cache.key("risk-score", _request())
+
+    assert cache.get("risk-score", key, RiskAssessment) is None
+    cache.put("risk-score", key, _result())
+    assert cache.get("risk-score", key, RiskAssessment) == _result()
+
+    counters = cache.stats()["counters"]["risk-score"]
+    assert counters["hits"] == 1
+    assert counters["misses"] == 1
+
+
+def test_key_is_canonical_and_type_scoped():
+    """Test that equal inputs share a key and different types or inputs do not"""
+    cache = ResultCache({"risk-score": 10}, max_bytes=1 << 20)
+
+    assert cache.key("risk-score", _request()) == cache.key("risk-score", _request())
+    assert cache.key("risk-score", _request()) != cache.key("risk-score", _request(1))
+    assert cache.key("risk-score", _request()) != cache.key("curve-eval", _request())
+
+
+def test_ttl_expiry():
+    """Test that entries expire after their computation type's TTL"""
+    clock = FakeClock()
+    cache = ResultCache({"risk-score": 5}, max_bytes=1 << 20, clock=clock)
+    key = cache.key("risk-score", _request())
+    cache.put("risk-score", key, _result())
+
+    clock.now = 4.9
+    assert cache.get("risk-score", key, RiskAssessment) is not None
+    clock.now = 5.0
+    assert cache.get("risk-score", key, RiskAssessment) is None
+    assert cache.stats()["counters"]["risk-score"]["expirations"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_zero_ttl_disables_caching():
+    """Test that a computation type with TTL 0 is never cached"""
+    cache = ResultCache({"plan": 0}, max_bytes=1 << 20)
+    key = cache.key("plan", _request())
+    cache.put("plan", key, _result())
+
+    assert not cache.enabled_for("plan")
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_under_memory_bound():
+    """Test that the least recently used entry is evicted when over max_bytes"""
+    probe = ResultCache({"risk-score": 10}, max_bytes=1 << 20)
+    probe.put("risk-score", b"k", _result())
+    entry_bytes = probe.stats()["bytes"]
+
+    cache = ResultCache({"risk-score": 10}, max_bytes=entry_bytes * 2)
+    keys = [cache.key("risk-score", _request(i)) for i in range(3)]
+    cache.put("risk-score", keys[0], _result(0))
+    cache.put("risk-score", keys[1], _result(1))
+    cache.get("risk-score", keys[0], RiskAssessment)  # keys[1] is now least recently used
+    cache.put("risk-score", keys[2], _result(2))
+
+    assert cache.get("risk-score", keys[1], RiskAssessment) is None
+    assert cache.get("risk-score", keys[0], RiskAssessment) == _result(0)
+    assert cache.get("risk-score", keys[2], RiskAssessment) == _result(2)
+    assert cache.stats()["counters"]["risk-score"]["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_values_encrypted_at_rest():
+    """Test that cached results are not stored as plaintext"""
+    cache = ResultCache({"risk-score": 10}, max_bytes=1 << 20)
+    key = cache.key("risk-score", _request())
+    cache.put("risk-score", key, _result(231))
+
+    _, blob, _ = cache._entries[key]
+    assert b"overall_risk_score" not in blob
+    assert b"231" not in blob
+
+
+@pytest.mark.asyncio
+async def test_client_serves_repeats_from_cache(monkeypatch):
+    """Test that a repeated request does not run the computation again"""
+    client = ArciumBridgeClient(Settings(cache_ttl_risk_score_sec=60))
+    calls = []
+    original = client._run_batch
+
+    async def counting_run_batch(computation_type, requests):
+        calls.append(len(requests))
+        return await original(computation_type, requests)
+
+    monkeypatch.setattr(client, "_run_batch", counting_run_batch)
+    request = _request()
+    args = (request.portfolio_context, request.performance_history, request.market_conditions)
+
+    first = await client.get_risk_score(*args)
+    second = await client.get_risk_score(*args)
+    batch = await client.get_risk_score_batch([request, _request(1)])
+
+    assert first == second == batch[0]
+    assert calls == [1, 1]  # Only the new batch item was computed
+    assert client.stats()["cache"]["counters"]["risk-score"]["hits"] == 2
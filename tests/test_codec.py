@@ -0,0 +1,84 @@
+"""
+Tests for the fixed-width binary codec for confidential inputs
+"""
+
+import json
+import random
+import pytest
+from src.bridge import codec
+from src.bridge.errors import InvalidInput
+from src.bridge.models import CurveEvalRequest, PlanRequest, RiskScoreRequest
+from tests.payloads import CURVE_ITEM, PLAN_ITEM, RISK_ITEM
+
+ITEMS = [(PlanRequest, PLAN_ITEM), (RiskScoreRequest, RISK_ITEM), (CurveEvalRequest, CURVE_ITEM)]
+
+
+def width_range(width: str):
+    bits = int(width[1:])
+    if width[0] == "i":
+        return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+    return 0, (1 << bits) - 1
+
+
+def random_request(model_cls, rng: random.Random):
+    """Request with every field drawn from its declared width, boundaries included"""
+    groups = {}
+    for group, sub_cls in codec.LAYOUTS[model_cls].groups:
+        fields = {}
+        for name, width in codec.FIELDS[sub_cls]:
+            low, high = width_range(width)
+            fields[name] = rng.choice([low, high, 0, rng.randint(low, high)])
+        groups[group] = sub_cls(**fields)
+    return model_cls(**groups)
+
+
+@pytest.mark.parametrize("model_cls", [PlanRequest, RiskScoreRequest, CurveEvalRequest])
+def test_round_trip_property(model_cls):
+    """Test that decode(encode(x)) == x for random values across each field's full width"""
+    rng = random.Random(19)
+    for _ in range(500):
+        request = random_request(model_cls, rng)
+        data = codec.encode(request)
+
+        assert len(data) == codec.encoded_size(model_cls)
+        assert codec.decode(data, model_cls) == request
+
+
+@pytest.mark.parametrize("model_cls,item", ITEMS)
+def test_smaller_than_json(model_cls, item):
+    """Test that the binary encoding is a fraction of the JSON size"""
+    request = model_cls(**item)
+
+    assert len(codec.encode(request)) * 4 < len(json.dumps(item, separators=(",", ":")))
+
+
+def test_out_of_range_rejected_without_value():
+    """Test that values outside a field's width raise InvalidInput naming the field but not the value"""
+    item = json.loads(json.dumps(RISK_ITEM))
+    item["market_conditions"]["market_sentiment"] = 987654
+
+    with pytest.raises(InvalidInput) as exc:
+        codec.encode(RiskScoreRequest(**item))
+
+    assert "market_conditions.market_sentiment" in exc.value.message
+    assert "987654" not in exc.value.message
+
+    item = json.loads(json.dumps(PLAN_ITEM))
+    item["user_preferences"]["desired_size"] = -1
+    with pytest.raises(InvalidInput):
+        codec.encode(PlanRequest(**item))
+
+
+def test_malformed_data_rejected():
+    """Test that unknown versions, mismatched tags and bad lengths are rejected"""
+    data = codec.encode(PlanRequest(**PLAN_ITEM))
+
+    with pytest.raises(ValueError, match="version"):
+        codec.decode(bytes([codec.CODEC_VERSION + 1]) + data[1:], PlanRequest)
+    with pytest.raises(ValueError, match="tag"):
+        codec.decode(data, RiskScoreRequest)
+    with pytest.raises(ValueError, match="length"):
+        codec.decode(data[:-1], PlanRequest)
+    with pytest.raises(ValueError):
+        codec.decode(b"", PlanRequest)
+
@@ -0,0 +1,98 @@
+"""
+Tests for client-side input encryption
+"""
+
+import base64
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from src.bridge.encryption import (
+    InputEncryptor,
+    SharedSecretCache,
+    associated_data,
+    load_private_key,
+    public_key_bytes,
+)
+
+CLUSTER_KEY = X25519PrivateKey.generate()
+CLUSTER_PUBLIC = public_key_bytes(CLUSTER_KEY)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def cluster_decrypt(sealed, aad: bytes) -> bytes:
+    """Decrypt as the MXE cluster would, from the client's public key"""
+    cipher = SharedSecretCache(CLUSTER_KEY).get(sealed.public_key)
+    return cipher.decrypt(sealed.nonce, sealed.ciphertext, aad)
+
+
+def test_cluster_decrypts_input():
+    """Test that the cluster derives the same key from the client's public key"""
+    encryptor = InputEncryptor()
+    aad = associated_data("input", "plan")
+
+    sealed = encryptor.encrypt(CLUSTER_PUBLIC, b"secret inputs", aad)
+
+    assert sealed.ciphertext != b"secret inputs"
+    assert cluster_decrypt(sealed, aad) == b"secret inputs"
+    with pytest.raises(InvalidTag):
+        cluster_decrypt(sealed, associated_data("input", "risk-score"))
+
+
+def test_configured_key_is_used():
+    """Test that ARCIUM_CLIENT_ENCRYPTION_KEY sets the client key"""
+    raw = bytes(range(32))
+    encryptor = InputEncryptor(base64.b64encode(raw).decode())
+
+    assert encryptor.secrets.public_key == public_key_bytes(X25519PrivateKey.from_private_bytes(raw))
+    with pytest.raises(ValueError):
+        load_private_key(base64.b64encode(b"short").decode())
+
+
+def test_shared_secret_cached_until_expiry():
+    """Test that the shared secret is derived once per cluster key and TTL"""
+    clock = FakeClock()
+    encryptor = InputEncryptor(secret_ttl_sec=60, clock=clock)
+
+    for _ in range(3):
+        encryptor.encrypt(CLUSTER_PUBLIC, b"x")
+    assert encryptor.stats()["secrets"] == {"derived": 1, "hits": 2, "cached": 1}
+
+    clock.now = 61
+    encryptor.encrypt(CLUSTER_PUBLIC, b"x")
+    assert encryptor.stats()["secrets"]["derived"] == 2
+
+
+@pytest.mark.asyncio
+async def test_encrypt_batch_preserves_order_with_unique_nonces():
+    """Test batch encryption across worker chunks"""
+    encryptor = InputEncryptor(chunk_size=7)
+    plaintexts = [f"payload-{i}".encode() for i in range(50)]
+    aad = associated_data("input", "curve-eval")
+
+    sealed = await encryptor.encrypt_batch(CLUSTER_PUBLIC, plaintexts, aad)
+
+    assert [cluster_decrypt(s, aad) for s in sealed] == plaintexts
+    assert len({s.nonce for s in sealed}) == 50
+    assert encryptor.stats()["encrypted"] == 50
+    assert encryptor.stats()["secrets"]["derived"] == 1
+
+
+@pytest.mark.asyncio
+async def test_result_decrypts_with_sealed_cipher():
+    """Test that a result encrypted by the cluster opens with the input's cipher"""
+    encryptor = InputEncryptor()
+    (sealed,) = await encryptor.encrypt_batch(CLUSTER_PUBLIC, [b"inputs"])
+    cluster_cipher = SharedSecretCache(CLUSTER_KEY).get(sealed.public_key)
+    nonce = b"\x01" * 12
+    aad = associated_data("output", "plan")
+
+    result = cluster_cipher.encrypt(nonce, b"result", aad)
+
+    assert sealed.cipher.decrypt(nonce, result, aad) == b"result"
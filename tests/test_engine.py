@@ -0,0 +1,180 @@
+"""
+Tests for the vectorized simulation engine
+
+Property tests that the NumPy engine produces exactly the same integer
+results as the scalar simulated path, including at every threshold.
+"""
+
+import random
+import pytest
+from src.bridge import engine
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.models import PlanRequest, RiskScoreRequest, CurveEvalRequest
+
+
+SEEDS = range(5)
+ROWS = 2000
+INT64_MIN = -2**63
+INT64_MAX = 2**63 - 1
+
+
+def _value(rng: random.Random, thresholds, low: int, high: int) -> int:
+    """Pick a value near a formula threshold or uniformly within [low, high]"""
+    if rng.random() < 0.5:
+        return rng.choice(thresholds) + rng.choice((-1, 0, 1))
+    return rng.randint(low, high)
+
+
+def _plan_request(rng: random.Random) -> PlanRequest:
+    return PlanRequest(
+        user_preferences={
+            "desired_size": _value(rng, [1_000_000_000, 10_000_000_000], 0, 10**14),
+            "slippage_tolerance": rng.randint(0, 10000),
+            "risk_appetite": _value(rng, [20, 200], 0, 255),
+            "preferred_hold_time": rng.randint(0, 86400),
+        },
+        user_history={
+            "recent_pnl": _value(rng, [0], -10**12, 10**12),
+            "win_rate": _value(rng, [5000, 6000], 0, 10000),
+            "avg_hold_time": rng.randint(0, 86400),
+            "total_trades": rng.randint(0, 10000),
+        },
+        curve_state={
+            "current_price": rng.randint(0, 10**12),
+            "liquidity_depth": rng.randint(0, 10**14),
+            "volatility": _value(rng, [200, 500], -100, 5000),
+            "recent_volume": rng.randint(0, 10**14),
+        },
+    )
+
+
+def _risk_request(rng: random.Random) -> RiskScoreRequest:
+    return RiskScoreRequest(
+        portfolio_context={
+            "total_capital": _value(rng, [0], -10**12, 10**14),
+            "current_exposure": rng.randint(-10**12, 10**14),
+            "diversification_score": rng.randint(0, 255),
+            "leverage_ratio": rng.randint(0, 100000),
+        },
+        performance_history={
+            "total_pnl": _value(rng, [0], -10**12, 10**12),
+            "sharpe_ratio": _value(rng, [100], -500, 500),
+            "max_drawdown": rng.randint(0, 10000),
+            "consistency_score": rng.randint(0, 255),
+        },
+        market_conditions={
+            "curve_volatility": _value(rng, [300, 500], 0, 5000),
+            "liquidity_risk": rng.randint(0, 255),
+            "market_sentiment": rng.randint(-128, 127),
+        },
+    )
+
+
+def _curve_request(rng: random.Random) -> CurveEvalRequest:
+    max_size = rng.randint(0, 10**13)
+    return CurveEvalRequest(
+        sizing_preferences={
+            "target_size": rng.randint(0, 10**13),
+            "min_size": rng.randint(0, max_size),
+            "max_size": max_size,
+            "capital_allocation_pct": rng.randint(0, 100),
+        },
+        user_constraints={
+            "max_slippage_bps": rng.randint(0, 10000),
+            "time_constraint_sec": _value(rng, [60, 300], 0, 3600),
+            "priority_level": rng.randint(0, 255),
+        },
+        curve_metrics={
+            "current_price": rng.randint(0, 10**12),
+            "price_change_24h": _value(rng, [-1000, 1000], -10**5, 10**5),
+            "liquidity_depth": _value(rng, [max_size * 2], 0, 4 * max_size + 1),
+            "buy_pressure": rng.randint(0, 1000),
+            "sell_pressure": rng.randint(0, 1000),
+        },
+    )
+
+
+@pytest.fixture
+def client():
+    return ArciumBridgeClient()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_plan_engine_matches_scalar(client, seed):
+    """Test that vectorized strategy plans equal the scalar results"""
+    rng = random.Random(seed)
+    requests = [_plan_request(rng) for _ in range(ROWS)]
+
+    vectorized = engine.plan_models(engine.compute_plans(engine.plan_inputs(requests)))
+    scalar = [client._simulate_plan(r.user_preferences, r.user_history, r.curve_state) for r in requests]
+
+    assert vectorized == scalar
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_risk_engine_matches_scalar(client, seed):
+    """Test that vectorized risk assessments equal the scalar results"""
+    rng = random.Random(seed)
+    requests = [_risk_request(rng) for _ in range(ROWS)]
+
+    vectorized = engine.risk_models(engine.compute_risk_scores(engine.risk_inputs(requests)))
+    scalar = [
+        client._simulate_risk_score(r.portfolio_context, r.performance_history, r.market_conditions)
+        for r in requests
+    ]
+
+    assert vectorized == scalar
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_curve_engine_matches_scalar(client, seed):
+    """Test that vectorized curve evaluations equal the scalar results"""
+    rng = random.Random(seed)
+    requests = [_curve_request(rng) for _ in range(ROWS)]
+
+    vectorized = engine.curve_models(engine.compute_curve_evaluations(engine.curve_inputs(requests)))
+    scalar = [
+        client._simulate_curve_evaluation(r.sizing_preferences, r.user_constraints, r.curve_metrics)
+        for r in requests
+    ]
+
+    assert vectorized == scalar
+
+
+def test_out_of_range_inputs_detected():
+    """Test that inputs that could overflow int64 intermediates are flagged"""
+    rng = random.Random(0)
+    request = _risk_request(rng)
+    request.portfolio_context.current_exposure = engine.MAX_SAFE_INPUT
+
+    assert not engine.within_safe_range(engine.risk_inputs([request]))
+
+
+@pytest.mark.parametrize("extreme", [INT64_MIN, INT64_MAX])
+def test_int64_extremes_fall_back_to_scalar(client, extreme):
+    """Test that batches holding INT64_MIN or INT64_MAX still match the scalar results"""
+    rng = random.Random(1)
+    requests = [_curve_request(rng) for _ in range(client.settings.engine_min_batch_items)]
+    requests[0].curve_metrics.current_price = extreme
+
+    assert not engine.within_safe_range(engine.curve_inputs(requests))
+    compute_one = lambda r: client._simulate_curve_evaluation(r.sizing_preferences, r.user_constraints, r.curve_metrics)
+    results = client._simulate_batch("curve-eval", requests, compute_one)
+    scalar = [compute_one(r) for r in requests]
+    assert results == scalar
+
+
+@pytest.mark.asyncio
+async def test_large_batch_uses_engine_results(client):
+    """Test that batch methods return scalar-identical results through the engine"""
+    rng = random.Random(42)
+    requests = [_plan_request(rng) for _ in range(client.settings.engine_min_batch_items * 2)]
+    requests[3].user_preferences.desired_size = 2**62  # Forces the scalar fallback for the batch
+
+    results = await client.get_confidential_plan_batch(requests)
+    scalar = [client._simulate_plan(r.user_preferences, r.user_history, r.curve_state) for r in requests]
+    assert results == scalar
+
+    del requests[3]
+    results = await client.get_confidential_plan_batch(requests)
+    assert results == scalar[:3] + scalar[4:]
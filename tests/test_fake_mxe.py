@@ -0,0 +1,193 @@
+"""
+Tests for the in-process MXE stand-in (ARCIUM_BACKEND=fake)
+"""
+
+import asyncio
+import json
+import random
+import time
+import pytest
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.errors import CircuitOpen, ComputationTimeout, DecryptionFailed, InvalidInput, InvalidReceipt, NetworkError
+from src.bridge.fake_mxe import FakeMxe, Latency
+from src.bridge.models import PlanRequest, RiskScoreRequest
+from src.bridge.policy import OPEN
+from src.config.settings import Settings
+from src.utils.metrics import OK, STAGE_SECONDS
+from tests.payloads import PLAN_ITEM, RISK_ITEM
+
+
+def make_client(**overrides) -> ArciumBridgeClient:
+    settings = dict(
+        arcium_backend="fake",
+        cache_enabled=False,
+        fake_mxe_submit_latency_ms=0,
+        fake_mxe_compute_latency_ms=1,
+        fake_mxe_latency_sigma=0,
+        fake_mxe_seed=7,
+        retry_initial_backoff_sec=0.001,
+        retry_max_backoff_sec=0.001,
+    )
+    settings.update(overrides)
+    return ArciumBridgeClient(Settings(**settings))
+
+
+async def risk_score(client: ArciumBridgeClient):
+    request = RiskScoreRequest(**RISK_ITEM)
+    return await client.get_risk_score(request.portfolio_context, request.performance_history, request.market_conditions)
+
+
+def test_latency_distribution():
+    """Test constant and log-normal latency sampling"""
+    rng = random.Random(1)
+    assert Latency(20).sample(rng) == 0.02
+    assert Latency(0, sigma=1.0).sample(rng) == 0.0
+
+    samples = sorted(Latency(20, sigma=0.5).sample(rng) for _ in range(2001))
+    assert 0.018 < samples[1000] < 0.022
+    assert samples[-1] > 0.04
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_matches_simulation():
+    """Test that the fake MXE returns the same results as the inline simulation"""
+    fake = await risk_score(make_client())
+    simulated = await risk_score(ArciumBridgeClient(Settings(cache_enabled=False)))
+
+    assert fake == simulated
+
+
+@pytest.mark.asyncio
+async def test_fake_backend_records_all_stages():
+    """Test that the fake flow times encryption, submission, completion, verification and decryption"""
+    client = make_client()
+    STAGE_SECONDS.clear()
+
+    await risk_score(client)
+
+    for stage in ("encryption", "submission", "await_completion", "receipt_verification", "decryption"):
+        assert STAGE_SECONDS.count(("risk-score", stage, OK)) == 1
+    assert client.stats()["receipts"]["accepted"] == 1
+    assert client.stats()["fake_mxe"]["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_plans_carry_per_computation_plan_id():
+    """Test that each MXE plan is named after the computation that produced it"""
+    client = make_client()
+    request = PlanRequest(**PLAN_ITEM)
+
+    first, second = [
+        await client.get_confidential_plan(request.user_preferences, request.user_history, request.curve_state)
+        for _ in range(2)
+    ]
+    batch = await client.get_confidential_plan_batch([request, request])
+
+    plan_ids = [first.plan_id, second.plan_id] + [plan.plan_id for plan in batch]
+    assert len(set(plan_ids)) == 4
+    assert all(plan_id.startswith("mxe-fake-") for plan_id in plan_ids)
+    assert batch[1].plan_id.endswith("-1")
+
+
+@pytest.mark.asyncio
+async def test_network_errors_are_retried():
+    """Test that injected connection errors go through the retry policy"""
+    # Keep the cluster breaker closed so every failure is retried
+    client = make_client(fake_mxe_network_error_rate=0.5, retry_max_retries=10, breaker_failure_threshold=100)
+
+    results = [await risk_score(client) for _ in range(10)]
+
+    assert len(results) == 10
+    assert client.stats()["fake_mxe"]["network_errors"] > 0
+    assert client.policy.stats()["retries"] == {"mxe:risk-score": client.stats()["fake_mxe"]["network_errors"]}
+
+
+@pytest.mark.asyncio
+async def test_consecutive_network_errors_open_mxe_breaker(monkeypatch):
+    """Test that repeated MXE network failures open the cluster breaker and later calls skip submission"""
+    client = make_client(fake_mxe_network_error_rate=1.0, breaker_failure_threshold=3, retry_max_retries=2)
+    submit = client.mxe.submit
+    submissions = []
+
+    async def counting_submit(*args):
+        submissions.append(args[0])
+        return await submit(*args)
+
+    monkeypatch.setattr(client.mxe, "submit", counting_submit)
+
+    with pytest.raises(NetworkError):
+        await risk_score(client)
+    assert len(submissions) == 3
+
+    with pytest.raises(CircuitOpen) as exc_info:
+        await risk_score(client)
+    assert len(submissions) == 3
+    assert exc_info.value.code == "network_error"
+    assert exc_info.value.retry_after >= 1
+    breaker = client.policy.stats()["breakers"][f"mxe:{client.settings.arcium_cluster_offset}"]
+    assert breaker["state"] == OPEN
+
+
+@pytest.mark.asyncio
+async def test_injected_timeout():
+    """Test that a computation that never completes raises ComputationTimeout"""
+    client = make_client(fake_mxe_timeout_rate=1.0, mxe_computation_timeout_sec=0.02, retry_max_retries=0)
+
+    with pytest.raises(ComputationTimeout):
+        await risk_score(client)
+
+
+@pytest.mark.asyncio
+async def test_injected_invalid_receipt():
+    """Test that a receipt with a bad signature is rejected and never decrypted"""
+    client = make_client(fake_mxe_invalid_receipt_rate=1.0)
+    STAGE_SECONDS.clear()
+
+    with pytest.raises(InvalidReceipt):
+        await risk_score(client)
+
+    assert client.stats()["receipts"]["rejected"] == {"bad_signature": 1}
+    assert STAGE_SECONDS.count(("risk-score", "decryption", OK)) == 0
+
+
+@pytest.mark.asyncio
+async def test_injected_decryption_failure():
+    """Test that an undecodable output raises DecryptionFailed"""
+    client = make_client(fake_mxe_decryption_failure_rate=1.0)
+
+    with pytest.raises(DecryptionFailed):
+        await risk_score(client)
+
+
+@pytest.mark.asyncio
+async def test_capacity_queues_computations():
+    """Test that computations beyond capacity wait for a free slot"""
+    mxe = FakeMxe(lambda kind, requests: [], compute_latency=Latency(50), capacity=2)
+    ids = [await mxe.submit("plan", []) for _ in range(4)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(mxe.await_completion(i, timeout=5) for i in ids))
+
+    assert time.perf_counter() - start >= 0.095
+
+
+@pytest.mark.asyncio
+async def test_out_of_range_item_fails_alone():
+    """Test that an unencodable batch item fails without blocking the rest of the batch"""
+    client = make_client()
+    bad = json.loads(json.dumps(RISK_ITEM))
+    bad["market_conditions"]["liquidity_risk"] = 300
+    requests = [RiskScoreRequest(**RISK_ITEM), RiskScoreRequest(**bad), RiskScoreRequest(**RISK_ITEM)]
+
+    results = await client._execute_batch("risk-score", requests)
+
+    assert isinstance(results[1], InvalidInput)
+    assert results[0] == results[2]
+    assert not isinstance(results[0], Exception)
+    assert client.mxe.stats()["submitted"] == 1
+
+
+def test_unknown_backend_rejected():
+    """Test that a misconfigured backend fails at startup"""
+    with pytest.raises(ValueError):
+        ArciumBridgeClient(Settings(arcium_backend="devnet"))
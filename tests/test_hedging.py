@@ -0,0 +1,163 @@
+"""
+Tests for hedged requests
+
+Uses fake endpoints with configurable latency to check that slow calls are
+hedged to a second endpoint, that the hedge budget is respected, and that
+only one copy of a call ever completes.
+"""
+
+import asyncio
+import pytest
+from src.bridge.hedging import HedgePolicy
+from src.bridge.routing import EndpointRouter
+from src.bridge.rpc_pool import RpcPool
+from src.config.settings import Settings
+
+
+class FakeEndpoint:
+    """Fake endpoint whose latency can be changed between calls"""
+
+    def __init__(self, url: str, latency: float, failing: bool = False):
+        self.url = url
+        self.latency = latency
+        self.failing = failing
+        self.calls = 0
+        self.completed = 0
+
+    async def handle(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.failing:
+            raise ConnectionError(f"{self.url} unreachable")
+        self.completed += 1
+        return self.url
+
+
+class FakeCluster:
+    def __init__(self, *endpoints: FakeEndpoint):
+        self.endpoints = {e.url: e for e in endpoints}
+
+    async def __call__(self, url: str):
+        return await self.endpoints[url].handle()
+
+
+def _warm(router: EndpointRouter, url: str, latency: float, count: int = 20):
+    """Seed an endpoint's latency window"""
+    endpoint = next(e for e in router.endpoints if e.url == url)
+    for _ in range(count):
+        router.record(endpoint, latency, ok=True)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_hedge_wins():
+    """Test that a call stuck past the learned percentile is answered by the hedge"""
+    cluster = FakeCluster(FakeEndpoint("primary", 0.5), FakeEndpoint("backup", 0.005))
+    router = EndpointRouter(list(cluster.endpoints))
+    _warm(router, "primary", 0.001)
+    _warm(router, "backup", 0.002)
+    hedging = HedgePolicy(max_fraction=1.0)
+
+    result = await asyncio.wait_for(hedging.call(router, cluster), timeout=0.3)
+
+    assert result == "backup"
+    assert hedging.stats() == {"calls": 1, "sent": 1, "won": 1, "over_budget": 0}
+    await asyncio.sleep(0)
+    # The slow primary was cancelled, so only one copy completed
+    assert cluster.endpoints["primary"].completed == 0
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """Test that calls answering within the percentile send no hedge"""
+    cluster = FakeCluster(FakeEndpoint("primary", 0.0), FakeEndpoint("backup", 0.0))
+    router = EndpointRouter(list(cluster.endpoints))
+    _warm(router, "primary", 0.05)
+    _warm(router, "backup", 0.1)
+    hedging = HedgePolicy(max_fraction=1.0)
+
+    for _ in range(10):
+        assert await hedging.call(router, cluster) == "primary"
+
+    assert cluster.endpoints["backup"].calls == 0
+    assert hedging.stats()["sent"] == 0
+
+
+@pytest.mark.asyncio
+async def test_no_hedging_until_latency_is_learned():
+    """Test that endpoints without enough samples are never hedged"""
+    cluster = FakeCluster(FakeEndpoint("primary", 0.02), FakeEndpoint("backup", 0.0))
+    router = EndpointRouter(list(cluster.endpoints))
+    hedging = HedgePolicy(max_fraction=1.0, min_samples=20)
+
+    assert await hedging.call(router, cluster) in ("primary", "backup")
+    assert hedging.stats()["sent"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_caps_fraction_of_traffic():
+    """Test that hedges stay within max_fraction even when every call is slow"""
+    cluster = FakeCluster(FakeEndpoint("primary", 0.01), FakeEndpoint("backup", 0.01))
+    router = EndpointRouter(list(cluster.endpoints), window_size=1000)
+    _warm(router, "primary", 0.0001, count=200)
+    _warm(router, "backup", 0.0001, count=200)
+    hedging = HedgePolicy(max_fraction=0.1, min_samples=20)
+
+    for _ in range(40):
+        await hedging.call(router, cluster)
+
+    stats = hedging.stats()
+    assert stats["calls"] == 40
+    assert 0 < stats["sent"] <= 4
+    assert stats["over_budget"] > 0
+
+
+@pytest.mark.asyncio
+async def test_both_failing_falls_back_to_failover():
+    """Test that failed primary and hedge fail over to a third endpoint"""
+    cluster = FakeCluster(
+        FakeEndpoint("a", 0.05, failing=True),
+        FakeEndpoint("b", 0.0, failing=True),
+        FakeEndpoint("c", 0.0),
+    )
+    router = EndpointRouter(list(cluster.endpoints))
+    for url in ("a", "b", "c"):
+        _warm(router, url, 0.001 if url != "c" else 0.01)
+    hedging = HedgePolicy(max_fraction=1.0)
+
+    assert await hedging.call(router, cluster) == "c"
+
+
+@pytest.mark.asyncio
+async def test_request_errors_are_not_hedged_away():
+    """Test that an error about the request itself is raised, not retried elsewhere"""
+    router = EndpointRouter(["a", "b"])
+
+    async def bad_request(url):
+        raise ValueError("invalid params")
+
+    with pytest.raises(ValueError):
+        await HedgePolicy().call(router, bad_request, lambda e: not isinstance(e, ValueError))
+
+
+@pytest.mark.asyncio
+async def test_rpc_pool_hedges_only_when_requested():
+    """Test that the pool hedges opt-in calls and reports hedge counters"""
+    settings = Settings(
+        solana_rpc_urls="https://a,https://b",
+        hedging_enabled=True,
+        hedging_max_fraction=1.0,
+    )
+    pool = RpcPool(settings)
+    router = pool.routers["solana"]
+    _warm(router, "https://a", 0.001)
+    _warm(router, "https://b", 0.001)
+    latency = {pool.client("https://a"): 0.2, pool.client("https://b"): 0.0}
+
+    async def call(client):
+        await asyncio.sleep(latency[client])
+        return client
+
+    assert await pool.call("solana", call, hedge=True) is pool.client("https://b")
+    await pool.call("solana", call)
+    assert pool.stats()["hedging"] == {"calls": 1, "sent": 1, "won": 1, "over_budget": 0}
+    await pool.close()
@@ -0,0 +1,158 @@
+"""
+Tests for the asynchronous job API
+
+Tests job submission, long-poll retrieval, expiry and the job table bound.
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from src.api.server import app
+from src.bridge.errors import BridgeError
+from src.bridge.jobs import JobTable, JobTableFull, COMPLETED, FAILED
+from src.utils.metrics import OK, STAGE_SECONDS
+from tests.payloads import PLAN_ITEM, RISK_ITEM, CURVE_ITEM
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client():
+    # Context manager keeps one event loop alive across requests, so
+    # background jobs keep running between submit and poll
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_job_roundtrip_matches_sync_endpoint(client):
+    """Test that a job's result equals the synchronous endpoint's response"""
+    for computation_type, item in [("plan", PLAN_ITEM), ("risk-score", RISK_ITEM), ("curve-eval", CURVE_ITEM)]:
+        submitted = client.post(f"/api/v1/arcium/jobs/{computation_type}", json=item)
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+
+        job = client.get(f"/api/v1/arcium/jobs/{job_id}", params={"wait": 5})
+        assert job.status_code == 200
+        assert job.json()["status"] == COMPLETED
+        assert job.json()["computation_type"] == computation_type
+        assert job.json()["result"] == client.post(f"/api/v1/arcium/{computation_type}", json=item).json()
+
+
+def test_job_records_only_computation_stages(client):
+    """Test that a job does not record validation or serialization against its finished submit request"""
+    STAGE_SECONDS.clear()
+    # Uncached input, so the job reaches the computation
+    item = {**CURVE_ITEM, "curve_metrics": {**CURVE_ITEM["curve_metrics"], "current_price": 4242}}
+    submitted = client.post("/api/v1/arcium/jobs/curve-eval", json=item)
+    job = client.get(f"/api/v1/arcium/jobs/{submitted.json()['job_id']}", params={"wait": 5})
+    assert job.json()["status"] == COMPLETED
+
+    assert STAGE_SECONDS.count(("curve-eval", "submission", OK)) == 1
+    assert STAGE_SECONDS.count(("curve-eval", "validation", OK)) == 0
+    assert STAGE_SECONDS.count(("curve-eval", "serialization", OK)) == 0
+
+
+def test_unknown_job_returns_404(client):
+    """Test that unknown job ids are rejected"""
+    assert client.get("/api/v1/arcium/jobs/does-not-exist").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_when_job_finishes():
+    """Test that waiting returns as soon as the job completes, not after the full wait"""
+    table = JobTable(max_jobs=10, ttl_sec=60)
+    release = asyncio.Event()
+
+    async def run():
+        await release.wait()
+        return "done"
+
+    job = table.submit("plan", run)
+    assert not await job.wait(0.01)
+
+    asyncio.get_running_loop().call_later(0.01, release.set)
+    assert await asyncio.wait_for(job.wait(10), timeout=1)
+    assert job.result == "done"
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error():
+    """Test that a failing computation marks the job failed"""
+    table = JobTable(max_jobs=10, ttl_sec=60)
+
+    async def run():
+        raise RuntimeError("computation failed")
+
+    job = table.submit("risk-score", run)
+    await job.wait(1)
+    assert job.status == FAILED
+    assert isinstance(job.error, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_marked_failed():
+    """Test that a job cancelled by a timed-out drain is finished as failed, not left running"""
+    table = JobTable(max_jobs=10, ttl_sec=60)
+
+    async def run():
+        await asyncio.Event().wait()
+
+    job = table.submit("plan", run)
+    await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(table.drain(), 0.01)
+
+    assert job.status == FAILED
+    assert isinstance(job.error, BridgeError)
+    assert await job.wait(0)
+    assert table.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_expire():
+    """Test that finished jobs are dropped after the TTL"""
+    clock = FakeClock()
+    table = JobTable(max_jobs=10, ttl_sec=30, clock=clock)
+
+    async def run():
+        return 1
+
+    job = table.submit("plan", run)
+    await job.wait(1)
+    clock.now = 29
+    assert table.get(job.job_id) is job
+    clock.now = 30
+    assert table.get(job.job_id) is None
+    assert table.stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_table_bound_evicts_finished_then_rejects():
+    """Test that a full table evicts finished jobs first and rejects when all are running"""
+    table = JobTable(max_jobs=2, ttl_sec=60)
+    release = asyncio.Event()
+
+    async def quick():
+        return 1
+
+    async def blocked():
+        await release.wait()
+
+    finished = table.submit("plan", quick)
+    await finished.wait(1)
+    table.submit("plan", blocked)
+    table.submit("plan", blocked)  # Evicts the finished job
+    assert table.get(finished.job_id) is None
+
+    with pytest.raises(JobTableFull):
+        table.submit("plan", blocked)
+
+    release.set()
+    await table.drain()
+    assert table.stats()["running"] == 0
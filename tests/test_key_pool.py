@@ -0,0 +1,89 @@
+"""
+Tests for the pre-generated ephemeral key pool
+"""
+
+import asyncio
+import pytest
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from src.bridge.encryption import InputEncryptor, SharedSecretCache, associated_data, public_key_bytes
+from src.bridge.key_pool import EphemeralKeyPool
+
+CLUSTER_KEY = X25519PrivateKey.generate()
+CLUSTER_PUBLIC = public_key_bytes(CLUSTER_KEY)
+
+
+async def wait_for_depth(pool: EphemeralKeyPool, depth: int):
+    for _ in range(200):
+        if pool.stats()["depth"] >= depth:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"pool did not reach depth {depth}: {pool.stats()}")
+
+
+@pytest.mark.asyncio
+async def test_pool_fills_to_high_water():
+    """Test that start() fills the pool in the background"""
+    pool = EphemeralKeyPool(CLUSTER_PUBLIC, low_water=4, high_water=16, refill_batch=5)
+
+    pool.start()
+    await wait_for_depth(pool, 16)
+
+    assert pool.stats()["depth"] == 16
+    assert pool.stats()["generated"] == 16
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_keys_are_single_use():
+    """Test that every key and nonce is handed out once"""
+    pool = EphemeralKeyPool(CLUSTER_PUBLIC, low_water=0, high_water=10)
+    pool.start()
+    await wait_for_depth(pool, 10)
+
+    keys = [pool.take() for _ in range(10)]
+
+    assert len({k.public_key for k in keys}) == 10
+    assert len({k.nonce for k in keys}) == 10
+    assert pool.stats()["depth"] == 0
+    assert pool.stats()["misses"] == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_empty_pool_generates_inline_and_refills():
+    """Test that a dry pool counts a miss, still returns a key, and refills below low water"""
+    pool = EphemeralKeyPool(CLUSTER_PUBLIC, low_water=4, high_water=8)
+
+    key = pool.take()
+
+    assert key.public_key != CLUSTER_PUBLIC
+    assert pool.stats()["misses"] == 1
+    await wait_for_depth(pool, 8)
+    await pool.close()
+    assert pool.stats()["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_encryptor_uses_one_ephemeral_key_per_payload():
+    """Test that pooled keys seal payloads the cluster can decrypt"""
+    pool = EphemeralKeyPool(CLUSTER_PUBLIC, low_water=0, high_water=32)
+    pool.start()
+    await wait_for_depth(pool, 32)
+    encryptor = InputEncryptor(key_pool=pool)
+    plaintexts = [f"payload-{i}".encode() for i in range(20)]
+    aad = associated_data("input", "plan")
+
+    sealed = await encryptor.encrypt_batch(CLUSTER_PUBLIC, plaintexts, aad)
+
+    cluster = SharedSecretCache(CLUSTER_KEY)
+    assert [cluster.get(s.public_key).decrypt(s.nonce, s.ciphertext, aad) for s in sealed] == plaintexts
+    assert len({s.public_key for s in sealed}) == 20
+    assert encryptor.stats()["key_pool"]["taken"] == 20
+    assert encryptor.stats()["secrets"]["derived"] == 0
+    await pool.close()
+
+
+def test_invalid_water_marks():
+    """Test that low water above high water is rejected"""
+    with pytest.raises(ValueError):
+        EphemeralKeyPool(CLUSTER_PUBLIC, low_water=10, high_water=5)
@@ -0,0 +1,91 @@
+"""
+Tests for queue-based logging
+"""
+
+import logging
+import queue
+import threading
+import time
+from io import StringIO
+from logging.handlers import QueueListener
+from src.utils.logger import BoundedQueueHandler, FORMAT, StructuredFormatter, fields
+
+
+class BlockedStream(StringIO):
+    """Stream whose writes wait until released, like a stalled stdout pipe"""
+
+    def __init__(self):
+        super().__init__()
+        self.released = threading.Event()
+
+    def write(self, text):
+        self.released.wait()
+        return super().write(text)
+
+
+def make_logger(handler: logging.Handler, name: str) -> logging.Logger:
+    logger = logging.getLogger(f"tests.logging.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def test_stalled_stream_does_not_block_caller():
+    """Test that a blocked writer drops overflow instead of stalling the caller, and reports the drops"""
+    stream = BlockedStream()
+    log_queue = queue.Queue(maxsize=10)
+    output = logging.StreamHandler(stream)
+    output.setFormatter(StructuredFormatter(FORMAT))
+    listener = QueueListener(log_queue, output)
+    listener.start()
+    handler = BoundedQueueHandler(log_queue)
+    logger = make_logger(handler, "stalled")
+
+    start = time.perf_counter()
+    for i in range(1000):
+        logger.info("request %d", i)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert handler.stats()["dropped"] > 900
+
+    stream.released.set()
+    time.sleep(0.05)
+    logger.info("after stall")
+    listener.stop()
+    assert "Log queue full: dropped" in stream.getvalue()
+    assert "after stall" in stream.getvalue()
+
+
+def test_formatting_is_deferred_and_fields_are_lazy():
+    """Test that messages and lazy fields are rendered by the formatter, not at the call site"""
+    log_queue = queue.Queue()
+    handler = BoundedQueueHandler(log_queue)
+    logger = make_logger(handler, "lazy")
+    calls = []
+
+    logger.info("computed %s", "plan", extra=fields(items=3, cost=lambda: calls.append(1) or 42))
+
+    record = log_queue.get_nowait()
+    assert record.msg == "computed %s"
+    assert calls == []
+    line = StructuredFormatter("%(message)s").format(record)
+    assert line == "computed plan items=3 cost=42"
+    assert calls == [1]
+
+
+def test_sampling_only_applies_to_marked_info_records():
+    """Test that sampling drops marked INFO records but keeps warnings and unmarked records"""
+    log_queue = queue.Queue()
+    handler = BoundedQueueHandler(log_queue, sample_rate=0.0)
+    logger = make_logger(handler, "sampled")
+
+    for _ in range(100):
+        logger.info("hot path", extra=fields(sampled=True))
+    logger.info("startup")
+    logger.warning("hot path warning", extra=fields(sampled=True))
+
+    messages = [log_queue.get_nowait().msg for _ in range(log_queue.qsize())]
+    assert messages == ["startup", "hot path warning"]
+    assert handler.stats()["sampled_out"] == 100
@@ -0,0 +1,61 @@
+"""
+Tests for per-stage latency histograms and the /metrics endpoint
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.utils.metrics import ERROR, OK, STAGE_SECONDS, Histogram, Stage
+from tests.payloads import RISK_ITEM
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test the Prometheus text format of a histogram"""
+    histogram = Histogram("test_seconds", "Test histogram", ("kind",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, ("a",))
+    histogram.observe(0.5, ("a",))
+    histogram.observe(5.0, ("a",))
+
+    assert histogram.render() == [
+        "# HELP test_seconds Test histogram",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{kind="a",le="0.1"} 1',
+        'test_seconds_bucket{kind="a",le="1.0"} 2',
+        'test_seconds_bucket{kind="a",le="+Inf"} 3',
+        'test_seconds_sum{kind="a"} 5.55',
+        'test_seconds_count{kind="a"} 3',
+    ]
+
+
+def test_stage_records_outcome():
+    """Test that a stage raising an exception is recorded with outcome error"""
+    STAGE_SECONDS.clear()
+
+    with Stage("plan", "submission"):
+        pass
+    with pytest.raises(ValueError):
+        with Stage("plan", "submission"):
+            raise ValueError("boom")
+
+    assert STAGE_SECONDS.count(("plan", "submission", OK)) == 1
+    assert STAGE_SECONDS.count(("plan", "submission", ERROR)) == 1
+
+
+def test_metrics_endpoint_exposes_request_stages():
+    """Test that a request records validation, submission and serialization stages"""
+    from src.api import routes
+    from src.api.server import app
+
+    if routes.bridge_client.cache is not None:
+        routes.bridge_client.cache.clear()
+    STAGE_SECONDS.clear()
+    with TestClient(app) as client:
+        assert client.post("/api/v1/arcium/risk-score", json=RISK_ITEM).status_code == 200
+        assert client.post("/api/v1/arcium/risk-score", json={}).status_code == 422
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    for stage in ("validation", "submission", "serialization"):
+        assert f'evalys_bridge_stage_seconds_count{{computation_type="risk-score",stage="{stage}",outcome="ok"}}' in body
+    assert 'evalys_bridge_stage_seconds_count{computation_type="unknown",stage="validation",outcome="error"} 1' in body
@@ -0,0 +1,151 @@
+"""
+Tests for intent replay prevention
+
+Tests the time-bucketed nonce store (bucket expiry, memory budget, Bloom
+pre-filter) and intent envelope ingestion through the API.
+"""
+
+import base64
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi.testclient import TestClient
+from src.bridge.errors import InvalidIntent, ReplayedIntent, ReplayStoreFull
+from src.bridge.intents import IntentIngestor
+from src.bridge.models import IntentEnvelopeV1
+from src.bridge.nonces import NonceStore, NonceStoreFull
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _envelope(nonce: str = "nonce-1", timestamp: datetime = NOW, **overrides) -> IntentEnvelopeV1:
+    fields = dict(
+        intent_type="risk_score",
+        encrypted_payload=base64.b64encode(b"ciphertext").decode(),
+        nonce=nonce,
+        timestamp=timestamp,
+    )
+    fields.update(overrides)
+    return IntentEnvelopeV1(**fields)
+
+
+def test_duplicate_nonce_is_rejected():
+    """Test that a nonce is accepted once per window"""
+    store = NonceStore(max_nonces=1000, clock=FakeClock())
+
+    assert store.add("a")
+    assert store.add("b")
+    assert not store.add("a")
+    assert "a" in store and "c" not in store
+    assert store.stats()["replays"] == 1
+
+
+def test_nonces_expire_by_whole_bucket():
+    """Test that nonces are kept for the retention window, then dropped with their bucket"""
+    clock = FakeClock()
+    store = NonceStore(retention_sec=100, buckets=10, max_nonces=1000, clock=clock)
+    store.add("old")
+
+    clock.now = 100.0
+    assert "old" in store
+    clock.now = 110.0
+    assert "old" not in store
+    assert store.stats()["buckets"] == 0
+
+
+def test_memory_budget_is_fixed():
+    """Test that a full bucket rejects new nonces instead of growing"""
+    clock = FakeClock()
+    store = NonceStore(retention_sec=100, buckets=10, max_nonces=100, clock=clock)
+    budget = store.memory_bytes
+
+    for i in range(10):
+        assert store.add(f"n{i}")
+    with pytest.raises(NonceStoreFull):
+        store.add("one-too-many")
+
+    # The next bucket has room again
+    clock.now = 10.0
+    assert store.add("one-too-many")
+    assert store.stats()["memory_bytes"] <= budget
+
+
+def test_bloom_prefilter_keeps_exact_answers():
+    """Test that the Bloom pre-filter skips tables for new nonces without false accepts"""
+    clock = FakeClock()
+    store = NonceStore(retention_sec=100, buckets=10, max_nonces=20_000, bloom_bits_per_nonce=10, clock=clock)
+
+    for i in range(2000):
+        assert store.add(f"n{i}")
+    assert all(not store.add(f"n{i}") for i in range(2000))
+    assert store.stats()["bloom_skips"] > 1900
+
+    # Nonces survive a Bloom generation rollover until their bucket expires
+    clock.now = 105.0
+    store.add("later")
+    assert "n0" in store and "later" in store
+    clock.now = 215.0
+    assert "later" not in store
+
+
+def test_ingest_accepts_fresh_envelope_once():
+    """Test that a valid envelope is acknowledged and its replay rejected"""
+    ingestor = IntentIngestor(max_nonces=1000, clock=lambda: NOW)
+
+    ack = ingestor.ingest(_envelope())
+    assert ack.nonce == "nonce-1" and ack.accepted_at == NOW
+
+    with pytest.raises(ReplayedIntent):
+        ingestor.ingest(_envelope())
+
+
+@pytest.mark.parametrize(
+    "envelope",
+    [
+        _envelope(timestamp=NOW - timedelta(minutes=10)),
+        _envelope(timestamp=NOW + timedelta(minutes=5)),
+        _envelope(intent_type="withdraw"),
+        _envelope(version="v2"),
+        _envelope(nonce=""),
+        _envelope(encrypted_payload="not base64!"),
+    ],
+)
+def test_ingest_rejects_invalid_envelopes(envelope):
+    """Test that stale, unknown or malformed envelopes are rejected without consuming nonces"""
+    ingestor = IntentIngestor(max_nonces=1000, clock=lambda: NOW)
+
+    with pytest.raises(InvalidIntent):
+        ingestor.ingest(envelope)
+    assert ingestor.stats()["nonces"] == 0
+
+
+def test_ingest_reports_full_store():
+    """Test that a full replay store surfaces as a retryable error"""
+    ingestor = IntentIngestor(buckets=1, max_nonces=1, clock=lambda: NOW)
+    ingestor.ingest(_envelope("a"))
+
+    with pytest.raises(ReplayStoreFull) as excinfo:
+        ingestor.ingest(_envelope("b"))
+    assert excinfo.value.retry_after >= 1
+
+
+def test_intents_endpoint_rejects_replay():
+    """Test the intent endpoint end to end"""
+    from src.api.server import app
+
+    body = _envelope(nonce="api-nonce", timestamp=datetime.now(timezone.utc)).model_dump(mode="json")
+    with TestClient(app) as client:
+        first = client.post("/api/v1/arcium/intents", json=body)
+        second = client.post("/api/v1/arcium/intents", json=body)
+
+    assert first.status_code == 202
+    assert first.json()["nonce"] == "api-nonce"
+    assert second.status_code == 409
+    assert second.json()["error"] == "replayed_intent"
@@ -0,0 +1,233 @@
+"""
+Tests for the retry and circuit breaker execution policy
+
+Tests the spec's retry rules (which errors retry, backoff bounds), the
+per-endpoint breaker state machine, and fail-fast behaviour through the
+RPC pool and API.
+"""
+
+import random
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from src.bridge.errors import (
+    CircuitOpen,
+    ComputationTimeout,
+    InvalidReceipt,
+    NetworkError,
+)
+from src.bridge.policy import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    ExecutionPolicy,
+    RetryPolicy,
+    classify,
+)
+from src.bridge.rpc_pool import RpcPool
+from src.config.settings import Settings
+from tests.payloads import RISK_ITEM
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Flaky:
+    """Coroutine function failing with the given errors, then succeeding"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def _policy(**kwargs) -> ExecutionPolicy:
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    policy = ExecutionPolicy(sleep=sleep, **kwargs)
+    policy.sleeps = sleeps
+    return policy
+
+
+def test_backoff_is_jittered_exponential_and_capped():
+    """Test that delays follow 1s, 2s, 4s, 8s, 10s with at most 50% jitter"""
+    retry = RetryPolicy(rng=random.Random(7))
+
+    for attempt, base in enumerate([1.0, 2.0, 4.0, 8.0, 10.0, 10.0]):
+        for _ in range(50):
+            delay = retry.backoff(attempt)
+            assert base / 2 <= delay <= base
+
+
+def test_classify_maps_transport_errors_to_network_error():
+    """Test that connection failures, including wrapped ones, become NetworkError"""
+    wrapped = RuntimeError("solana rpc failed")
+    wrapped.__cause__ = httpx.ConnectError("refused")
+
+    assert isinstance(classify(ConnectionError()), NetworkError)
+    assert isinstance(classify(TimeoutError()), NetworkError)
+    assert isinstance(classify(wrapped), NetworkError)
+    assert isinstance(classify(ValueError("bad input")), ValueError)
+
+
+@pytest.mark.asyncio
+async def test_retries_retryable_errors_up_to_limit():
+    """Test that timeouts are retried up to 3 times before surfacing"""
+    policy = _policy()
+    fn = Flaky(*[ComputationTimeout()] * 4)
+
+    with pytest.raises(ComputationTimeout):
+        await policy.run("mxe:plan", fn)
+
+    assert fn.calls == 4
+    assert len(policy.sleeps) == 3
+    assert policy.stats()["retries"] == {"mxe:plan": 3}
+    assert policy.stats()["retries_exhausted"] == {"mxe:plan": 1}
+
+
+@pytest.mark.asyncio
+async def test_recovers_after_transient_errors():
+    """Test that a call succeeding within the retry budget returns its result"""
+    policy = _policy()
+    fn = Flaky(ConnectionError(), ComputationTimeout())
+
+    assert await policy.run("rpc:solana", fn) == "ok"
+    assert fn.calls == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [InvalidReceipt(), ValueError("bad input"), CircuitOpen()])
+async def test_non_retryable_errors_are_not_retried(error):
+    """Test that receipt, validation and open-breaker errors fail immediately"""
+    policy = _policy()
+    fn = Flaky(error)
+
+    with pytest.raises(type(error)):
+        await policy.run("mxe:plan", fn)
+
+    assert fn.calls == 1
+    assert policy.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_consecutive_network_failures():
+    """Test that the breaker opens at the threshold and then fails fast"""
+    clock = FakeClock()
+    policy = _policy(breaker_factory=lambda: CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock))
+
+    for _ in range(3):
+        with pytest.raises(NetworkError):
+            await policy.guard("a", Flaky(ConnectionError()))
+
+    fn = Flaky()
+    with pytest.raises(CircuitOpen) as excinfo:
+        await policy.guard("a", fn)
+
+    assert fn.calls == 0
+    assert excinfo.value.to_response() == {
+        "error": "network_error",
+        "message": "Arcium service unavailable (circuit open)",
+        "retry_after": 30,
+    }
+    assert policy.stats()["breakers"]["a"]["state"] == OPEN
+
+
+@pytest.mark.asyncio
+async def test_breaker_half_open_trial_closes_or_reopens():
+    """Test that after the reset timeout one trial call decides the breaker state"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    policy = _policy(breaker_factory=lambda: breaker)
+
+    with pytest.raises(NetworkError):
+        await policy.guard("a", Flaky(ConnectionError()))
+    clock.now = 10.0
+
+    with pytest.raises(NetworkError):
+        await policy.guard("a", Flaky(ConnectionError()))
+    assert breaker.state == OPEN
+
+    clock.now = 20.0
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()  # Only one trial at a time
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_non_network_errors_do_not_trip_breaker():
+    """Test that request errors leave the breaker closed"""
+    policy = _policy(breaker_factory=lambda: CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(ValueError):
+        await policy.guard("a", Flaky(ValueError("bad input")))
+
+    assert policy.breaker("a").state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_rpc_pool_fails_fast_when_all_breakers_open():
+    """Test that the pool stops calling dead endpoints once their breakers open"""
+    settings = Settings(
+        solana_rpc_urls="https://a,https://b",
+        breaker_failure_threshold=2,
+        retry_max_retries=3,
+    )
+    pool = RpcPool(settings)
+    pool.policy.sleep = _policy().sleep
+    calls = []
+
+    async def call(client):
+        calls.append(client)
+        raise ConnectionError("unreachable")
+
+    with pytest.raises(CircuitOpen):
+        await pool.call("solana", call)
+
+    # Two failures per endpoint open both breakers; later attempts never reach the network
+    assert len(calls) == 4
+    breakers = pool.stats()["policy"]["breakers"]
+    assert {b["state"] for b in breakers.values()} == {OPEN}
+
+    calls.clear()
+    with pytest.raises(CircuitOpen):
+        await pool.call("solana", call)
+    assert calls == []
+    await pool.close()
+
+
+def test_api_returns_spec_error_body(monkeypatch):
+    """Test that bridge errors reach clients as the spec's error body"""
+    from src.api import routes
+    from src.api.server import app
+
+    async def unavailable(*args, **kwargs):
+        raise CircuitOpen(retry_after=12)
+
+    monkeypatch.setattr(routes.bridge_client, "get_risk_score", unavailable)
+    with TestClient(app) as client:
+        response = client.post("/api/v1/arcium/risk-score", json=RISK_ITEM)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "12"
+    assert response.json() == {
+        "error": "network_error",
+        "message": "Arcium service unavailable (circuit open)",
+        "retry_after": 12,
+    }
@@ -0,0 +1,77 @@
+"""
+Tests for the opt-in per-request profiling middleware
+"""
+
+import pstats
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.middleware import ProfilingMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_client(tmp_path, max_per_minute=6, clock=None):
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        return {"total": sum(range(1000))}
+
+    kwargs = {"clock": clock} if clock is not None else {}
+    app.add_middleware(ProfilingMiddleware, output_dir=str(tmp_path), max_per_minute=max_per_minute, **kwargs)
+    return TestClient(app)
+
+
+def test_requests_without_header_are_not_profiled(tmp_path):
+    """Test that the middleware passes through requests without the header"""
+    client = make_client(tmp_path)
+
+    response = client.get("/work")
+
+    assert response.json() == {"total": 499500}
+    assert "x-evalys-profile-id" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_profile_is_written(tmp_path):
+    """Test that X-Evalys-Profile: file keeps the response and writes a .prof file"""
+    client = make_client(tmp_path)
+
+    response = client.get("/work", headers={"X-Evalys-Profile": "file"})
+
+    assert response.json() == {"total": 499500}
+    profile_id = response.headers["x-evalys-profile-id"]
+    path = tmp_path / f"{profile_id}.prof"
+    assert path.exists()
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_inline_profile_replaces_body(tmp_path):
+    """Test that X-Evalys-Profile: inline returns a text report"""
+    client = make_client(tmp_path)
+
+    response = client.get("/work", headers={"X-Evalys-Profile": "inline"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "GET /work (response status 200)" in response.text
+    assert "cumulative" in response.text
+
+
+def test_profiles_are_rate_limited(tmp_path):
+    """Test that at most max_per_minute requests are profiled"""
+    clock = FakeClock()
+    client = make_client(tmp_path, max_per_minute=2, clock=clock)
+    headers = {"X-Evalys-Profile": "file"}
+
+    profiled = [("x-evalys-profile-id" in client.get("/work", headers=headers).headers) for _ in range(3)]
+    assert profiled == [True, True, False]
+
+    clock.now = 61.0
+    assert "x-evalys-profile-id" in client.get("/work", headers=headers).headers
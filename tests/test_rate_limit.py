@@ -0,0 +1,213 @@
+"""
+Tests for per-client rate limiting
+
+Tests the request and MXE cost token buckets (refill, burst, debt for
+large batches), the bounded client table, and the 429 responses and
+budget headers on the API.
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from src.api.server import app
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.errors import Overloaded, RateLimited
+from src.bridge.models import RiskScoreRequest
+from src.bridge.rate_limit import (
+    ANONYMOUS,
+    COST,
+    REQUESTS,
+    RateLimiter,
+    charged_keys,
+    current_client_id,
+    current_source_address,
+)
+from src.config.settings import Settings
+from tests.payloads import RISK_ITEM
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_limiter(clock, **overrides) -> RateLimiter:
+    config = dict(request_rate=2.0, request_burst=4.0, cost_rate=10.0, cost_burst=20.0, max_clients=100, clock=clock)
+    config.update(overrides)
+    return RateLimiter(**config)
+
+
+def test_request_bucket_allows_burst_then_refills():
+    """Test that a client gets its burst at once and then the refill rate"""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    remaining = [limiter.take("engine", REQUESTS, 1)[REQUESTS] for _ in range(4)]
+    assert remaining == [3.0, 2.0, 1.0, 0.0]
+    with pytest.raises(RateLimited) as exc_info:
+        limiter.take("engine", REQUESTS, 1)
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 1
+
+    clock.now = 0.5
+    assert limiter.take("engine", REQUESTS, 1)[REQUESTS] == 0.0
+    clock.now = 100.0
+    assert limiter.take("engine", REQUESTS, 1)[REQUESTS] == 3.0
+    assert limiter.stats()["limited"] == {REQUESTS: 1, COST: 0}
+
+
+def test_clients_have_separate_budgets():
+    """Test that one client using up its budget does not affect another"""
+    limiter = make_limiter(FakeClock())
+    for _ in range(4):
+        limiter.take("backtester", REQUESTS, 1)
+    with pytest.raises(RateLimited):
+        limiter.take("backtester", REQUESTS, 1)
+    assert limiter.take("privacy-engine", REQUESTS, 1)[REQUESTS] == 3.0
+
+
+def test_oversized_cost_runs_once_bucket_is_full():
+    """Test that a batch costing more than the burst runs from a full bucket and leaves it in debt"""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    assert limiter.take("engine", COST, 50)[COST] == 0.0
+    with pytest.raises(RateLimited) as exc_info:
+        limiter.take("engine", COST, 1)
+    # 30 tokens of debt plus 1 needed, at 10 per second
+    assert exc_info.value.retry_after == 4
+
+    clock.now = 5.0
+    assert limiter.take("engine", COST, 5)[COST] == pytest.approx(15.0)
+
+
+def test_credit_returns_tokens_up_to_burst():
+    """Test that a refund restores the charge without exceeding the burst"""
+    limiter = make_limiter(FakeClock())
+    limiter.take("engine", COST, 15)
+
+    assert limiter.credit("engine", COST, 15)[COST] == 20.0
+    assert limiter.credit("engine", COST, 15)[COST] == 20.0
+    assert limiter.credit("unknown", COST, 15) == {}
+    assert limiter.stats()["refunded"] == {REQUESTS: 0, COST: 2}
+
+
+@pytest.mark.asyncio
+async def test_admission_rejection_refunds_cost():
+    """Test that requests rejected as overloaded leave the cost bucket unchanged"""
+    client = ArciumBridgeClient(Settings(
+        arcium_backend="fake",
+        cache_enabled=False,
+        fake_mxe_submit_latency_ms=0,
+        fake_mxe_compute_latency_ms=20,
+        fake_mxe_latency_sigma=0,
+        admission_concurrency_risk_score=1,
+        admission_queue_risk_score=0,
+        rate_limit_enabled=True,
+        rate_limit_cost_per_sec=0.001,
+        rate_limit_cost_burst=100,
+        rate_limit_cost_risk_score=1,
+    ))
+    request = RiskScoreRequest(**RISK_ITEM)
+
+    results = await asyncio.gather(*(
+        client.get_risk_score(request.portfolio_context, request.performance_history, request.market_conditions)
+        for _ in range(5)
+    ), return_exceptions=True)
+
+    assert sum(isinstance(r, Overloaded) for r in results) == 4
+    limiter = client.rate_limiter
+    # Only the computation that was admitted is charged
+    assert limiter.remaining(limiter._clients[ANONYMOUS])[COST] == pytest.approx(99, abs=0.01)
+    assert limiter.stats()["refunded"][COST] == 4
+
+
+def test_charged_keys_include_source_address():
+    """Test that declared ids also draw a share from their address, and undeclared ones the address alone"""
+    assert charged_keys("engine", "10.0.0.7", 4.0, 2.0) == [("engine", 4.0), ("addr:10.0.0.7", 2.0)]
+    assert charged_keys(ANONYMOUS, "10.0.0.7", 4.0, 2.0) == [("addr:10.0.0.7", 4.0)]
+    assert charged_keys("engine", "10.0.0.7", 4.0, 0.0) == [("engine", 4.0)]
+    assert charged_keys("engine", None, 4.0, 2.0) == [("engine", 4.0)]
+
+
+@pytest.mark.asyncio
+async def test_rotating_client_ids_share_their_address_budget():
+    """Test that new ids from one address stop getting fresh budget after address_factor client budgets"""
+    client = ArciumBridgeClient(Settings(
+        rate_limit_enabled=True,
+        rate_limit_requests_per_sec=0.001,
+        rate_limit_request_burst=2,
+        rate_limit_address_factor=2,
+    ))
+    current_source_address.set("10.0.0.7")
+    for i in range(4):
+        current_client_id.set(f"rotating-{i}")
+        await client.charge_request()
+    current_client_id.set("rotating-4")
+    with pytest.raises(RateLimited):
+        await client.charge_request()
+    # The rejected id's own bucket was refunded
+    limiter = client.rate_limiter
+    assert limiter.remaining(limiter._clients["rotating-4"])[REQUESTS] == pytest.approx(2, abs=0.01)
+
+    # Another address has its own budget; undeclared callers from it are charged to it in full
+    current_source_address.set("10.0.0.8")
+    await client.charge_request()
+    current_client_id.set(ANONYMOUS)
+    await client.charge_request()
+    with pytest.raises(RateLimited):
+        await client.charge_request()
+
+
+def test_client_table_is_bounded():
+    """Test that the least recently seen clients are evicted beyond max_clients"""
+    limiter = make_limiter(FakeClock(), max_clients=3)
+    for i in range(5):
+        limiter.take(f"client-{i}", REQUESTS, 1)
+    limiter.take("client-2", REQUESTS, 1)
+    limiter.take("client-5", REQUESTS, 1)
+
+    stats = limiter.stats()
+    assert stats["clients"] == 3
+    assert stats["evicted"] == 3
+    assert "client-2" in limiter._clients and "client-3" not in limiter._clients
+
+
+def test_disabled_bucket_is_not_reported():
+    """Test that a rate of 0 turns a bucket off"""
+    limiter = make_limiter(FakeClock(), cost_rate=0.0)
+    for _ in range(100):
+        assert limiter.take("engine", COST, 1000) == {REQUESTS: 4.0}
+
+
+def test_api_budget_headers_and_429(monkeypatch):
+    """Test the budget headers, the spec error body on 429, and cost charged only for computations"""
+    from src.api import routes
+
+    limiter = make_limiter(FakeClock(), request_rate=1.0, request_burst=3.0, cost_rate=1.0, cost_burst=100.0)
+    monkeypatch.setattr(routes.bridge_client, "rate_limiter", limiter)
+    monkeypatch.setitem(routes.bridge_client.costs, "risk-score", 7.0)
+    headers = {"X-Evalys-Client-Id": "strategy-engine"}
+    uncached = {**RISK_ITEM, "market_conditions": {**RISK_ITEM["market_conditions"], "curve_volatility": 123}}
+
+    with TestClient(app) as client:
+        first = client.post("/api/v1/arcium/risk-score", json=uncached, headers=headers)
+        # Same input again: a cache hit takes a request token but no MXE cost
+        second = client.post("/api/v1/arcium/risk-score", json=uncached, headers=headers)
+        client.post("/api/v1/arcium/risk-score", json=uncached, headers=headers)
+        limited = client.post("/api/v1/arcium/risk-score", json=uncached, headers=headers)
+        other = client.post("/api/v1/arcium/risk-score", json=uncached, headers={"X-Evalys-Client-Id": "privacy-engine"})
+
+    assert first.status_code == 200
+    assert first.headers["x-evalys-ratelimit-requests-remaining"] == "2"
+    assert first.headers["x-evalys-ratelimit-cost-remaining"] == "93"
+    assert second.headers["x-evalys-ratelimit-requests-remaining"] == "1"
+    assert second.headers["x-evalys-ratelimit-cost-remaining"] == "93"
+    assert limited.status_code == 429
+    assert limited.json()["error"] == "rate_limited"
+    assert limited.headers["retry-after"] == str(limited.json()["retry_after"])
+    assert other.status_code == 200
+    assert other.headers["x-evalys-ratelimit-requests-remaining"] == "2"
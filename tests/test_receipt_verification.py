@@ -4,63 +4,143 @@ Tests for receipt verification
 Tests that receipts from Arcium are properly verified before trusting results.
 """
 
+import base64
 import pytest
-from datetime import datetime, timedelta
-from src.bridge.models import StrategyPlan, RiskAssessment, ExecutionRecommendation
+from datetime import datetime, timedelta, timezone
+from solders.keypair import Keypair
+from src.bridge.models import ProofReceiptV1, ReceiptResult
+from src.bridge.receipts import ReceiptVerifier, result_hash, signing_payload
 
+NODE_KEY = Keypair()
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
 
-def test_invalid_receipt_signature():
+
+def create_valid_receipt(
+    receipt_id: str = "test-123",
+    timestamp: datetime = NOW,
+    status: str = "completed",
+    output: bytes = b"encrypted-result",
+    key: Keypair = NODE_KEY,
+) -> ProofReceiptV1:
+    encrypted_output = base64.b64encode(output).decode()
+    receipt = ProofReceiptV1(
+        receipt_id=receipt_id,
+        computation_id="computation-1",
+        result_hash=result_hash(encrypted_output),
+        signature="",
+        timestamp=timestamp,
+        status=status,
+        result=ReceiptResult(encrypted_output=encrypted_output),
+    )
+    receipt.signature = str(key.sign_message(signing_payload(receipt)))
+    return receipt
+
+
+@pytest.fixture
+def verifier():
+    return ReceiptVerifier(str(NODE_KEY.pubkey()), clock=lambda: NOW)
+
+
+def test_invalid_receipt_signature(verifier):
     """
     Test that receipts with invalid signatures are rejected.
-    
+
     This test ensures the bridge service never trusts unverified receipts.
     """
-    # TODO: Implement when receipt verification is added
-    # receipt = ProofReceiptV1(
-    #     receipt_id="test-123",
-    #     signature="invalid_signature",
-    #     ...
-    # )
-    # assert verify_receipt(receipt) == False
-    pass
+    forged = create_valid_receipt(key=Keypair())
+    malformed = create_valid_receipt()
+    malformed.signature = "invalid_signature"
 
+    assert verifier.verify(forged) == False
+    assert verifier.verify(malformed) == False
+    assert verifier.stats()["rejected"] == {"bad_signature": 1, "malformed": 1}
 
-def test_valid_receipt_acceptance():
+
+def test_valid_receipt_acceptance(verifier):
     """
     Test that valid receipts are accepted.
-    
+
     Valid receipts must have:
     - Valid signature
     - Matching result hash
     - Recent timestamp
     - Completed status
     """
-    # TODO: Implement when receipt verification is added
-    # receipt = create_valid_receipt(...)
-    # assert verify_receipt(receipt) == True
-    pass
+    receipt = create_valid_receipt()
+    assert verifier.verify(receipt) == True
+
+    failed = create_valid_receipt(status="failed")
+    assert verifier.verify(failed) == False
 
 
-def test_receipt_timestamp_validation():
+def test_receipt_timestamp_validation(verifier):
     """
     Test that old receipts are rejected (replay attack prevention).
     """
-    # TODO: Implement when receipt verification is added
-    # old_timestamp = datetime.now() - timedelta(minutes=10)
-    # receipt = ProofReceiptV1(timestamp=old_timestamp, ...)
-    # assert verify_receipt(receipt) == False
-    pass
+    old_timestamp = NOW - timedelta(minutes=10)
+    receipt = create_valid_receipt(timestamp=old_timestamp)
+    assert verifier.verify(receipt) == False
 
+    future = create_valid_receipt(timestamp=NOW + timedelta(minutes=5))
+    assert verifier.verify(future) == False
 
-def test_receipt_result_hash_verification():
+
+def test_receipt_result_hash_verification(verifier):
     """
-    Test that result hash is verified against decrypted result.
+    Test that result hash is verified against the encrypted result.
     """
-    # TODO: Implement when receipt verification is added
-    # receipt = ProofReceiptV1(
-    #     result_hash="wrong_hash",
-    #     encrypted_result=encrypted_data
-    # )
-    # assert verify_receipt(receipt) == False
-    pass
+    receipt = create_valid_receipt()
+    receipt.result.encrypted_output = base64.b64encode(b"tampered-result").decode()
+    assert verifier.verify(receipt) == False
+    assert verifier.stats()["rejected"] == {"hash_mismatch": 1}
+
+
+def test_signature_covers_receipt_fields(verifier):
+    """Test that changing a signed field invalidates the signature"""
+    receipt = create_valid_receipt()
+    receipt.computation_id = "computation-2"
+    assert verifier.verify(receipt) == False
+
+
+def test_missing_node_key_rejects_everything():
+    """Test that receipts are never trusted without a configured node key"""
+    verifier = ReceiptVerifier(None, clock=lambda: NOW)
+    assert verifier.verify(create_valid_receipt()) == False
+
+
+@pytest.mark.asyncio
+async def test_batch_verification_preserves_order(verifier):
+    """Test that batch results line up with their receipts"""
+    receipts = [create_valid_receipt(receipt_id=f"r{i}") for i in range(10)]
+    receipts[3] = create_valid_receipt(receipt_id="r3", key=Keypair())
+    receipts[7] = create_valid_receipt(receipt_id="r7", status="failed")
+    verifier.chunk_size = 3
+
+    results = await verifier.verify_receipts(receipts)
+
+    assert results == [i not in (3, 7) for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_receipts_hit_verified_cache(verifier):
+    """Test that an already-verified receipt is not re-verified, but a tampered copy is"""
+    receipt = create_valid_receipt()
+    assert await verifier.verify_receipt(receipt)
+    assert await verifier.verify_receipts([receipt, receipt]) == [True, True]
+    assert verifier.stats()["cache_hits"] == 2
+
+    tampered = receipt.model_copy(deep=True)
+    tampered.result.encrypted_output = base64.b64encode(b"other").decode()
+    assert await verifier.verify_receipt(tampered) == False
+    assert verifier.stats()["cache_hits"] == 2
+
+
+def test_cached_receipt_still_expires():
+    """Test that freshness is re-checked for cached receipts"""
+    now = [NOW]
+    verifier = ReceiptVerifier(str(NODE_KEY.pubkey()), clock=lambda: now[0])
+    receipt = create_valid_receipt()
+    assert verifier.verify(receipt)
 
+    now[0] = NOW + timedelta(minutes=6)
+    assert verifier.verify(receipt) == False
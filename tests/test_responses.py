@@ -0,0 +1,53 @@
+"""
+Tests for the fast model response path
+"""
+
+import json
+from fastapi.testclient import TestClient
+from src.api.responses import ModelResponse
+from src.api.server import app
+from src.bridge.models import StrategyPlan
+from tests.payloads import PLAN_ITEM
+
+
+def test_model_response_matches_model_json():
+    """Test that ModelResponse renders the same JSON as the model itself"""
+    plan = StrategyPlan(
+        plan_id=None,
+        recommended_mode="normal",
+        num_slices=3,
+        slice_size_base=-1,
+        timing_window_sec=300,
+        risk_level=255,
+        max_notional=2**63,
+    )
+
+    response = ModelResponse(plan, status_code=202)
+
+    assert response.status_code == 202
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(response.body) == plan.model_dump()
+
+
+def test_openapi_keeps_response_models():
+    """Test that routes returning ModelResponse still document their response model"""
+    paths = app.openapi()["paths"]
+
+    for path, model, status in (
+        ("/api/v1/arcium/plan", "StrategyPlan", "200"),
+        ("/api/v1/arcium/risk-score", "RiskAssessment", "200"),
+        ("/api/v1/arcium/curve-eval", "ExecutionRecommendation", "200"),
+        ("/api/v1/arcium/plan:batch", "PlanBatchResponse", "200"),
+        ("/api/v1/arcium/jobs/plan", "JobInfo", "202"),
+    ):
+        schema = paths[path]["post"]["responses"][status]["content"]["application/json"]["schema"]
+        assert schema == {"$ref": f"#/components/schemas/{model}"}
+
+
+def test_job_submission_keeps_202():
+    """Test that explicit ModelResponse status codes match the route declarations"""
+    with TestClient(app) as client:
+        response = client.post("/api/v1/arcium/jobs/plan", json=PLAN_ITEM)
+
+    assert response.status_code == 202
+    assert response.json()["computation_type"] == "plan"
@@ -0,0 +1,157 @@
+"""
+Tests for multi-relay endpoint routing
+
+Uses a local harness of fake endpoints with configurable latency and
+failure behaviour to check selection, failover, ejection and re-probing.
+"""
+
+import asyncio
+import pytest
+from src.bridge.routing import EndpointRouter
+from src.bridge.rpc_pool import RpcPool
+from src.config.settings import Settings
+
+
+class FakeEndpoint:
+    """Fake RPC endpoint with configurable latency and failure mode"""
+
+    def __init__(self, url: str, latency: float, failing: bool = False):
+        self.url = url
+        self.latency = latency
+        self.failing = failing
+        self.calls = 0
+
+    async def handle(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.failing:
+            raise ConnectionError(f"{self.url} unreachable")
+        return self.url
+
+
+class FakeCluster:
+    """A set of fake endpoints addressable by URL"""
+
+    def __init__(self, *endpoints: FakeEndpoint):
+        self.endpoints = {e.url: e for e in endpoints}
+
+    async def __call__(self, url: str):
+        return await self.endpoints[url].handle()
+
+
+def _router(cluster: FakeCluster, **kwargs) -> EndpointRouter:
+    return EndpointRouter(list(cluster.endpoints), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_routes_to_fastest_endpoint():
+    """Test that traffic settles on the lowest-latency endpoint"""
+    cluster = FakeCluster(
+        FakeEndpoint("slow", 0.02),
+        FakeEndpoint("fast", 0.001),
+        FakeEndpoint("medium", 0.01),
+    )
+    router = _router(cluster)
+
+    for _ in range(30):
+        await router.call(cluster)
+
+    # Each endpoint is measured once, then the fast one takes the rest
+    assert cluster.endpoints["fast"].calls >= 27
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_endpoint_error():
+    """Test that a failed call is retried on the next endpoint"""
+    cluster = FakeCluster(FakeEndpoint("down", 0.0, failing=True), FakeEndpoint("up", 0.005))
+    router = _router(cluster)
+
+    results = [await router.call(cluster) for _ in range(5)]
+
+    assert results == ["up"] * 5
+
+
+@pytest.mark.asyncio
+async def test_all_endpoints_failing_raises_last_error():
+    """Test that the last error is raised when every endpoint fails"""
+    cluster = FakeCluster(FakeEndpoint("a", 0.0, failing=True), FakeEndpoint("b", 0.0, failing=True))
+
+    with pytest.raises(ConnectionError):
+        await _router(cluster).call(cluster)
+
+
+@pytest.mark.asyncio
+async def test_request_errors_do_not_fail_over():
+    """Test that errors classified as request errors are raised without failover"""
+    calls = []
+
+    async def reject(url):
+        calls.append(url)
+        raise ValueError("invalid input")
+
+    router = EndpointRouter(["a", "b"])
+    with pytest.raises(ValueError):
+        await router.call(reject, is_endpoint_failure=lambda e: not isinstance(e, ValueError))
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_ejects_and_reprobes_failing_endpoint():
+    """Test that an unhealthy endpoint is ejected, then reinstated after a good probe"""
+    now = [0.0]
+    flaky = FakeEndpoint("flaky", 0.0)
+    cluster = FakeCluster(flaky, FakeEndpoint("backup", 0.0))
+    router = EndpointRouter(["flaky", "backup"], min_samples=3, eject_sec=10, clock=lambda: now[0])
+    endpoint = router.endpoints[0]
+
+    flaky.failing = True
+    for _ in range(3):
+        router.record(endpoint, 0.0, ok=False)
+    assert endpoint.ejected_until == 10
+
+    await router.call(cluster)
+    assert flaky.calls == 0  # Ejected endpoint receives no traffic
+
+    now[0] = 10
+    flaky.failing = False
+    assert router.select() is endpoint  # Due for a probe
+    router.record(endpoint, 0.0, ok=True)
+    assert endpoint.ejected_until is None
+    assert router.stats()[0]["ejections"] == 1
+
+
+def test_failed_probe_reejects():
+    """Test that a failed probe ejects the endpoint for another period"""
+    now = [0.0]
+    router = EndpointRouter(["a", "b"], min_samples=1, eject_sec=5, clock=lambda: now[0])
+    endpoint = router.endpoints[0]
+    router.record(endpoint, 0.0, ok=False)
+
+    now[0] = 5
+    assert router.select() is endpoint
+    assert router.select() is not endpoint  # Only one probe at a time
+    router.record(endpoint, 0.0, ok=False)
+    assert endpoint.ejected_until == 10
+
+
+def test_settings_parse_endpoint_lists():
+    """Test that comma-separated endpoint lists override the single URL"""
+    settings = Settings(solana_rpc_url="https://single", solana_rpc_urls="https://a, https://b,")
+    assert settings.solana_rpc_endpoints == ["https://a", "https://b"]
+    assert Settings(arcium_rpc_url="https://single").arcium_rpc_endpoints == ["https://single"]
+
+
+@pytest.mark.asyncio
+async def test_rpc_pool_routes_calls_by_role():
+    """Test that RpcPool.call picks a client from the role's endpoint list"""
+    pool = RpcPool(Settings(arcium_rpc_urls="https://relay-a,https://relay-b"))
+    used = []
+
+    async def call(client):
+        used.append(client)
+        return "ok"
+
+    assert await pool.call("arcium", call) == "ok"
+    assert used[0] is pool.client("https://relay-a")
+    assert len(pool.stats()["routing"]["arcium"]) == 2
+    await pool.close()
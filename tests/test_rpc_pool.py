@@ -0,0 +1,125 @@
+"""
+Tests for the shared RPC connection pool
+
+Tests that RPC clients are shared across requests, warmed at startup and
+closed on shutdown.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from solana.rpc import async_api
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.models import RiskScoreRequest
+from src.bridge.rpc_pool import RpcPool
+from src.config.settings import Settings
+from tests.payloads import RISK_ITEM
+
+PROGRAM_ID = "11111111111111111111111111111111"
+
+
+class FakeAccountInfo:
+    value = object()
+
+
+class FakeAsyncClient:
+    """Stand-in for solana's AsyncClient that records calls"""
+
+    instances = []
+
+    def __init__(self, url, **kwargs):
+        self.url = url
+        self.kwargs = kwargs
+        self.account_lookups = []
+        self.closed = False
+        FakeAsyncClient.instances.append(self)
+
+    async def get_account_info(self, pubkey):
+        self.account_lookups.append(str(pubkey))
+        return FakeAccountInfo()
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_async_client(monkeypatch):
+    FakeAsyncClient.instances = []
+    monkeypatch.setattr(async_api, "AsyncClient", FakeAsyncClient)
+
+
+def test_one_client_per_endpoint_with_pool_limits():
+    """Test that clients are shared per URL and configured with pool limits"""
+    settings = Settings(
+        solana_rpc_url="https://solana.example",
+        arcium_rpc_url="https://solana.example",
+        rpc_max_keepalive_connections=7,
+    )
+    pool = RpcPool(settings)
+
+    assert pool.solana is pool.arcium
+    assert len(FakeAsyncClient.instances) == 1
+    assert FakeAsyncClient.instances[0].kwargs["max_keepalive_connections"] == 7
+
+
+@pytest.mark.asyncio
+async def test_start_warms_program_account_and_close_drains():
+    """Test that startup resolves the MXE program account and shutdown closes clients"""
+    client = ArciumBridgeClient(Settings(
+        arcium_mxe_program_id=PROGRAM_ID,
+        solana_rpc_url="https://solana.example",
+        arcium_rpc_url="https://arcium.example",
+    ))
+
+    await client.start()
+    arcium = client.rpc_pool.arcium
+    assert arcium.account_lookups == [PROGRAM_ID]
+    assert client.stats()["rpc_pool"]["endpoints"] == 2
+    assert client.stats()["rpc_pool"]["warmed"]
+
+    await client.close()
+    assert all(c.closed for c in FakeAsyncClient.instances)
+    assert client.stats()["rpc_pool"]["endpoints"] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_pooled_client():
+    """Test that repeated requests do not create new RPC clients"""
+    client = ArciumBridgeClient(Settings(cache_enabled=False))
+    await client.start()
+    created = len(FakeAsyncClient.instances)
+
+    request = RiskScoreRequest(**RISK_ITEM)
+    for _ in range(3):
+        await client.get_risk_score(request.portfolio_context, request.performance_history, request.market_conditions)
+
+    assert len(FakeAsyncClient.instances) == created
+    await client.close()
+
+
+def test_app_lifespan_opens_and_closes_pool(monkeypatch):
+    """Test that the FastAPI lifespan manages the bridge client's pool"""
+    from src.api.server import app
+    from src.api.routes import bridge_client
+
+    monkeypatch.setattr(bridge_client.settings, "arcium_mxe_program_id", PROGRAM_ID)
+    monkeypatch.setattr(bridge_client, "mxe_program_id", None)
+    monkeypatch.setattr(bridge_client, "solana_client", None)
+    with TestClient(app) as client:
+        assert client.get("/health").status_code == 200
+        assert bridge_client.stats()["rpc_pool"]["endpoints"] >= 1
+
+    assert bridge_client.stats()["rpc_pool"]["endpoints"] == 0
+    assert all(c.closed for c in FakeAsyncClient.instances)
+
+
+@pytest.mark.asyncio
+async def test_demo_mode_opens_no_rpc_clients():
+    """Test that without an MXE program ID startup and requests never create RPC clients"""
+    client = ArciumBridgeClient(Settings(cache_enabled=False))
+
+    await client.start()
+    request = RiskScoreRequest(**RISK_ITEM)
+    await client.get_risk_score(request.portfolio_context, request.performance_history, request.market_conditions)
+
+    assert FakeAsyncClient.instances == []
+    assert client.stats()["rpc_pool"]["endpoints"] == 0
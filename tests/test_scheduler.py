@@ -0,0 +1,124 @@
+"""
+Tests for the micro-batching scheduler
+
+Tests that concurrent requests are coalesced into one submission and that
+results are fanned back out to the right callers.
+"""
+
+import asyncio
+import pytest
+from src.bridge.errors import BridgeError
+from src.bridge.scheduler import MicroBatcher
+from src.bridge.arcium_client import ArciumBridgeClient
+from src.bridge.models import RiskScoreRequest
+from src.config.settings import Settings
+from tests.payloads import RISK_ITEM
+
+
+class RecordingHandler:
+    """Batch handler that records each batch and echoes items back doubled"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, computation_type, items):
+        self.batches.append((computation_type, list(items)))
+        return [ValueError("bad item") if item < 0 else item * 2 for item in items]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_coalesced():
+    """Test that requests arriving within the window share one batch"""
+    handler = RecordingHandler()
+    batcher = MicroBatcher(handler, window_ms=20, max_batch_size=100)
+
+    results = await asyncio.gather(*(batcher.submit("plan", i) for i in range(10)))
+
+    assert results == [i * 2 for i in range(10)]
+    assert handler.batches == [("plan", list(range(10)))]
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_type_and_size():
+    """Test that types are batched separately and full queues flush immediately"""
+    handler = RecordingHandler()
+    batcher = MicroBatcher(handler, window_ms=1000, max_batch_size=3)
+
+    results = await asyncio.gather(
+        *(batcher.submit("plan", i) for i in range(3)),
+        *(batcher.submit("risk-score", i) for i in range(3)),
+    )
+
+    assert results == [0, 2, 4, 0, 2, 4]
+    assert sorted(kind for kind, _ in handler.batches) == ["plan", "risk-score"]
+    stats = batcher.stats()
+    assert stats["batches"]["plan"]["max_batch_size"] == 3
+    assert stats["queue_depth"] == {}
+
+
+@pytest.mark.asyncio
+async def test_errors_delivered_per_caller():
+    """Test that a failing item only fails its own caller"""
+    batcher = MicroBatcher(RecordingHandler(), window_ms=5, max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.submit("plan", 1),
+        batcher.submit("plan", -1),
+        batcher.submit("plan", 2),
+        return_exceptions=True,
+    )
+
+    assert results[0] == 2
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 4
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_fails_whole_batch():
+    """Test that a handler exception is delivered to every caller in the batch"""
+    async def broken(computation_type, items):
+        raise ConnectionError("MXE unreachable")
+
+    batcher = MicroBatcher(broken, window_ms=5, max_batch_size=10)
+    results = await asyncio.gather(*(batcher.submit("plan", i) for i in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, ConnectionError) for r in results)
+    # Each caller gets its own instance, chained to the handler's exception
+    assert len({id(r) for r in results}) == 3
+    assert len({id(r.__cause__) for r in results}) == 1
+    assert str(results[0]) == "MXE unreachable"
+
+
+@pytest.mark.asyncio
+async def test_result_count_mismatch_fails_every_caller():
+    """Test that a handler returning too few results fails the batch instead of leaving callers waiting"""
+    async def short(computation_type, items):
+        return [item * 2 for item in items[:-1]]
+
+    batcher = MicroBatcher(short, window_ms=5, max_batch_size=10)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit("plan", i) for i in range(3)), return_exceptions=True), timeout=1.0
+    )
+
+    assert all(isinstance(r, BridgeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_client_batches_single_requests():
+    """Test that the bridge client routes single requests through the scheduler"""
+    client = ArciumBridgeClient(Settings(batching_enabled=True, batching_window_ms=10))
+    request = RiskScoreRequest(**RISK_ITEM)
+
+    results = await asyncio.gather(*(
+        client.get_risk_score(request.portfolio_context, request.performance_history, request.market_conditions)
+        for _ in range(5)
+    ))
+
+    assert len({r.model_dump_json() for r in results}) == 1
+    assert client.stats()["scheduler"]["batches"]["risk-score"] == {
+        "batches": 1,
+        "items": 5,
+        "max_batch_size": 5,
+        "last_batch_size": 5,
+        "mean_batch_size": 5.0,
+    }
@@ -0,0 +1,29 @@
+"""
+Tests for the settings schema
+"""
+
+from pathlib import Path
+from src.config.settings import Settings
+
+ENV_EXAMPLE = Path(__file__).parent.parent / ".env.example"
+
+
+def test_env_example_loads():
+    """Test that the shipped .env.example template parses against the settings schema"""
+    settings = Settings(_env_file=ENV_EXAMPLE)
+
+    assert settings.arcium_backend == "simulated"
+    assert settings.fake_mxe_seed is None
+
+
+def test_env_example_keys_are_settings():
+    """Test that every key in .env.example, set or commented out, names a setting"""
+    keys = set()
+    for line in ENV_EXAMPLE.read_text().splitlines():
+        line = line.lstrip("# ").strip()
+        name, sep, _ = line.partition("=")
+        if sep and name.isupper():
+            keys.add(name.lower())
+
+    assert "fake_mxe_seed" in keys
+    assert keys <= set(Settings.model_fields)
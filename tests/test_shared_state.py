@@ -0,0 +1,261 @@
+"""
+Tests for state shared between worker processes
+
+Tests the shared state server with several clients standing in for
+workers: cache entries, nonce replays and rate limit budgets are visible
+across clients, the cache fails open and the nonce store fails closed
+when the server is gone. Also tests that shutdown lets running jobs
+finish.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import pytest
+from src.bridge.errors import NetworkError, RateLimited
+from src.bridge.jobs import JobTable, COMPLETED
+from src.bridge.models import PlanRequest, StrategyPlan
+from src.bridge.nonces import NonceStore, NonceStoreFull
+from src.bridge.rate_limit import REQUESTS, RateLimiter
+from src.bridge.shared_state import (
+    SharedNonceStore,
+    SharedRateLimiter,
+    SharedResultCache,
+    SharedStateClient,
+    SharedStateServer,
+    SharedStateUnavailable,
+    _read_message,
+    _write_message,
+)
+from src.bridge.cache import ResultCache
+from tests.payloads import PLAN_ITEM
+
+TTLS = {"plan": 60.0}
+PLAN = StrategyPlan(
+    plan_id="mxe-simulated-1",
+    recommended_mode="stealth",
+    num_slices=5,
+    slice_size_base=200_000_000,
+    timing_window_sec=120,
+    risk_level=150,
+    max_notional=1_000_000_000,
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Short private directory: Unix socket paths are limited to ~100 bytes
+    state_dir = tempfile.mkdtemp(prefix="bridge-test-")
+    yield os.path.join(state_dir, "state.sock")
+    shutil.rmtree(state_dir, ignore_errors=True)
+
+
+async def _worker(path: str) -> SharedStateClient:
+    client = SharedStateClient(path)
+    await client.connect()
+    return client
+
+
+def _shared_cache(client: SharedStateClient) -> SharedResultCache:
+    cache = SharedResultCache(client, ttls=TTLS, max_bytes=1 << 20)
+    cache.use_secrets(client.hello["cache_hash_key"], client.hello["cache_encryption_key"])
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cached_result_is_shared_between_workers(socket_path):
+    """Test that a result stored by one worker is a hit for another, and only ciphertext is held centrally"""
+    server = SharedStateServer(socket_path, ResultCache(ttls=TTLS, max_bytes=1 << 20), NonceStore())
+    await server.start()
+    first, second = await _worker(socket_path), await _worker(socket_path)
+    try:
+        cache_a, cache_b = _shared_cache(first), _shared_cache(second)
+        request = PlanRequest(**PLAN_ITEM)
+        key = cache_a.key("plan", request)
+        assert key == cache_b.key("plan", request)
+
+        assert await cache_b.fetch("plan", key, StrategyPlan) is None
+        await cache_a.store("plan", key, PLAN)
+        assert await cache_b.fetch("plan", key, StrategyPlan) == PLAN
+
+        blob = server.cache.get_blob("plan", key)
+        assert blob is not None and PLAN.plan_id.encode() not in blob
+        assert cache_b.stats() == {"shared": True, "hits": 1, "misses": 1, "errors": 0}
+    finally:
+        await first.close()
+        await second.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_to_another_worker_is_rejected(socket_path):
+    """Test that a nonce accepted by one worker is a replay for every other"""
+    server = SharedStateServer(socket_path, None, NonceStore(retention_sec=60, buckets=6))
+    await server.start()
+    first, second = await _worker(socket_path), await _worker(socket_path)
+    try:
+        nonces_a, nonces_b = SharedNonceStore(first), SharedNonceStore(second)
+        assert nonces_b.bucket_sec == 10
+        results = await asyncio.gather(nonces_a.add_async("nonce-1"), nonces_b.add_async("nonce-1"))
+        assert sorted(results) == [False, True]
+        assert await nonces_a.add_async("nonce-2") is True
+    finally:
+        await first.close()
+        await second.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_full_shared_nonce_store_is_reported(socket_path):
+    """Test that a full store on the server surfaces as NonceStoreFull in the worker"""
+    server = SharedStateServer(socket_path, None, NonceStore(retention_sec=10, buckets=1, max_nonces=4))
+    await server.start()
+    worker = await _worker(socket_path)
+    try:
+        nonces = SharedNonceStore(worker)
+        with pytest.raises(NonceStoreFull):
+            for i in range(100):
+                await nonces.add_async(f"nonce-{i}")
+    finally:
+        await worker.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_budget_is_shared_between_workers(socket_path):
+    """Test that a client's requests through any worker draw from one budget"""
+    limiter = RateLimiter(request_rate=0.001, request_burst=3, cost_rate=0, cost_burst=0, max_clients=10)
+    server = SharedStateServer(socket_path, None, NonceStore(), limiter)
+    await server.start()
+    first, second = await _worker(socket_path), await _worker(socket_path)
+    try:
+        limits_a, limits_b = SharedRateLimiter(first), SharedRateLimiter(second)
+        assert (await limits_a.take_async("engine", REQUESTS, 1))[REQUESTS] == pytest.approx(2, abs=0.01)
+        assert (await limits_b.take_async("engine", REQUESTS, 1))[REQUESTS] == pytest.approx(1, abs=0.01)
+        await limits_a.take_async("engine", REQUESTS, 1)
+        with pytest.raises(RateLimited) as exc_info:
+            await limits_b.take_async("engine", REQUESTS, 1)
+        assert exc_info.value.retry_after >= 1
+        assert server.stats()["rate_limit"]["limited"][REQUESTS] == 1
+
+        # A refund through one worker is visible to the other
+        await limits_b.credit_async("engine", REQUESTS, 1)
+        assert (await limits_a.take_async("engine", REQUESTS, 1))[REQUESTS] == pytest.approx(0, abs=0.01)
+    finally:
+        await first.close()
+        await second.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_lost_server_fails_cache_open_and_nonces_closed(socket_path):
+    """Test that without the server, lookups miss, rate limits allow and intents are rejected as retryable"""
+    server = SharedStateServer(socket_path, ResultCache(ttls=TTLS, max_bytes=1 << 20), NonceStore())
+    await server.start()
+    worker = await _worker(socket_path)
+    cache, nonces, limits = _shared_cache(worker), SharedNonceStore(worker), SharedRateLimiter(worker)
+    key = cache.key("plan", PlanRequest(**PLAN_ITEM))
+    await server.close()
+    await worker.close()
+
+    assert await limits.take_async("engine", REQUESTS, 1) == {}
+    assert limits.stats()["errors"] == 1
+
+    assert await cache.fetch("plan", key, StrategyPlan) is None
+    await cache.store("plan", key, PLAN)
+    assert cache.stats()["errors"] == 2
+    with pytest.raises(NetworkError):
+        await nonces.add_async("nonce-1")
+
+    with pytest.raises(SharedStateUnavailable):
+        await SharedStateClient(socket_path).connect()
+
+
+@pytest.mark.asyncio
+async def test_client_reconnects_after_server_restart(socket_path):
+    """Test that a live client backs off while the server is down and reconnects once it is back"""
+    server = SharedStateServer(socket_path, ResultCache(ttls=TTLS, max_bytes=1 << 20), NonceStore())
+    await server.start()
+    worker = SharedStateClient(socket_path, timeout_sec=1.0, max_backoff_sec=0.05)
+    await worker.connect()
+    cache, nonces = _shared_cache(worker), SharedNonceStore(worker)
+    worker.on_connect(lambda hello: cache.use_secrets(hello["cache_hash_key"], hello["cache_encryption_key"]))
+    assert await nonces.add_async("nonce-1")
+
+    await server.close()
+    with pytest.raises(NetworkError):
+        await nonces.add_async("nonce-2")
+    assert not worker.connected
+
+    restarted = SharedStateServer(socket_path, ResultCache(ttls=TTLS, max_bytes=1 << 20), NonceStore())
+    await restarted.start()
+    try:
+        await asyncio.sleep(0.06)  # Past the reconnect backoff
+        assert await nonces.add_async("nonce-2")
+        # The restarted server's secrets were picked up, so the shared cache works again
+        key = cache.key("plan", PlanRequest(**PLAN_ITEM))
+        await cache.store("plan", key, PLAN)
+        assert await cache.fetch("plan", key, StrategyPlan) == PLAN
+        assert worker.stats() == {"connected": True, "reconnects": 1, "timeouts": 0}
+    finally:
+        await worker.close()
+        await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_stalled_server_times_out(socket_path):
+    """Test that a server that stops answering fails calls after timeout_sec instead of hanging them"""
+    hello = {"cache_hash_key": "", "cache_encryption_key": "", "cache_enabled": False, "nonce_bucket_sec": 30.0}
+
+    async def answer_hello_only(reader, writer):
+        request = await _read_message(reader)
+        _write_message(writer, {"id": request["id"], "ok": hello})
+        await reader.read()  # Never answers again
+
+    server = await asyncio.start_unix_server(answer_hello_only, path=socket_path)
+    worker = SharedStateClient(socket_path, timeout_sec=0.05)
+    try:
+        await worker.connect()
+        with pytest.raises(NetworkError):
+            await asyncio.wait_for(SharedNonceStore(worker).add_async("nonce-1"), timeout=1.0)
+        assert worker.stats()["timeouts"] == 1
+        assert not worker.connected
+    finally:
+        await worker.close()
+        server.close()
+
+
+def test_server_runs_in_its_own_thread(socket_path):
+    """Test the launcher's mode: server on a background loop, workers on their own loops"""
+    server = SharedStateServer(socket_path, None, NonceStore())
+    server.start_in_thread()
+    try:
+        assert oct(os.stat(socket_path).st_mode & 0o777) == oct(0o600)
+
+        async def add(nonce):
+            worker = await _worker(socket_path)
+            try:
+                return await SharedNonceStore(worker).add_async(nonce)
+            finally:
+                await worker.close()
+
+        assert asyncio.run(add("nonce-1")) is True
+        assert asyncio.run(add("nonce-1")) is False
+        assert server.stats()["nonces"]["replays"] == 1
+    finally:
+        server.stop_thread()
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_running_jobs():
+    """Test that shutdown's drain lets a running job complete"""
+    table = JobTable(max_jobs=10, ttl_sec=60)
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return PLAN
+
+    job = table.submit("plan", slow)
+    await asyncio.wait_for(table.drain(), timeout=1.0)
+    assert table.get(job.job_id).status == COMPLETED